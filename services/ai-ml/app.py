@@ -13,6 +13,12 @@ from app.api.routes.ai_routes import router as ai_router
 from app.services.cache import cache_service
 from app.services.events import event_publisher
 from app.services.storage import model_storage
+from app.core.model_manager import model_manager
+from app.core.inference import inference_executor
+from app.core.metrics import MetricsMiddleware, service_metrics
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.tracing import TracingMiddleware
+from app.core.startup import engine_startup
 
 # Import engines
 from app.engines.translation import translation_engine
@@ -41,19 +47,17 @@ async def lifespan(app: FastAPI):
         if settings.is_production:
             raise
 
-    # Initialize AI engines
-    try:
-        logger.info("Initializing AI engines...")
-        await translation_engine.initialize()
-        await nlp_engine.initialize()
-        await cv_engine.initialize()
-        await prediction_engine.initialize()
-        await recommendation_engine.initialize()
-        await speech_engine.initialize()
-        logger.info("✅ All AI engines initialized")
-    except Exception as e:
-        logger.error(f"Failed to initialize AI engines: {e}")
-        # Continue with available engines
+    service_metrics.start()
+
+    # Initialize AI engines (eager ones concurrently, see app.core.startup)
+    logger.info("Initializing AI engines...")
+    engine_startup.register("translation", translation_engine)
+    engine_startup.register("nlp", nlp_engine)
+    engine_startup.register("vision", cv_engine)
+    engine_startup.register("prediction", prediction_engine)
+    engine_startup.register("recommendation", recommendation_engine)
+    engine_startup.register("speech", speech_engine)
+    await engine_startup.start()
 
     logger.info("🤖 AI/ML Service ready!")
     logger.info("🧠 Privacy-preserving AI - Translation, predictions, recommendations!")
@@ -64,9 +68,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down AI/ML Service...")
     try:
+        await engine_startup.shutdown()
         await cache_service.disconnect()
         await event_publisher.disconnect()
         model_storage.disconnect()
+        model_manager.shutdown()
+        inference_executor.shutdown()
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
 
@@ -81,6 +88,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Rate limiting runs inside CORS so 429 responses stay readable by browsers
+app.add_middleware(RateLimitMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -90,6 +100,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.enable_metrics:
+    app.add_middleware(MetricsMiddleware)
+
+# Outermost: request IDs and Server-Timing cover the whole request
+app.add_middleware(TracingMiddleware)
+
 # Include routers
 app.include_router(ai_router, tags=["AI/ML"])
 
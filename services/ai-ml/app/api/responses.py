@@ -0,0 +1,70 @@
+"""Fast JSON rendering for API responses."""
+
+import json
+from typing import Any, Dict, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from app.core.tracing import span
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize plain JSON-compatible content (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (stdlib json as a fallback)."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content to bytes."""
+        return dumps(content)
+
+
+def api_response(
+    data: BaseModel,
+    message: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    status_code: int = 200
+) -> Response:
+    """
+    Build the standard {success, message, data, metadata} response.
+
+    data is serialized once, straight to JSON bytes by pydantic-core, and
+    spliced into the envelope; returning a Response also skips FastAPI's
+    jsonable_encoder pass over the payload.
+
+    Args:
+        data: Engine result model
+        message: Human-readable message
+        metadata: Optional extra fields (plain JSON types)
+        status_code: HTTP status code
+
+    Returns:
+        Response with the rendered body
+    """
+    with span("serialize"):
+        parts = [
+            b'{"success":true,"message":',
+            dumps(message),
+            b',"data":',
+            data.model_dump_json().encode("utf-8"),
+        ]
+        if metadata is not None:
+            parts.append(b',"metadata":')
+            parts.append(dumps(metadata))
+        parts.append(b"}")
+
+        return Response(
+            content=b"".join(parts),
+            status_code=status_code,
+            media_type="application/json"
+        )
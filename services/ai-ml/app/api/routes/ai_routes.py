@@ -2,35 +2,101 @@
 
 from datetime import datetime
 from typing import List
-from fastapi import APIRouter, File, UploadFile, HTTPException, Form
+from fastapi import APIRouter, File, UploadFile, HTTPException, Form, Request
+from fastapi.responses import JSONResponse
 
 from app.models.schemas import *
+from app.api.responses import FastJSONResponse, api_response
 from app.engines.translation import translation_engine
 from app.engines.nlp import nlp_engine
 from app.engines.vision import cv_engine
 from app.engines.prediction import prediction_engine
 from app.engines.recommendation import recommendation_engine
 from app.engines.speech import speech_engine
+from app.core.config import settings
+from app.core.inference import InferenceTimeoutError
+from app.core.model_manager import model_manager
+from app.core.rate_limit import rate_limiter
+from app.core.startup import engine_startup
+from app.core.tracing import TracedRoute
+from app.services.cache import cache_service
+from app.services.events import event_publisher
+from app.services.storage import model_storage
 from app.utils.logger import logger
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute, default_response_class=FastJSONResponse)
 
 
 # ============================================================================
 # Health & Info Endpoints
 # ============================================================================
 
+def _readiness() -> dict:
+    """Collect engine, model and dependency state for the health endpoints."""
+    engines = engine_startup.get_status()
+    services = {
+        "cache": cache_service.is_connected,
+        "events": event_publisher.is_connected,
+        "storage": model_storage.is_connected,
+    }
+
+    ready = engine_startup.is_ready and all(
+        services.get(name, False) for name in settings.readiness_required_services
+    )
+    degraded = not all(services.values()) or any(
+        engine["state"] == "failed" for engine in engines.values()
+    )
+
+    if not ready:
+        status = "starting" if not engine_startup.is_ready else "unavailable"
+    else:
+        status = "degraded" if degraded else "ready"
+
+    return {
+        "ready": ready,
+        "status": status,
+        "engines": engines,
+        "services": services,
+        "models_loaded": sorted(model_manager.get_loaded_models()),
+        "load_progress": model_manager.get_load_progress(),
+        "startup_ms": engine_startup.startup_ms,
+    }
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
+    readiness = _readiness()
     return {
-        "status": "healthy",
+        "status": "healthy" if readiness["ready"] else readiness["status"],
         "service": "ai-ml-service",
-        "models_loaded": ["translation", "nlp", "vision", "prediction", "recommendation", "speech"],
+        "models_loaded": [
+            name for name, engine in readiness["engines"].items() if engine["initialized"]
+        ],
         "timestamp": datetime.now().isoformat()
     }
 
 
+@router.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is serving requests. Never touches models."""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe.
+
+    Returns 503 until startup finished and every eager and background engine
+    initialized (and any READINESS_REQUIRED_SERVICES are connected), so load
+    balancers keep traffic away from pods that are still loading models.
+    """
+    readiness = _readiness()
+    readiness["timestamp"] = datetime.now().isoformat()
+    return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+
+
 @router.get("/api/v1/ai/models")
 async def get_models():
     """Get information about available models."""
@@ -93,20 +159,54 @@ async def translate(request: TranslationRequest):
     """Translate text between languages."""
     try:
         result = await translation_engine.translate(request)
-        return {
-            "success": True,
-            "message": "Translation complete",
-            "data": result.model_dump(),
-            "metadata": {
+        return api_response(
+            result,
+            "Translation complete",
+            metadata={
                 "cached": result.cached,
                 "character_count": len(request.text)
             }
-        }
+        )
+    except InferenceTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Translation endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Work scales with texts x languages, so the cost is charged here, not by path
+rate_limiter.charged_by_endpoint("/api/v1/ai/translate/batch")
+
+
+@router.post("/api/v1/ai/translate/batch")
+async def translate_batch(request: BatchTranslationRequest, http_request: Request):
+    """Translate many texts into one or more languages."""
+    unit_cost = settings.rate_limit_translation_cost
+    await rate_limiter.charge(
+        http_request.scope,
+        len(request.texts) * len(request.target_langs) * unit_cost,
+        f"{len(request.texts)} texts x {len(request.target_langs)} target languages "
+        f"x {unit_cost} per translation"
+    )
+
+    try:
+        result = await translation_engine.translate_batch(request)
+        return api_response(
+            result,
+            "Batch translation complete",
+            metadata={
+                "total": result.total,
+                "cached_count": result.cached_count,
+                "character_count": sum(len(text) for text in request.texts)
+            }
+        )
+    except InferenceTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"Batch translation endpoint error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # NLP Endpoints
 # ============================================================================
@@ -116,11 +216,9 @@ async def analyze_sentiment(text: str):
     """Analyze sentiment of text."""
     try:
         result = await nlp_engine.analyze_sentiment(text)
-        return {
-            "success": True,
-            "message": "Sentiment analysis complete",
-            "data": result.model_dump()
-        }
+        return api_response(result, "Sentiment analysis complete")
+    except InferenceTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Sentiment analysis endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -131,11 +229,9 @@ async def extract_entities(text: str):
     """Extract named entities from text."""
     try:
         result = await nlp_engine.extract_entities(text)
-        return {
-            "success": True,
-            "message": "Entity extraction complete",
-            "data": result.model_dump()
-        }
+        return api_response(result, "Entity extraction complete")
+    except InferenceTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Entity extraction endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -146,11 +242,7 @@ async def moderate_content(content: str):
     """Moderate content for safety."""
     try:
         result = await nlp_engine.moderate_content(content)
-        return {
-            "success": True,
-            "message": "Content moderation analysis",
-            "data": result.model_dump()
-        }
+        return api_response(result, "Content moderation analysis")
     except Exception as e:
         logger.error(f"Content moderation endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -161,11 +253,9 @@ async def generate_text(prompt: str, max_tokens: int = 200):
     """Generate text from prompt."""
     try:
         result = await nlp_engine.generate_text(prompt, max_tokens)
-        return {
-            "success": True,
-            "message": "Text generation complete",
-            "data": result.model_dump()
-        }
+        return api_response(result, "Text generation complete")
+    except InferenceTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Text generation endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -176,11 +266,7 @@ async def analyze_skill_gap(current_skills: List[str], target_role: str):
     """Analyze skill gap for career development."""
     try:
         result = await nlp_engine.analyze_skill_gap(current_skills, target_role)
-        return {
-            "success": True,
-            "message": "Skill gap analysis complete",
-            "data": result.model_dump()
-        }
+        return api_response(result, "Skill gap analysis complete")
     except Exception as e:
         logger.error(f"Skill gap analysis endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -195,11 +281,7 @@ async def perform_ocr(file: UploadFile = File(...)):
     """Extract text from images (OCR)."""
     try:
         result = await cv_engine.perform_ocr(file)
-        return {
-            "success": True,
-            "message": "OCR processing complete",
-            "data": result.model_dump()
-        }
+        return api_response(result, "OCR processing complete")
     except Exception as e:
         logger.error(f"OCR endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -213,11 +295,7 @@ async def analyze_image(
     """Analyze image content."""
     try:
         result = await cv_engine.analyze_image(file, analysis_type)
-        return {
-            "success": True,
-            "message": f"Image analysis complete ({analysis_type})",
-            "data": result.model_dump()
-        }
+        return api_response(result, f"Image analysis complete ({analysis_type})")
     except Exception as e:
         logger.error(f"Image analysis endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -232,11 +310,7 @@ async def predict(request: PredictionRequest):
     """Make predictions using ML models."""
     try:
         result = await prediction_engine.predict(request)
-        return {
-            "success": True,
-            "message": f"Prediction from {request.model_type} model",
-            "data": result.model_dump()
-        }
+        return api_response(result, f"Prediction from {request.model_type} model")
     except Exception as e:
         logger.error(f"Prediction endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -251,11 +325,7 @@ async def recommend(request: RecommendationRequest):
     """Get personalized recommendations."""
     try:
         result = await recommendation_engine.recommend(request)
-        return {
-            "success": True,
-            "message": f"AI-powered recommendations for {request.context}",
-            "data": result.model_dump()
-        }
+        return api_response(result, f"AI-powered recommendations for {request.context}")
     except Exception as e:
         logger.error(f"Recommendation endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -273,11 +343,9 @@ async def speech_to_text(
     """Transcribe speech to text."""
     try:
         result = await speech_engine.transcribe(audio, language)
-        return {
-            "success": True,
-            "message": "Speech transcription complete",
-            "data": result.model_dump()
-        }
+        return api_response(result, "Speech transcription complete")
+    except InferenceTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Speech-to-text endpoint error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
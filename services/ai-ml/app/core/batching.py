@@ -0,0 +1,193 @@
+"""Dynamic micro-batching scheduler for model inference."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.inference import inference_executor
+from app.core.metrics import BATCH_SIZE_BUCKETS, service_metrics
+from app.core.tracing import detach, traced
+from app.utils.logger import logger
+
+
+# Batch function: receives the collected inputs, returns one result per input
+BatchFn = Callable[[List[Any]], Sequence[Any]]
+
+# Upper bounds of the batch size / queue depth histogram buckets
+HISTOGRAM_BUCKETS = BATCH_SIZE_BUCKETS
+
+
+@dataclass
+class _PendingItem:
+    """Input waiting to be batched."""
+    item: Any
+    future: asyncio.Future
+    enqueued_at: float
+
+
+@dataclass
+class _BatchQueue:
+    """Pending inputs for one batch key."""
+    batch_fn: BatchFn
+    items: List[_PendingItem] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+def _empty_histogram() -> Dict[str, int]:
+    """Create an empty bucketed histogram."""
+    histogram = {str(bound): 0 for bound in HISTOGRAM_BUCKETS}
+    histogram["+Inf"] = 0
+    return histogram
+
+
+def _observe(histogram: Dict[str, int], value: int) -> None:
+    """Record a value in the first bucket whose bound is >= value."""
+    for bound in HISTOGRAM_BUCKETS:
+        if value <= bound:
+            histogram[str(bound)] += 1
+            return
+    histogram["+Inf"] += 1
+
+
+class BatchScheduler:
+    """
+    Collect concurrent inference requests per key into batched forward passes.
+
+    Requests sharing a key must be answerable by the same batch function
+    (same model and generation arguments). A batch is dispatched as soon as it
+    reaches max_batch_size or max_wait_ms after its first input arrived.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[int] = None
+    ):
+        """Initialize batch scheduler."""
+        self.max_batch_size = max_batch_size or settings.batch_size
+        self.max_wait_ms = max_wait_ms if max_wait_ms is not None else settings.batch_max_wait_ms
+        self._queues: Dict[str, _BatchQueue] = {}
+        self._tasks: set = set()
+
+        self.batch_size_histogram = _empty_histogram()
+        self.queue_depth_histogram = _empty_histogram()
+        self.stats: Dict[str, float] = {
+            "batches": 0,
+            "items": 0,
+            "failed_batches": 0,
+            "queue_wait_ms_total": 0.0,
+        }
+
+    @traced("inference")
+    async def submit(self, key: str, item: Any, batch_fn: BatchFn) -> Any:
+        """
+        Queue an input for batched inference and wait for its result.
+
+        Args:
+            key: Batch key; inputs with the same key are batched together
+            item: Single model input
+            batch_fn: Blocking function mapping a list of inputs to results
+
+        Returns:
+            Result for this input
+        """
+        loop = asyncio.get_running_loop()
+
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = _BatchQueue(batch_fn=batch_fn)
+        queue.batch_fn = batch_fn
+
+        future = loop.create_future()
+        queue.items.append(_PendingItem(item=item, future=future, enqueued_at=time.time()))
+        _observe(self.queue_depth_histogram, len(queue.items))
+
+        if len(queue.items) >= self.max_batch_size:
+            self._flush(key)
+        elif queue.timer is None:
+            queue.timer = loop.call_later(self.max_wait_ms / 1000, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: str) -> None:
+        """Dispatch up to max_batch_size pending inputs for key."""
+        queue = self._queues.get(key)
+        if queue is None:
+            return
+
+        if queue.timer is not None:
+            queue.timer.cancel()
+            queue.timer = None
+
+        batch = [p for p in queue.items[:self.max_batch_size] if not p.future.done()]
+        queue.items = queue.items[self.max_batch_size:]
+
+        # Leftovers start a new batch window (or dispatch immediately if full)
+        if queue.items:
+            loop = asyncio.get_running_loop()
+            delay = 0 if len(queue.items) >= self.max_batch_size else self.max_wait_ms / 1000
+            queue.timer = loop.call_later(delay, self._flush, key)
+
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run_batch(key, queue.batch_fn, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        key: str,
+        batch_fn: BatchFn,
+        batch: List[_PendingItem]
+    ) -> None:
+        """Run one batched forward pass and fan results back to callers."""
+        # Shared by the batch's callers; each one times its own wait in submit()
+        detach()
+
+        now = time.time()
+        engine = key.split(":", 1)[0]
+        queue_waits = [now - p.enqueued_at for p in batch]
+        self.stats["batches"] += 1
+        self.stats["items"] += len(batch)
+        self.stats["queue_wait_ms_total"] += sum(queue_waits) * 1000
+        _observe(self.batch_size_histogram, len(batch))
+        service_metrics.observe_batch(engine, queue_waits)
+
+        try:
+            results = await inference_executor.run(
+                batch_fn,
+                [p.item for p in batch],
+                label=engine
+            )
+            results = list(results)
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results for {len(batch)} inputs"
+                )
+        except Exception as e:
+            self.stats["failed_batches"] += 1
+            logger.error(f"Batched inference failed for {key}: {e}")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        for pending, result in zip(batch, results):
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics and histograms."""
+        return {
+            **self.stats,
+            "pending": {key: len(q.items) for key, q in self._queues.items() if q.items},
+            "batch_size_histogram": dict(self.batch_size_histogram),
+            "queue_depth_histogram": dict(self.queue_depth_histogram),
+        }
+
+
+# Global batch scheduler instance
+batch_scheduler = BatchScheduler()
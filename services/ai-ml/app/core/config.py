@@ -1,6 +1,6 @@
 """Configuration management for AI/ML service."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     environment: str = "development"
     port: int = 8000
     log_level: str = "info"
+    log_async: bool = True  # Format and write logs on a background thread
+    log_queue_size: int = 10000  # Records beyond this are dropped and counted
+    log_sample_rates: Dict[str, float] = {}  # Logger name -> fraction of INFO kept
     service_name: str = "ai-ml-service"
 
     # Redis
@@ -20,6 +23,23 @@ class Settings(BaseSettings):
     # Kafka
     kafka_brokers: str = "localhost:9092"
     kafka_topic_prefix: str = "ai"
+    event_queue_max_size: int = 10000
+    event_batch_size: int = 200  # Events handed to the producer per drain cycle
+    event_linger_ms: int = 20
+    event_max_batch_bytes: int = 65536  # Producer per-partition batch cap
+    event_compression: Optional[str] = "gzip"  # gzip, snappy, lz4, zstd or none
+    event_encoding: str = "json"  # json or binary (see app/services/event_codec.py)
+    event_overflow_policy: str = "drop_oldest"  # drop_oldest, drop_newest or block
+    event_enqueue_timeout_ms: int = 50  # Max wait under the "block" policy
+    event_flush_timeout_seconds: int = 5
+    event_reconnect_interval_seconds: int = 10
+
+    # Disk journal for events while Kafka is unavailable
+    enable_event_journal: bool = True
+    event_journal_dir: str = "/tmp/ai-ml-event-journal"
+    event_journal_segment_mb: int = 16
+    event_journal_max_mb: int = 512
+    event_replay_batch_size: int = 500
 
     # MinIO
     minio_endpoint: str = "localhost:9000"
@@ -27,16 +47,32 @@ class Settings(BaseSettings):
     minio_secret_key: str = "nexus_dev_password"
     minio_bucket: str = "nexus-ai-models"
     minio_secure: bool = False
+    storage_transfer_workers: int = 8  # Concurrent object/range transfers
+    storage_chunk_size_mb: int = 64  # Larger objects are fetched as parallel ranged GETs
+    storage_verify_checksums: bool = True
+    storage_upload_part_size_mb: int = 64  # Multipart part size (min 5)
+    storage_upload_parallel_parts: int = 4  # Parts in flight per file, per transfer worker
+    storage_index_prefix: str = "_index/"  # One manifest object per model version
+    storage_revision_prefix: str = "_revisions/"  # upload_model writes each upload here
+    storage_index_ttl_seconds: int = 60
+    storage_bucket_scan_ttl_seconds: int = 600  # Listing of models missing from the index
 
     # Model Configuration
     model_cache_dir: str = "/models"
-    model_cache_size_gb: int = 10
+    model_cache_size_gb: int = 10  # In-memory budget; LRU models are evicted beyond it
     device: str = "cpu"  # 'cuda' for GPU
+    model_loader_workers: int = 2
+    engine_startup_mode: str = "concurrent"  # concurrent or sequential
+    engine_load_modes: Dict[str, str] = {}  # Per-engine override: eager, background or lazy
+    readiness_required_services: List[str] = []  # Any of cache, events, storage
 
     # Performance
     batch_size: int = 32
+    batch_max_wait_ms: int = 10
     max_workers: int = 4
     inference_timeout_seconds: int = 30
+    translation_segment_max_chars: int = 600
+    translation_detect_min_confidence: float = 0.5  # Below this, source_lang="auto" assumes English
 
     # Feature Flags
     enable_gpu: bool = False
@@ -47,13 +83,32 @@ class Settings(BaseSettings):
     translation_cache_ttl: int = 2592000  # 30 days
     prediction_cache_ttl: int = 3600  # 1 hour
     recommendation_cache_ttl: int = 21600  # 6 hours
+    cache_soft_ttl_ratio: float = 0.8  # Entries older than ttl*ratio are served stale and refreshed
+
+    # In-process L1 cache in front of Redis
+    enable_local_cache: bool = True
+    local_cache_max_entries: int = 10000
+    local_cache_ttl_seconds: int = 300  # Upper bound on L1 staleness
 
     # Rate Limiting
-    rate_limit_per_minute: int = 60
+    rate_limit_per_minute: int = 60  # Per client; 0 disables rate limiting
+    rate_limit_burst: int = 0  # Bucket size; 0 means rate_limit_per_minute
+    rate_limit_costs: Dict[str, int] = {  # Tokens per request by path (default 1)
+        "/api/v1/ai/speech-to-text": 10,
+        "/api/v1/ai/ocr": 5,
+        "/api/v1/ai/analyze-image": 5,
+        "/api/v1/ai/generate": 5,
+    }
+    rate_limit_translation_cost: int = 1  # Batch translation: tokens per text per target language
+    rate_limit_exempt_paths: List[str] = ["/health", "/docs", "/redoc", "/openapi.json"]
+    rate_limit_trust_forwarded: bool = False  # Key by X-Forwarded-For (behind a trusted proxy)
+    rate_limit_trust_user_header: bool = False  # Key by X-User-ID (only if a gateway sets it)
 
     # Monitoring
     enable_metrics: bool = True
     metrics_port: int = 9090
+    trace_sample_rate: float = 0.01  # Fraction of requests logged as structured traces
+    trace_slow_ms: int = 1000  # Requests slower than this are always logged
 
     model_config = SettingsConfigDict(
         env_file=".env",
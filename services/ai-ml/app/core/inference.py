@@ -0,0 +1,116 @@
+"""Bounded executor for blocking model inference."""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.metrics import service_metrics
+from app.core.tracing import traced
+from app.utils.logger import logger
+
+
+class InferenceTimeoutError(Exception):
+    """Raised when an inference call exceeds its timeout."""
+
+
+class InferenceExecutor:
+    """Run blocking pipeline calls on a bounded thread pool with timeouts."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout_seconds: Optional[float] = None
+    ):
+        """Initialize inference executor."""
+        self.max_workers = max_workers or settings.max_workers
+        self.timeout_seconds = timeout_seconds or settings.inference_timeout_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="inference"
+        )
+        self._in_flight = 0
+        self.stats: Dict[str, float] = {
+            "calls": 0,
+            "successes": 0,
+            "timeouts": 0,
+            "failures": 0,
+            "inference_ms_total": 0.0,
+        }
+
+    @traced("inference")
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        label: Optional[str] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a blocking function on the inference pool.
+
+        The timeout covers queueing and execution. On timeout or caller
+        cancellation, work that has not started yet is dropped from the queue;
+        work already running finishes in the background and its result is
+        discarded.
+
+        Args:
+            fn: Blocking callable (e.g. a transformers pipeline)
+            timeout: Seconds to wait (default: settings.inference_timeout_seconds)
+            label: Engine name for per-engine metrics (default: function name)
+
+        Returns:
+            Result of fn
+
+        Raises:
+            InferenceTimeoutError: If the call did not complete in time
+        """
+        timeout = timeout or self.timeout_seconds
+        start_time = time.time()
+        self.stats["calls"] += 1
+        self._in_flight += 1
+
+        # Cancelling the wrapped future also cancels the pool future if still queued
+        future = asyncio.wrap_future(
+            self._executor.submit(functools.partial(fn, *args, **kwargs))
+        )
+
+        try:
+            result = await asyncio.wait_for(future, timeout)
+            self.stats["successes"] += 1
+            return result
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            name = getattr(fn, "__name__", type(fn).__name__)
+            logger.warning(f"Inference call {name} timed out after {timeout}s")
+            raise InferenceTimeoutError(f"Inference timed out after {timeout}s")
+        except Exception:
+            self.stats["failures"] += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            elapsed = time.time() - start_time
+            self.stats["inference_ms_total"] += elapsed * 1000
+            service_metrics.observe_inference(
+                label or getattr(fn, "__name__", type(fn).__name__),
+                elapsed
+            )
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get inference executor statistics."""
+        return {
+            **self.stats,
+            "in_flight": self._in_flight,
+            "max_workers": self.max_workers,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping queued work."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global inference executor instance
+inference_executor = InferenceExecutor()
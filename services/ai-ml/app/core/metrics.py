@@ -0,0 +1,369 @@
+"""Prometheus metrics for the AI/ML service hot paths."""
+
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from app.core.config import settings
+from app.utils.logger import get_log_stats, logger
+
+try:
+    from prometheus_client import REGISTRY, start_http_server
+    from prometheus_client.core import (
+        CounterMetricFamily,
+        GaugeMetricFamily,
+        HistogramMetricFamily,
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+# Seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+MODEL_LOAD_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+# Inputs per batched forward pass
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+Labels = Tuple[str, ...]
+
+
+class LoopHistogram:
+    """
+    Histogram observed from the event loop thread only.
+
+    prometheus_client metrics take a lock on every observation; these are
+    plain counters mutated by the (single) event loop thread and copied by
+    the scrape thread, so the request path never contends on a lock.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        """Initialize histogram with upper bucket bounds (seconds)."""
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last is +Inf), sum]
+        self._series: Dict[Labels, List[Any]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        """Record one observation."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self) -> Iterator[Tuple[Labels, List[Tuple[str, int]], float]]:
+        """Yield (labels, cumulative buckets, sum) per label set."""
+        for labels, (counts, total) in list(self._series.items()):
+            cumulative = 0
+            buckets = []
+            for bound, count in zip(self.buckets + (float("inf"),), list(counts)):
+                cumulative += count
+                buckets.append(("+Inf" if bound == float("inf") else str(bound), cumulative))
+            yield labels, buckets, total
+
+
+class ServiceMetrics:
+    """
+    Service metrics registry.
+
+    Latencies are recorded on the hot paths into LoopHistograms. Counters
+    and gauges the services already keep (cache, events, model manager,
+    batching, inference) are read from their get_stats() at scrape time.
+    """
+
+    def __init__(self):
+        """Initialize service metrics."""
+        self.http_latency = LoopHistogram(LATENCY_BUCKETS)
+        self.inference_latency = LoopHistogram(LATENCY_BUCKETS)
+        self.event_send_latency = LoopHistogram(LATENCY_BUCKETS)
+        self.model_load_time = LoopHistogram(MODEL_LOAD_BUCKETS)
+        self.model_load_wait = LoopHistogram(MODEL_LOAD_BUCKETS)
+        self.batch_size = LoopHistogram(BATCH_SIZE_BUCKETS)
+        self.batch_queue_wait = LoopHistogram(LATENCY_BUCKETS)
+        self._started = False
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Record an HTTP request."""
+        self.http_latency.observe((method, route, str(status)), seconds)
+
+    def observe_inference(self, engine: str, seconds: float) -> None:
+        """Record one inference call (a batch counts once)."""
+        self.inference_latency.observe((engine,), seconds)
+
+    def observe_event_send(self, topic: str, seconds: float) -> None:
+        """Record one Kafka send, until the broker acknowledged it."""
+        self.event_send_latency.observe((topic,), seconds)
+
+    def observe_model_load(self, model_name: str, seconds: float) -> None:
+        """Record a model load."""
+        self.model_load_time.observe((model_name,), seconds)
+
+    def observe_model_load_wait(self, model_name: str, seconds: float) -> None:
+        """Record a wait for a load of the same model already in flight."""
+        self.model_load_wait.observe((model_name,), seconds)
+
+    def observe_batch(self, engine: str, queue_waits: Sequence[float]) -> None:
+        """Record a batched forward pass and how long each of its inputs waited."""
+        self.batch_size.observe((engine,), len(queue_waits))
+        for seconds in queue_waits:
+            self.batch_queue_wait.observe((engine,), seconds)
+
+    def start(self) -> bool:
+        """
+        Serve /metrics on settings.metrics_port if enable_metrics is set.
+
+        Returns:
+            True if the metrics server is running
+        """
+        if self._started:
+            return True
+        if not settings.enable_metrics:
+            return False
+        if not PROMETHEUS_AVAILABLE:
+            logger.warning("prometheus-client not installed, metrics disabled")
+            return False
+
+        try:
+            REGISTRY.register(_StatsCollector(self))
+            start_http_server(settings.metrics_port)
+            self._started = True
+            logger.info(f"✅ Metrics served on port {settings.metrics_port}")
+        except Exception as e:
+            logger.error(f"Failed to start metrics server: {e}")
+
+        return self._started
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-endpoint latency histograms."""
+
+    def __init__(self, app: Any):
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        """Time the request and record it under its route template."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Route templates keep label cardinality bounded
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            service_metrics.observe_request(
+                scope["method"], path, status, time.perf_counter() - start_time
+            )
+
+
+class _StatsCollector:
+    """Expose ServiceMetrics histograms and service statistics on scrape."""
+
+    def __init__(self, metrics: ServiceMetrics):
+        """Initialize collector."""
+        self.metrics = metrics
+
+    def collect(self) -> Iterator[Any]:
+        """Build metric families from current state."""
+        yield from self._histogram(
+            "ai_http_request_duration_seconds", "HTTP request latency",
+            ["method", "route", "status"], self.metrics.http_latency
+        )
+        yield from self._histogram(
+            "ai_inference_duration_seconds", "Inference time per engine (including queueing)",
+            ["engine"], self.metrics.inference_latency
+        )
+        yield from self._histogram(
+            "ai_event_send_duration_seconds", "Kafka send latency until acknowledged",
+            ["topic"], self.metrics.event_send_latency
+        )
+        yield from self._histogram(
+            "ai_model_load_duration_seconds", "Model load time",
+            ["model"], self.metrics.model_load_time
+        )
+        yield from self._histogram(
+            "ai_model_load_wait_seconds", "Wait for a load of the same model already in flight",
+            ["model"], self.metrics.model_load_wait
+        )
+        yield from self._histogram(
+            "ai_batch_size", "Inputs per batched forward pass",
+            ["engine"], self.metrics.batch_size
+        )
+        yield from self._histogram(
+            "ai_batch_queue_wait_seconds", "Time inputs waited for their batch to be dispatched",
+            ["engine"], self.metrics.batch_queue_wait
+        )
+
+        for collect in (
+            self._cache, self._events, self._models, self._inference,
+            self._rate_limit, self._logging
+        ):
+            try:
+                yield from collect()
+            except Exception as e:
+                logger.error(f"Metrics collection failed in {collect.__name__}: {e}")
+
+    @staticmethod
+    def _histogram(
+        name: str,
+        documentation: str,
+        label_names: List[str],
+        histogram: LoopHistogram
+    ) -> Iterator[Any]:
+        family = HistogramMetricFamily(name, documentation, labels=label_names)
+        for labels, buckets, total in histogram.samples():
+            family.add_metric(list(labels), buckets, total)
+        yield family
+
+    @staticmethod
+    def _cache() -> Iterator[Any]:
+        from app.services.cache import cache_service
+
+        operations = CounterMetricFamily(
+            "ai_cache_operations", "Cache lookups and errors by key prefix",
+            labels=["prefix", "result"]
+        )
+        for prefix, counts in list(cache_service.prefix_stats.items()):
+            for result, count in list(counts.items()):
+                operations.add_metric([prefix, result], count)
+        yield operations
+
+        yield GaugeMetricFamily(
+            "ai_cache_l1_entries", "Entries in the in-process cache",
+            value=cache_service.get_stats()["l1_entries"]
+        )
+        yield GaugeMetricFamily(
+            "ai_cache_connected", "Redis connection state",
+            value=int(cache_service.is_connected)
+        )
+
+    @staticmethod
+    def _events() -> Iterator[Any]:
+        from app.services.events import event_publisher
+
+        stats = event_publisher.get_stats()
+        yield CounterMetricFamily(
+            "ai_events_enqueued", "Events queued for publishing",
+            value=stats.get("enqueued", 0)
+        )
+        # Outcomes are disjoint: each event is counted once, when it leaves the queue
+        events = CounterMetricFamily(
+            "ai_events", "Events by terminal outcome", labels=["outcome"]
+        )
+        for outcome in ("sent", "spilled", "failed", "dropped"):
+            events.add_metric([outcome], stats.get(outcome, 0))
+        yield events
+        yield CounterMetricFamily(
+            "ai_events_replayed", "Journaled events sent after Kafka recovered",
+            value=stats["replay"]["replayed"]
+        )
+
+        yield CounterMetricFamily(
+            "ai_event_batches", "Event batches sent", value=stats.get("batches", 0)
+        )
+        yield GaugeMetricFamily(
+            "ai_event_queue_depth", "Events waiting to be sent",
+            value=stats.get("queue_depth", 0)
+        )
+        yield GaugeMetricFamily(
+            "ai_events_connected", "Kafka connection state",
+            value=int(event_publisher.is_connected)
+        )
+
+    @staticmethod
+    def _models() -> Iterator[Any]:
+        from app.core.model_manager import model_manager
+
+        memory = model_manager.get_memory_usage()
+        yield GaugeMetricFamily(
+            "ai_model_resident_bytes", "Memory used by loaded models",
+            value=memory["resident_bytes"]
+        )
+        yield GaugeMetricFamily(
+            "ai_models_loaded", "Models in memory", value=memory["total_models"]
+        )
+        yield CounterMetricFamily(
+            "ai_model_evictions", "Models evicted from memory", value=memory["evictions"]
+        )
+
+        load_stats = model_manager.get_load_stats()
+        yield CounterMetricFamily(
+            "ai_model_loads", "Model loads started", value=load_stats["loads"]
+        )
+        yield CounterMetricFamily(
+            "ai_model_load_failures", "Model loads that failed",
+            value=load_stats.get("failures", 0)
+        )
+        yield CounterMetricFamily(
+            "ai_model_load_coalesced_waits", "Loads that joined a load already in flight",
+            value=load_stats.get("coalesced_waits", 0)
+        )
+
+    @staticmethod
+    def _inference() -> Iterator[Any]:
+        from app.core.batching import batch_scheduler
+        from app.core.inference import inference_executor
+
+        stats = inference_executor.get_stats()
+        # Outcomes are disjoint so they sum to completed calls
+        calls = CounterMetricFamily(
+            "ai_inference_calls", "Completed inference calls by outcome", labels=["outcome"]
+        )
+        calls.add_metric(["success"], stats["successes"])
+        calls.add_metric(["timeout"], stats["timeouts"])
+        calls.add_metric(["failure"], stats["failures"])
+        yield calls
+        yield GaugeMetricFamily(
+            "ai_inference_in_flight", "Inference calls queued or running",
+            value=stats["in_flight"]
+        )
+
+        batching = batch_scheduler.get_stats()
+        yield CounterMetricFamily(
+            "ai_batches", "Batched forward passes", value=batching.get("batches", 0)
+        )
+        yield CounterMetricFamily(
+            "ai_batch_items", "Inputs served by batched forward passes",
+            value=batching.get("items", 0)
+        )
+
+    @staticmethod
+    def _rate_limit() -> Iterator[Any]:
+        from app.core.rate_limit import rate_limiter
+
+        decisions = CounterMetricFamily(
+            "ai_rate_limit_decisions", "Rate limit checks by outcome and backend",
+            labels=["outcome", "backend"]
+        )
+        for (outcome, backend), count in list(rate_limiter.decisions.items()):
+            decisions.add_metric([outcome, backend], count)
+        yield decisions
+        yield CounterMetricFamily(
+            "ai_rate_limit_redis_errors", "Rate limit checks that failed in Redis",
+            value=rate_limiter.stats["redis_errors"]
+        )
+
+    @staticmethod
+    def _logging() -> Iterator[Any]:
+        stats = get_log_stats()
+        records = CounterMetricFamily(
+            "ai_log_records_discarded", "Log records not written", labels=["reason"]
+        )
+        records.add_metric(["queue_full"], stats["dropped"])
+        records.add_metric(["sampled"], stats["sampled_out"])
+        yield records
+
+
+# Global service metrics instance
+service_metrics = ServiceMetrics()
@@ -1,19 +1,14 @@
 """Model manager for lazy loading and caching ML models."""
 
+import asyncio
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass
-import torch
-from transformers import (
-    AutoModel,
-    AutoTokenizer,
-    AutoModelForSeq2SeqLM,
-    AutoModelForSequenceClassification,
-    pipeline
-)
 
 from app.core.config import settings
+from app.core.metrics import service_metrics
 from app.utils.logger import logger
 from app.services.storage import model_storage
 from app.services.events import event_publisher
@@ -28,6 +23,7 @@ class ModelInfo:
     device: str
     loaded_at: float
     last_used: float
+    pinned: bool = False
 
 
 class ModelManager:
@@ -43,19 +39,51 @@ class ModelManager:
         self.model_cache_dir = Path(settings.model_cache_dir)
         self.model_cache_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Model manager initialized with device: {self.device}")
+        # Residency policy
+        self.cache_budget_mb = settings.model_cache_size_gb * 1024
+        self.eviction_count = 0
+        self.evicted_mb = 0.0
+        self._known_sizes: Dict[str, float] = {}
+        # Estimated sizes of loads that passed the budget check but are not resident yet
+        self._reserved: Dict[str, float] = {}
+
+        # Single-flight registry: cache_key -> future resolved with load success
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.load_stats: Dict[str, float] = {
+            "loads": 0,
+            "failures": 0,
+            "coalesced_waits": 0,
+            "load_wait_ms_total": 0.0,
+            "load_wait_ms_max": 0.0,
+        }
+
+        # Loads run on a dedicated pool so the event loop keeps serving requests
+        self._loader_executor = ThreadPoolExecutor(
+            max_workers=settings.model_loader_workers,
+            thread_name_prefix="model-loader"
+        )
+        self.load_progress: Dict[str, str] = {}
+
+        logger.info(
+            f"Model manager initialized with device: {self.device} "
+            f"(cache budget {settings.model_cache_size_gb} GB)"
+        )
 
     def _detect_device(self) -> str:
         """Detect available device (CUDA/CPU)."""
-        if settings.enable_gpu and torch.cuda.is_available():
-            return "cuda"
-        return "cpu"
+        if not settings.enable_gpu:
+            return "cpu"
+
+        import torch
+
+        return "cuda" if torch.cuda.is_available() else "cpu"
 
     async def load_model(
         self,
         model_name: str,
         model_type: str = "default",
-        version: str = "latest"
+        version: str = "latest",
+        pinned: bool = False
     ) -> bool:
         """
         Load model into memory.
@@ -64,66 +92,119 @@ class ModelManager:
             model_name: Name/path of the model
             model_type: Type of model (translation, sentiment, etc.)
             version: Version to load
+            pinned: Exclude the model from LRU eviction
 
         Returns:
             True if loading successful
         """
+        # Check if already loaded
+        cache_key = f"{model_name}:{version}"
+        if cache_key in self.models:
+            logger.info(f"Model {model_name} already loaded")
+            info = self.model_info[cache_key]
+            info.last_used = time.time()
+            info.pinned = info.pinned or pinned
+            return True
+
+        # Another request is already loading this model: wait for it
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            wait_start = time.time()
+            success = await asyncio.shield(inflight)
+            wait_ms = (time.time() - wait_start) * 1000
+
+            self.load_stats["coalesced_waits"] += 1
+            self.load_stats["load_wait_ms_total"] += wait_ms
+            self.load_stats["load_wait_ms_max"] = max(self.load_stats["load_wait_ms_max"], wait_ms)
+            service_metrics.observe_model_load_wait(model_name, wait_ms / 1000)
+            logger.info(f"Waited {wait_ms:.0f}ms for in-flight load of model {model_name}")
+
+            if success and pinned:
+                self.pin_model(model_name, version)
+            return success
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        self.load_progress[cache_key] = "queued"
+        success = False
+        try:
+            success = await self._load_model(model_name, model_type, version, pinned)
+            return success
+        except asyncio.CancelledError:
+            # Abandoned mid-load: nothing is loading this model any more
+            if self.load_progress.get(cache_key) != "ready":
+                self.load_progress.pop(cache_key, None)
+            raise
+        finally:
+            del self._inflight[cache_key]
+            self._reserved.pop(cache_key, None)
+            future.set_result(success)
+
+    async def _load_model(
+        self,
+        model_name: str,
+        model_type: str,
+        version: str,
+        pinned: bool
+    ) -> bool:
+        """Load a model that is neither resident nor in flight."""
         start_time = time.time()
+        cache_key = f"{model_name}:{version}"
+        self.load_stats["loads"] += 1
+        loop = asyncio.get_running_loop()
 
         try:
-            # Check if already loaded
-            cache_key = f"{model_name}:{version}"
-            if cache_key in self.models:
-                logger.info(f"Model {model_name} already loaded")
-                self.model_info[cache_key].last_used = time.time()
-                return True
-
-            # Try to download from MinIO if not in local cache
+            # Download from MinIO, or refresh the local cache incrementally
+            # (only changed files are transferred; unchanged costs one listing)
             local_path = self.model_cache_dir / model_name / version
-            if not local_path.exists():
-                logger.info(f"Downloading model {model_name} from storage...")
-                downloaded_path = model_storage.download_model(model_name, version)
+            model_storage.restore_interrupted_swap(local_path)
+            cached = local_path.exists()
+            if model_storage.is_connected or not cached:
+                self.load_progress[cache_key] = "refreshing" if cached else "downloading"
+                logger.info(f"Syncing model {model_name} from storage...")
+                downloaded_path = await loop.run_in_executor(
+                    self._loader_executor,
+                    model_storage.download_model,
+                    model_name,
+                    version
+                )
                 if downloaded_path:
                     local_path = downloaded_path
+                elif cached:
+                    logger.warning(f"Using cached copy of model {model_name}")
                 else:
                     # Fallback to Hugging Face Hub
                     logger.info(f"Model not in storage, will load from Hugging Face")
                     local_path = model_name
 
-            # Load based on model type
-            if model_type == "translation":
-                model = AutoModelForSeq2SeqLM.from_pretrained(
-                    str(local_path),
-                    torch_dtype=torch.float16 if self.device == "cuda" else torch.float32
-                )
-                tokenizer = AutoTokenizer.from_pretrained(str(local_path))
-                self.tokenizers[cache_key] = tokenizer
-            elif model_type == "sentiment":
-                model = AutoModelForSequenceClassification.from_pretrained(str(local_path))
-                tokenizer = AutoTokenizer.from_pretrained(str(local_path))
-                self.tokenizers[cache_key] = tokenizer
-            elif model_type == "pipeline":
-                # For pipeline-based models (e.g., Whisper, CLIP)
-                pipe = pipeline(model_name, model=str(local_path), device=self.device)
-                self.pipelines[cache_key] = pipe
-                model = pipe.model
-            else:
-                # Default: AutoModel
-                model = AutoModel.from_pretrained(str(local_path))
-                tokenizer = AutoTokenizer.from_pretrained(str(local_path))
-                self.tokenizers[cache_key] = tokenizer
-
-            # Move to device
-            model = model.to(self.device)
-            model.eval()  # Set to evaluation mode
+            # Make room for the model before it is materialized
+            estimated_mb = await loop.run_in_executor(
+                self._loader_executor,
+                self._estimate_size_mb,
+                cache_key,
+                local_path
+            )
+            self._evict_for(estimated_mb)
+            self._reserved[cache_key] = estimated_mb
+
+            # Build the model off the event loop
+            self.load_progress[cache_key] = "loading"
+            model, tokenizer, pipe, size_mb = await loop.run_in_executor(
+                self._loader_executor,
+                self._build_model,
+                model_name,
+                model_type,
+                local_path
+            )
 
             # Store model
             self.models[cache_key] = model
-
-            # Calculate model size
-            param_size = sum(p.nelement() * p.element_size() for p in model.parameters())
-            buffer_size = sum(b.nelement() * b.element_size() for b in model.buffers())
-            size_mb = (param_size + buffer_size) / 1024 / 1024
+            if tokenizer is not None:
+                self.tokenizers[cache_key] = tokenizer
+            if pipe is not None:
+                self.pipelines[cache_key] = pipe
+            self._known_sizes[cache_key] = size_mb
+            self._reserved.pop(cache_key, None)
 
             # Store model info
             load_time_ms = (time.time() - start_time) * 1000
@@ -133,8 +214,14 @@ class ModelManager:
                 size_mb=size_mb,
                 device=self.device,
                 loaded_at=time.time(),
-                last_used=time.time()
+                last_used=time.time(),
+                pinned=pinned
             )
+            self.load_progress[cache_key] = "ready"
+            service_metrics.observe_model_load(model_name, load_time_ms / 1000)
+
+            # The estimate may have been low; enforce the budget on actual size
+            self._evict_for(0.0, exclude=cache_key)
 
             logger.info(
                 f"✅ Loaded model {model_name} ({size_mb:.2f} MB) "
@@ -151,10 +238,68 @@ class ModelManager:
             return True
 
         except Exception as e:
+            self.load_progress[cache_key] = "failed"
+            self.load_stats["failures"] += 1
             logger.error(f"Failed to load model {model_name}: {e}")
             await event_publisher.publish_model_failed(model_name, str(e))
             return False
 
+    def _build_model(
+        self,
+        model_name: str,
+        model_type: str,
+        local_path: Any
+    ) -> Tuple[Any, Optional[Any], Optional[Any], float]:
+        """
+        Materialize a model on the loader executor.
+
+        Returns:
+            Tuple of (model, tokenizer, pipeline, size_mb); tokenizer or
+            pipeline is None depending on the model type
+        """
+        # Deferred so the service starts without paying for torch/transformers
+        import torch
+        from transformers import (
+            AutoModel,
+            AutoTokenizer,
+            AutoModelForSeq2SeqLM,
+            AutoModelForSequenceClassification,
+            pipeline
+        )
+
+        tokenizer = None
+        pipe = None
+
+        # Load based on model type
+        if model_type == "translation":
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                str(local_path),
+                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32
+            )
+            tokenizer = AutoTokenizer.from_pretrained(str(local_path))
+        elif model_type == "sentiment":
+            model = AutoModelForSequenceClassification.from_pretrained(str(local_path))
+            tokenizer = AutoTokenizer.from_pretrained(str(local_path))
+        elif model_type == "pipeline":
+            # For pipeline-based models (e.g., Whisper, CLIP)
+            pipe = pipeline(model_name, model=str(local_path), device=self.device)
+            model = pipe.model
+        else:
+            # Default: AutoModel
+            model = AutoModel.from_pretrained(str(local_path))
+            tokenizer = AutoTokenizer.from_pretrained(str(local_path))
+
+        # Move to device
+        model = model.to(self.device)
+        model.eval()  # Set to evaluation mode
+
+        # Calculate model size
+        param_size = sum(p.nelement() * p.element_size() for p in model.parameters())
+        buffer_size = sum(b.nelement() * b.element_size() for b in model.buffers())
+        size_mb = (param_size + buffer_size) / 1024 / 1024
+
+        return model, tokenizer, pipe, size_mb
+
     def get_model(self, model_name: str, version: str = "latest") -> Optional[Any]:
         """Get loaded model."""
         cache_key = f"{model_name}:{version}"
@@ -163,6 +308,22 @@ class ModelManager:
             return self.models[cache_key]
         return None
 
+    def pin_model(self, model_name: str, version: str = "latest") -> bool:
+        """Exclude a loaded model from LRU eviction."""
+        cache_key = f"{model_name}:{version}"
+        if cache_key not in self.model_info:
+            return False
+        self.model_info[cache_key].pinned = True
+        return True
+
+    def unpin_model(self, model_name: str, version: str = "latest") -> bool:
+        """Make a loaded model eligible for LRU eviction again."""
+        cache_key = f"{model_name}:{version}"
+        if cache_key not in self.model_info:
+            return False
+        self.model_info[cache_key].pinned = False
+        return True
+
     def get_tokenizer(self, model_name: str, version: str = "latest") -> Optional[Any]:
         """Get tokenizer for model."""
         cache_key = f"{model_name}:{version}"
@@ -195,9 +356,12 @@ class ModelManager:
             # Remove info
             if cache_key in self.model_info:
                 del self.model_info[cache_key]
+            self.load_progress.pop(cache_key, None)
 
             # Clear CUDA cache if using GPU
             if self.device == "cuda":
+                import torch
+
                 torch.cuda.empty_cache()
 
             logger.info(f"Unloaded model {model_name}")
@@ -207,21 +371,97 @@ class ModelManager:
             logger.error(f"Failed to unload model {model_name}: {e}")
             return False
 
+    def _resident_mb(self) -> float:
+        """Total size of all resident models in MB."""
+        return sum(info.size_mb for info in self.model_info.values())
+
+    def _reserved_mb(self) -> float:
+        """Total estimated size of models still being loaded in MB."""
+        return sum(self._reserved.values())
+
+    def _estimate_size_mb(self, cache_key: str, local_path: Any) -> float:
+        """Estimate in-memory size of a model before loading it."""
+        if cache_key in self._known_sizes:
+            return self._known_sizes[cache_key]
+
+        path = Path(str(local_path))
+        if not path.is_dir():
+            return 0.0
+
+        weight_suffixes = {".bin", ".safetensors", ".pt", ".pth", ".onnx"}
+        size_bytes = sum(
+            f.stat().st_size for f in path.rglob("*")
+            if f.is_file() and f.suffix in weight_suffixes
+        )
+        return size_bytes / 1024 / 1024
+
+    def _evict_for(self, required_mb: float, exclude: Optional[str] = None) -> None:
+        """
+        Evict least-recently-used unpinned models until required_mb fits the budget.
+
+        Space reserved by loads still in progress counts against the budget,
+        so concurrent loads cannot each claim the same free memory.
+        """
+        candidates = sorted(
+            (
+                (key, info) for key, info in self.model_info.items()
+                if not info.pinned and key != exclude
+            ),
+            key=lambda item: item[1].last_used
+        )
+
+        for key, info in candidates:
+            if self._resident_mb() + self._reserved_mb() + required_mb <= self.cache_budget_mb:
+                break
+            if self.unload_model(info.name, info.version):
+                self.eviction_count += 1
+                self.evicted_mb += info.size_mb
+                logger.info(
+                    f"Evicted model {info.name} ({info.size_mb:.2f} MB) "
+                    f"to stay within {self.cache_budget_mb} MB cache budget"
+                )
+
+        committed_mb = self._resident_mb() + self._reserved_mb() + required_mb
+        if committed_mb > self.cache_budget_mb:
+            logger.warning(
+                f"Model cache over budget: {committed_mb:.2f} MB "
+                f"resident/loading/required vs {self.cache_budget_mb} MB "
+                f"(remaining models pinned)"
+            )
+
     def get_loaded_models(self) -> Dict[str, ModelInfo]:
         """Get info about all loaded models."""
         return self.model_info.copy()
 
+    def get_load_stats(self) -> Dict[str, float]:
+        """Get model load and single-flight wait statistics."""
+        stats = dict(self.load_stats)
+        stats["in_flight"] = len(self._inflight)
+        return stats
+
+    def get_load_progress(self) -> Dict[str, str]:
+        """Get load stage per model (queued, downloading, refreshing, loading, ready, failed)."""
+        return self.load_progress.copy()
+
     def get_memory_usage(self) -> Dict[str, float]:
         """Get memory usage statistics."""
-        total_size_mb = sum(info.size_mb for info in self.model_info.values())
+        total_size_mb = self._resident_mb()
 
         stats = {
             "total_models": len(self.models),
             "total_size_mb": total_size_mb,
+            "resident_bytes": total_size_mb * 1024 * 1024,
+            "reserved_mb": self._reserved_mb(),
+            "cache_budget_mb": self.cache_budget_mb,
+            "pinned_models": sum(1 for info in self.model_info.values() if info.pinned),
+            "evictions": self.eviction_count,
+            "evicted_mb": self.evicted_mb,
             "device": self.device,
         }
 
         if self.device == "cuda":
+            import torch
+
             stats["cuda_allocated_mb"] = torch.cuda.memory_allocated() / 1024 / 1024
             stats["cuda_reserved_mb"] = torch.cuda.memory_reserved() / 1024 / 1024
 
@@ -233,6 +473,10 @@ class ModelManager:
         for model_name, model_type in model_list:
             await self.load_model(model_name, model_type)
 
+    def shutdown(self) -> None:
+        """Stop the loader executor, abandoning queued loads."""
+        self._loader_executor.shutdown(wait=False, cancel_futures=True)
+
 
 # Global model manager instance
 model_manager = ModelManager()
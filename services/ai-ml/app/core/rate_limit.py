@@ -0,0 +1,378 @@
+"""Token-bucket rate limiting per client, shared across replicas through Redis."""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from fastapi import HTTPException
+
+from app.api.responses import dumps
+from app.core.config import settings
+from app.services.cache import cache_service
+from app.utils.logger import get_logger
+
+logger = get_logger("rate_limit")
+
+
+# KEYS[1] bucket key; ARGV rate (tokens/s), capacity, cost.
+# Uses the Redis clock so replicas with skewed clocks agree on refills.
+# A cost above capacity is admitted from a full bucket and leaves it in debt.
+# Returns {allowed, tokens left, seconds until cost is available, seconds until full}
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local needed = math.min(cost, capacity)
+local allowed = 0
+local retry_after = 0
+if tokens >= needed then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (needed - tokens) / rate
+end
+
+local reset = (capacity - tokens) / rate
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(reset * 1000) + 1000)
+
+return {allowed, tostring(tokens), tostring(retry_after), tostring(reset)}
+"""
+
+
+# (allowed, tokens remaining, retry after seconds, seconds until full)
+Decision = Tuple[bool, float, float, float]
+
+
+class LocalTokenBuckets:
+    """In-process token buckets, used while Redis is unavailable."""
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize local buckets."""
+        self.max_entries = max_entries
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def take(self, key: str, rate: float, capacity: float, cost: float) -> Decision:
+        """Take cost tokens from a bucket if available."""
+        now = time.monotonic()
+        tokens, ts = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+
+        needed = min(cost, capacity)
+        allowed = tokens >= needed
+        retry_after = 0.0
+        if allowed:
+            tokens -= cost
+        else:
+            retry_after = (needed - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_entries:
+            self._buckets.popitem(last=False)
+
+        return allowed, tokens, retry_after, (capacity - tokens) / rate
+
+    def __len__(self) -> int:
+        """Number of tracked buckets."""
+        return len(self._buckets)
+
+
+class RateLimiter:
+    """
+    Token bucket per client key.
+
+    Buckets refill at rate_limit_per_minute tokens per minute and hold up to
+    rate_limit_burst tokens. Each request costs its endpoint's weight, or a
+    cost computed from its body (see charge()). A request costing more than
+    the bucket holds is admitted only from a full bucket and leaves it in
+    debt, so the client waits for the whole cost to refill. The bucket
+    lives in Redis (one atomic script call per request) so all replicas
+    share it; while Redis is disconnected or failing, each process falls
+    back to its own in-memory buckets.
+    """
+
+    def __init__(self):
+        """Initialize rate limiter."""
+        self.per_minute = settings.rate_limit_per_minute
+        self.capacity = float(settings.rate_limit_burst or settings.rate_limit_per_minute)
+        self.rate = self.per_minute / 60.0
+        self.local = LocalTokenBuckets()
+        self._script: Optional[Any] = None
+        self._script_client: Optional[Any] = None
+        self._redis_failing = False
+        # (outcome, backend) -> decisions
+        self.decisions: Dict[Tuple[str, str], int] = {
+            (outcome, backend): 0
+            for outcome in ("allowed", "limited")
+            for backend in ("redis", "local")
+        }
+        self.stats: Dict[str, int] = {
+            "redis_errors": 0,
+        }
+        # Paths whose endpoint charges its own cost (see charge())
+        self._endpoint_charged: Set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Rate limiting is off when rate_limit_per_minute is not positive."""
+        return self.per_minute > 0
+
+    def cost_of(self, path: str) -> float:
+        """Token cost of a request path (0 where the endpoint charges it)."""
+        if path in self._endpoint_charged:
+            return 0.0
+        return float(settings.rate_limit_costs.get(path, 1))
+
+    def charged_by_endpoint(self, path: str) -> None:
+        """
+        Let the endpoint at path charge its own cost with charge().
+
+        The middleware then never charges the path, whatever
+        rate_limit_costs says, so requests are not charged twice.
+        """
+        self._endpoint_charged.add(path)
+
+    async def take(self, client: str, cost: float) -> Decision:
+        """
+        Charge a request against a client's bucket.
+
+        Args:
+            client: Client key (user ID or IP address)
+            cost: Tokens the request costs
+
+        Returns:
+            Tuple of (allowed, tokens remaining, retry-after seconds,
+            seconds until the bucket is full)
+        """
+        decision = None
+        backend = "redis"
+        if cache_service.is_connected and cache_service.redis is not None:
+            decision = await self._take_redis(client, cost)
+
+        if decision is None:
+            backend = "local"
+            decision = self.local.take(client, self.rate, self.capacity, cost)
+
+        self.decisions["allowed" if decision[0] else "limited", backend] += 1
+        return decision
+
+    async def charge(self, scope: Dict[str, Any], cost: float, basis: str) -> None:
+        """
+        Charge a cost computed from the request body, from inside the endpoint.
+
+        The middleware only knows the path; endpoints whose work scales with
+        the body (batch translation) register their path with
+        charged_by_endpoint() and call this once the body is parsed.
+
+        Args:
+            scope: ASGI scope of the request
+            cost: Tokens the request costs
+            basis: How the cost was computed, for the 429 detail
+
+        Raises:
+            HTTPException: 429 if the client's bucket cannot cover the cost
+        """
+        if not self.enabled or _is_exempt(scope["path"]):
+            return
+
+        decision = await self.take(_client_key(scope), cost)
+        # Response headers report the bucket after this charge
+        if "rate_limit" in scope:
+            scope["rate_limit"] = list(decision)
+
+        allowed, tokens, retry_after, _ = decision
+        if not allowed:
+            raise HTTPException(
+                status_code=429,
+                detail=_limited_detail(cost, basis, tokens, self.capacity),
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+            )
+
+    async def _take_redis(self, client: str, cost: float) -> Optional[Decision]:
+        """Run the token bucket script; None if Redis failed."""
+        redis = cache_service.redis
+        if self._script is None or self._script_client is not redis:
+            # Script objects are bound to a client; re-register after reconnects
+            self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+            self._script_client = redis
+
+        key = f"{settings.service_name}:ratelimit:{client}"
+        try:
+            allowed, tokens, retry_after, reset = await self._script(
+                keys=[key],
+                args=[self.rate, self.capacity, cost]
+            )
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            # Log once per outage, not once per request
+            if not self._redis_failing:
+                self._redis_failing = True
+                logger.warning(f"Rate limit check failed in Redis, using local buckets: {e}")
+            return None
+
+        if self._redis_failing:
+            self._redis_failing = False
+            logger.info("Rate limiting back on Redis")
+        return bool(int(allowed)), float(tokens), float(retry_after), float(reset)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiting statistics."""
+        return {
+            **self.stats,
+            "allowed": self.decisions["allowed", "redis"] + self.decisions["allowed", "local"],
+            "limited": self.decisions["limited", "redis"] + self.decisions["limited", "local"],
+            "local_decisions": (
+                self.decisions["allowed", "local"] + self.decisions["limited", "local"]
+            ),
+            "decisions": {
+                f"{outcome}_{backend}": count
+                for (outcome, backend), count in self.decisions.items()
+            },
+            "per_minute": self.per_minute,
+            "burst": self.capacity,
+            "local_buckets": len(self.local),
+        }
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware enforcing the per-client rate limit.
+
+    Clients are keyed by IP address (or a trusted X-User-ID/X-Forwarded-For).
+    Limited requests get 429 with Retry-After; every limited path response
+    carries RateLimit-Limit, RateLimit-Remaining, RateLimit-Reset and
+    RateLimit-Policy headers.
+    """
+
+    def __init__(self, app: Any):
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        """Check the limit before passing the request on."""
+        if (
+            scope["type"] != "http"
+            or not rate_limiter.enabled
+            or scope["method"] == "OPTIONS"
+            or _is_exempt(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        cost = rate_limiter.cost_of(scope["path"])
+        if cost <= 0:
+            # Charged by the endpoint from the request body, if at all
+            await self._call(scope, receive, send, None)
+            return
+
+        decision = await rate_limiter.take(_client_key(scope), cost)
+        allowed, tokens, retry_after, _ = decision
+
+        if not allowed:
+            body = dumps({
+                "detail": _limited_detail(
+                    cost, f"weight of {scope['path']}", tokens, rate_limiter.capacity
+                )
+            })
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": _headers(decision) + [
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self._call(scope, receive, send, list(decision))
+
+    async def _call(
+        self,
+        scope: Dict[str, Any],
+        receive: Any,
+        send: Any,
+        decision: Optional[List[Any]]
+    ) -> None:
+        """Pass the request on, adding RateLimit headers for the latest charge."""
+        # RateLimiter.charge() replaces this with a later, body-based charge
+        scope["rate_limit"] = decision
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and scope["rate_limit"]:
+                message["headers"] = (
+                    list(message.get("headers", [])) + _headers(scope["rate_limit"])
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _headers(decision: Sequence[Any]) -> List[Tuple[bytes, bytes]]:
+    """RateLimit-* response headers for a decision."""
+    _, tokens, _, reset = decision
+    capacity = int(rate_limiter.capacity)
+    return [
+        (b"ratelimit-limit", str(capacity).encode()),
+        (b"ratelimit-remaining", str(max(0, int(tokens))).encode()),
+        (b"ratelimit-reset", str(math.ceil(reset)).encode()),
+        (b"ratelimit-policy", f"{capacity};w=60".encode()),
+    ]
+
+
+def _limited_detail(cost: float, basis: str, tokens: float, capacity: float) -> str:
+    """429 detail explaining the cost and what the bucket held."""
+    return (
+        f"Rate limit exceeded: request costs {cost:g} tokens ({basis}); "
+        f"{max(0.0, tokens):.0f} of {capacity:g} available, "
+        f"refilling at {settings.rate_limit_per_minute} per minute"
+    )
+
+
+def _is_exempt(path: str) -> bool:
+    """Health checks, docs and the root endpoint are never limited."""
+    return path == "/" or any(
+        path == prefix or path.startswith(prefix.rstrip("/") + "/")
+        for prefix in settings.rate_limit_exempt_paths
+    )
+
+
+def _client_key(scope: Dict[str, Any]) -> str:
+    """
+    Rate limit key: the client address.
+
+    X-User-ID and X-Forwarded-For are set by the client unless a proxy
+    overwrites them, so each is only used when explicitly trusted.
+    """
+    forwarded = None
+    for name, value in scope.get("headers", ()):
+        if name == b"x-user-id" and value and settings.rate_limit_trust_user_header:
+            return f"user:{value.decode('latin-1')[:128]}"
+        if name == b"x-forwarded-for" and settings.rate_limit_trust_forwarded:
+            forwarded = value.decode("latin-1").split(",")[0].strip()
+
+    if forwarded:
+        return f"ip:{forwarded}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter()
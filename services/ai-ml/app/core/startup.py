@@ -0,0 +1,170 @@
+"""Engine startup orchestration: concurrent, background and lazy initialization."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.utils.logger import logger
+
+
+# Engine load modes:
+#   eager      - initialized during startup, which waits for it
+#   background - initialization starts at startup without delaying it; the
+#                service reports ready only once it finished
+#   lazy       - initialized on first use; does not affect readiness
+LOAD_MODES = ("eager", "background", "lazy")
+
+
+@dataclass
+class EngineStatus:
+    """Initialization state of a registered engine."""
+    name: str
+    load_mode: str
+    state: str = "pending"  # pending, initializing, ready, failed
+    init_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+class EngineStartup:
+    """
+    Initialize AI engines according to their load mode.
+
+    Engines declare a default ``load_mode`` attribute; settings.engine_load_modes
+    overrides it per engine name. Eager engines are initialized concurrently
+    (or one by one with engine_startup_mode="sequential"). Every
+    initialization is single-flight: callers of ensure_initialized() join an
+    initialization already in progress instead of starting another.
+    """
+
+    def __init__(self):
+        """Initialize engine startup manager."""
+        self._engines: Dict[str, Any] = {}
+        self._status: Dict[str, EngineStatus] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.started = False
+        self.startup_ms: Optional[float] = None
+
+    def register(self, name: str, engine: Any) -> None:
+        """
+        Register an engine exposing ``async initialize() -> bool``.
+
+        Args:
+            name: Engine name used in status reports and settings overrides
+            engine: Engine instance
+        """
+        load_mode = settings.engine_load_modes.get(name, getattr(engine, "load_mode", "eager"))
+        if load_mode not in LOAD_MODES:
+            logger.warning(f"Unknown load mode {load_mode} for engine {name}, using eager")
+            load_mode = "eager"
+
+        self._engines[name] = engine
+        self._status[name] = EngineStatus(name=name, load_mode=load_mode)
+
+    async def start(self) -> None:
+        """Initialize eager engines and kick off background ones."""
+        start_time = time.time()
+
+        for name, status in self._status.items():
+            if status.load_mode == "background":
+                self._initialize(name)
+
+        eager = [name for name, status in self._status.items() if status.load_mode == "eager"]
+        if settings.engine_startup_mode == "sequential":
+            for name in eager:
+                await self._initialize(name)
+        else:
+            await asyncio.gather(*(self._initialize(name) for name in eager))
+
+        self.startup_ms = (time.time() - start_time) * 1000
+        self.started = True
+
+        timings = ", ".join(
+            f"{s.name} {s.init_ms:.0f}ms" if s.init_ms is not None else f"{s.name} ({s.load_mode})"
+            for s in self._status.values()
+        )
+        logger.info(f"✅ Engine startup completed in {self.startup_ms:.0f}ms: {timings}")
+
+    async def ensure_initialized(self, engine: Any) -> bool:
+        """
+        Initialize an engine on first use, or wait for its initialization.
+
+        Args:
+            engine: Registered engine instance
+
+        Returns:
+            True if the engine initialized successfully
+        """
+        for name, registered in self._engines.items():
+            if registered is engine:
+                status = self._status[name]
+                if status.state in ("ready", "failed"):
+                    return status.state == "ready"
+                return await asyncio.shield(self._initialize(name))
+
+        # Not managed here (e.g. used outside the application lifespan)
+        return True
+
+    def _initialize(self, name: str) -> asyncio.Task:
+        """Start (or join) the initialization task of an engine."""
+        task = self._tasks.get(name)
+        if task is None:
+            task = self._tasks[name] = asyncio.ensure_future(self._run_initialize(name))
+        return task
+
+    async def _run_initialize(self, name: str) -> bool:
+        """Run an engine's initialize() and record its state and timing."""
+        status = self._status[name]
+        status.state = "initializing"
+        start_time = time.time()
+
+        try:
+            success = await self._engines[name].initialize()
+            status.state = "ready" if success is not False else "failed"
+        except Exception as e:
+            logger.error(f"Failed to initialize {name} engine: {e}")
+            status.state = "failed"
+            status.error = str(e)
+            success = False
+
+        status.init_ms = (time.time() - start_time) * 1000
+        logger.info(f"Engine {name} {status.state} in {status.init_ms:.0f}ms ({status.load_mode})")
+        return bool(success)
+
+    @property
+    def is_ready(self) -> bool:
+        """True once startup ran and every non-lazy engine finished initializing."""
+        return self.started and all(
+            s.state in ("ready", "failed")
+            for s in self._status.values()
+            if s.load_mode != "lazy"
+        )
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get initialization state per engine."""
+        return {
+            name: {
+                "load_mode": s.load_mode,
+                "state": s.state,
+                "init_ms": round(s.init_ms, 1) if s.init_ms is not None else None,
+                "error": s.error,
+                "initialized": bool(getattr(self._engines[name], "_initialized", False)),
+            }
+            for name, s in self._status.items()
+        }
+
+    def pending(self) -> List[str]:
+        """Engines whose initialization is still running."""
+        return [name for name, s in self._status.items() if s.state == "initializing"]
+
+    async def shutdown(self) -> None:
+        """Cancel initializations that are still running."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+
+# Global engine startup instance
+engine_startup = EngineStartup()
@@ -0,0 +1,223 @@
+"""Per-request tracing: request IDs, stage spans and Server-Timing headers."""
+
+import functools
+import inspect
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("trace")
+
+
+REQUEST_ID_HEADER = "x-request-id"
+
+
+class RequestTrace:
+    """Stage spans collected while serving one request."""
+
+    __slots__ = ("request_id", "method", "path", "start", "handler_end", "spans")
+
+    def __init__(self, request_id: str, method: str, path: str):
+        """Initialize request trace."""
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.start = time.perf_counter()
+        self.handler_end: Optional[float] = None
+        # (stage, offset from request start in ms, duration in ms)
+        self.spans: List[Tuple[str, float, float]] = []
+
+    def add(self, name: str, started: float, duration: float) -> None:
+        """Record a span from perf_counter start and duration in seconds."""
+        self.spans.append((name, (started - self.start) * 1000, duration * 1000))
+
+    def stage_totals(self) -> Dict[str, float]:
+        """Wall-clock ms per stage; overlapping (concurrent) spans count once."""
+        intervals: Dict[str, List[Tuple[float, float]]] = {}
+        for name, offset, duration in self.spans:
+            intervals.setdefault(name, []).append((offset, offset + duration))
+
+        totals: Dict[str, float] = {}
+        for name, spans in intervals.items():
+            total = 0.0
+            covered_until = float("-inf")
+            for begin, end in sorted(spans):
+                if end > covered_until:
+                    total += end - max(begin, covered_until)
+                    covered_until = end
+            totals[name] = total
+        return totals
+
+    def elapsed_ms(self) -> float:
+        """Time since the request started."""
+        return (time.perf_counter() - self.start) * 1000
+
+
+_current: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Trace of the request being served, if any."""
+    return _current.get()
+
+
+def current_request_id() -> Optional[str]:
+    """ID of the request being served, if any."""
+    trace = _current.get()
+    return trace.request_id if trace is not None else None
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a stage of the current request.
+
+    Works around awaits; a no-op outside of a traced request.
+
+    Args:
+        name: Stage name (cache, inference, cache_write, events, ...)
+    """
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, started, time.perf_counter() - started)
+
+
+def detach() -> None:
+    """
+    Stop attributing spans to the request that spawned this task.
+
+    Tasks inherit the context of their creator; shared background work
+    (e.g. a batch serving several requests) calls this first.
+    """
+    _current.set(None)
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator recording each call of a coroutine function as a span."""
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TracedRoute(APIRoute):
+    """Route class marking when the endpoint returned, to time serialization."""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        """Wrap the endpoint before FastAPI inspects it."""
+        super().__init__(path, _mark_handler_end(endpoint), **kwargs)
+
+
+def _mark_handler_end(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Record the end of an async endpoint on the current trace."""
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            trace = _current.get()
+            if trace is not None:
+                trace.handler_end = time.perf_counter()
+
+    return wrapper
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware assigning request IDs and reporting stage timings.
+
+    Responses carry X-Request-ID (the client's, if it sent one) and a
+    Server-Timing header with the wall-clock time of each stage. A
+    trace_sample_rate fraction of requests, and every request slower than
+    trace_slow_ms, is logged as a structured trace.
+    """
+
+    def __init__(self, app: Any):
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        """Trace one HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == REQUEST_ID_HEADER.encode():
+                request_id = value.decode("latin-1")[:128]
+                break
+
+        trace = RequestTrace(request_id or uuid4().hex, scope["method"], scope["path"])
+        token = _current.set(trace)
+        status = 500
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if trace.handler_end is not None:
+                    # Response model validation, encoding and rendering
+                    trace.add("serialize", trace.handler_end, time.perf_counter() - trace.handler_end)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (REQUEST_ID_HEADER.encode(), trace.request_id.encode("latin-1")),
+                    (b"server-timing", _server_timing(trace).encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            total_ms = trace.elapsed_ms()
+            if total_ms >= settings.trace_slow_ms or random.random() < settings.trace_sample_rate:
+                _log_trace(trace, status, total_ms)
+
+
+def _server_timing(trace: RequestTrace) -> str:
+    """Server-Timing header value for a trace."""
+    entries = [f"{name};dur={duration:.1f}" for name, duration in trace.stage_totals().items()]
+    entries.append(f"total;dur={trace.elapsed_ms():.1f}")
+    return ", ".join(entries)
+
+
+def _log_trace(trace: RequestTrace, status: int, total_ms: float) -> None:
+    """Emit a structured trace record."""
+    stages = {name: round(duration, 2) for name, duration in trace.stage_totals().items()}
+    logger.info(
+        f"trace {trace.request_id} {trace.method} {trace.path} {status} "
+        f"{total_ms:.1f}ms {stages}",
+        extra={"extra": {
+            "request_id": trace.request_id,
+            "method": trace.method,
+            "path": trace.path,
+            "status": status,
+            "duration_ms": round(total_ms, 2),
+            "stages": stages,
+            "spans": [
+                {"name": name, "offset_ms": round(offset, 2), "duration_ms": round(duration, 2)}
+                for name, offset, duration in trace.spans
+            ],
+        }}
+    )
@@ -2,11 +2,12 @@
 
 import time
 from typing import List, Optional
-from transformers import pipeline
-import torch
 
 from app.core.model_manager import model_manager
-from app.utils.logger import logger
+from app.core.batching import batch_scheduler
+from app.core.inference import inference_executor, InferenceTimeoutError
+from app.core.startup import engine_startup
+from app.utils.logger import get_logger
 from app.models.schemas import (
     SentimentResponse,
     Entity,
@@ -17,10 +18,14 @@ from app.models.schemas import (
     SkillGapResponse,
 )
 
+logger = get_logger("nlp")
+
 
 class NLPEngine:
     """Natural language processing engine."""
 
+    load_mode = "eager"
+
     def __init__(self):
         """Initialize NLP engine."""
         self.sentiment_pipeline = None
@@ -60,12 +65,18 @@ class NLPEngine:
         Returns:
             Sentiment analysis result
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             if self.sentiment_pipeline:
-                # Use real model
-                result = self.sentiment_pipeline(text)
-                sentiment = result[0]["label"].lower()
-                score = result[0]["score"]
+                # Use real model, batched with concurrent requests
+                result = await batch_scheduler.submit(
+                    "nlp:sentiment",
+                    text,
+                    self._batch_call(self.sentiment_pipeline)
+                )
+                sentiment = result["label"].lower()
+                score = result["score"]
             else:
                 # Mock implementation
                 sentiment, score = self._mock_sentiment(text)
@@ -81,6 +92,8 @@ class NLPEngine:
                 model="sentiment-analyzer-v1"
             )
 
+        except InferenceTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Sentiment analysis failed: {e}")
             return SentimentResponse(
@@ -104,10 +117,16 @@ class NLPEngine:
         Returns:
             Entity extraction result
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             if self.ner_pipeline:
-                # Use real model
-                entities_data = self.ner_pipeline(text)
+                # Use real model, batched with concurrent requests
+                entities_data = await batch_scheduler.submit(
+                    "nlp:ner",
+                    text,
+                    self._batch_call(self.ner_pipeline)
+                )
                 entities = [
                     Entity(
                         text=ent["word"],
@@ -126,6 +145,8 @@ class NLPEngine:
                 model="ner-model-v1"
             )
 
+        except InferenceTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Entity extraction failed: {e}")
             return EntityExtractionResponse(
@@ -147,6 +168,8 @@ class NLPEngine:
         Returns:
             Moderation result
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             # Simplified content moderation
             categories = self._calculate_moderation_scores(content)
@@ -200,13 +223,17 @@ class NLPEngine:
         Returns:
             Generated text
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             if self.generation_pipeline:
                 # Use real model
-                result = self.generation_pipeline(
+                result = await inference_executor.run(
+                    self.generation_pipeline,
                     prompt,
                     max_length=max_tokens,
-                    num_return_sequences=1
+                    num_return_sequences=1,
+                    label="nlp"
                 )
                 generated = result[0]["generated_text"]
                 tokens_used = len(generated.split())
@@ -224,6 +251,8 @@ class NLPEngine:
                 note="Privacy-preserving - runs on local infrastructure"
             )
 
+        except InferenceTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Text generation failed: {e}")
             return TextGenerationResponse(
@@ -250,6 +279,8 @@ class NLPEngine:
         Returns:
             Skill gap analysis
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             # Mock implementation - in production, use ML model
             missing_skills = self._identify_missing_skills(
@@ -288,6 +319,12 @@ class NLPEngine:
                 confidence=0.0
             )
 
+    def _batch_call(self, pipe):
+        """Wrap a pipeline as a batch function returning one result per input."""
+        def run_batch(texts: list) -> list:
+            return pipe(texts, batch_size=len(texts))
+        return run_batch
+
     # Helper methods for mock implementations
 
     def _mock_sentiment(self, text: str) -> tuple[str, float]:
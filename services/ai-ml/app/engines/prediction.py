@@ -2,7 +2,9 @@
 
 from typing import Any, Dict, List, Optional
 
-from app.utils.logger import logger
+from app.core.startup import engine_startup
+from app.utils.logger import get_logger
+from app.services.cache import cache_service
 from app.models.schemas import (
     PredictionRequest,
     PredictionResponse,
@@ -10,10 +12,14 @@ from app.models.schemas import (
     PredictionExplanation,
 )
 
+logger = get_logger("prediction")
+
 
 class PredictionEngine:
     """Predictive analytics engine."""
 
+    load_mode = "eager"
+
     def __init__(self):
         """Initialize prediction engine."""
         self._initialized = False
@@ -42,6 +48,10 @@ class PredictionEngine:
         """
         Make prediction based on model type and features.
 
+        Results are cached for prediction_cache_ttl per model type, features
+        and options; concurrent identical requests share one prediction.
+        Failed predictions are not cached.
+
         Args:
             request: Prediction request
 
@@ -49,18 +59,18 @@ class PredictionEngine:
             Prediction result
         """
         try:
-            # Route to appropriate predictor
-            if request.model_type == "health_outcome":
-                return await self._predict_health_outcome(request.features, request.options)
-            elif request.model_type == "learning_success":
-                return await self._predict_learning_success(request.features, request.options)
-            elif request.model_type == "resource_demand":
-                return await self._predict_resource_demand(request.features, request.options)
-            elif request.model_type == "outbreak_risk":
-                return await self._predict_outbreak_risk(request.features, request.options)
-            else:
-                # Default prediction
-                return await self._default_prediction(request.model_type, request.features)
+            async def compute() -> dict:
+                await engine_startup.ensure_initialized(self)
+                return (await self._route_prediction(request)).model_dump()
+
+            # Cached result, or exactly one prediction shared by concurrent callers
+            result, _ = await cache_service.get_or_compute_prediction(
+                request.model_type,
+                request.features,
+                compute,
+                request.options.model_dump() if request.options else None
+            )
+            return PredictionResponse(**result)
 
         except Exception as e:
             logger.error(f"Prediction failed: {e}")
@@ -70,6 +80,23 @@ class PredictionEngine:
                 model="error"
             )
 
+    async def _route_prediction(
+        self,
+        request: PredictionRequest
+    ) -> PredictionResponse:
+        """Route to the appropriate predictor without consulting the cache."""
+        if request.model_type == "health_outcome":
+            return await self._predict_health_outcome(request.features, request.options)
+        elif request.model_type == "learning_success":
+            return await self._predict_learning_success(request.features, request.options)
+        elif request.model_type == "resource_demand":
+            return await self._predict_resource_demand(request.features, request.options)
+        elif request.model_type == "outbreak_risk":
+            return await self._predict_outbreak_risk(request.features, request.options)
+        else:
+            # Default prediction
+            return await self._default_prediction(request.model_type, request.features)
+
     async def _predict_health_outcome(
         self,
         features: Dict[str, Any],
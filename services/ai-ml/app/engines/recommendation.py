@@ -2,7 +2,8 @@
 
 from typing import Any, Dict, List, Optional
 
-from app.utils.logger import logger
+from app.core.startup import engine_startup
+from app.utils.logger import get_logger
 from app.models.schemas import (
     RecommendationRequest,
     Recommendation,
@@ -11,10 +12,14 @@ from app.models.schemas import (
 )
 from app.services.cache import cache_service
 
+logger = get_logger("recommendation")
+
 
 class RecommendationEngine:
     """Personalized recommendation engine."""
 
+    load_mode = "eager"
+
     def __init__(self):
         """Initialize recommendation engine."""
         self._initialized = False
@@ -50,48 +55,21 @@ class RecommendationEngine:
             Recommendations
         """
         try:
-            # Check cache
-            cached = await cache_service.get_recommendation(
-                request.user_id,
-                request.context,
-                request.filters
-            )
-
-            if cached:
-                return RecommendationResponse(**cached)
-
-            # Generate recommendations based on context
-            if request.context == "courses":
-                recommendations = await self._recommend_courses(request)
-            elif request.context == "jobs":
-                recommendations = await self._recommend_jobs(request)
-            elif request.context == "providers":
-                recommendations = await self._recommend_providers(request)
-            elif request.context == "learning_path":
-                recommendations = await self._recommend_learning_path(request)
-            else:
-                recommendations = await self._default_recommendations(request)
-
-            # Create response
-            personalization = Personalization(
-                user_id=request.user_id,
-                profile_features=["skill_profile", "learning_history", "career_goals"],
-                model=f"{request.context}-recommender-v1"
-            )
-
-            response = RecommendationResponse(
-                recommendations=recommendations[:request.limit],
-                personalization=personalization
-            )
+            async def compute() -> dict:
+                await engine_startup.ensure_initialized(self)
+                return (await self._generate(request)).model_dump()
 
-            # Cache result
-            await cache_service.set_recommendation(
+            # Cached result, or exactly one generation shared by concurrent callers
+            result, _ = await cache_service.get_or_compute_recommendation(
                 request.user_id,
                 request.context,
-                response.model_dump(),
+                compute,
                 request.filters
             )
 
+            # The cache key ignores limit, so entries hold the full list
+            response = RecommendationResponse(**result)
+            response.recommendations = response.recommendations[:request.limit]
             return response
 
         except Exception as e:
@@ -105,6 +83,35 @@ class RecommendationEngine:
                 )
             )
 
+    async def _generate(
+        self,
+        request: RecommendationRequest
+    ) -> RecommendationResponse:
+        """Generate untruncated recommendations without consulting the cache."""
+        # Generate recommendations based on context
+        if request.context == "courses":
+            recommendations = await self._recommend_courses(request)
+        elif request.context == "jobs":
+            recommendations = await self._recommend_jobs(request)
+        elif request.context == "providers":
+            recommendations = await self._recommend_providers(request)
+        elif request.context == "learning_path":
+            recommendations = await self._recommend_learning_path(request)
+        else:
+            recommendations = await self._default_recommendations(request)
+
+        # Create response
+        personalization = Personalization(
+            user_id=request.user_id,
+            profile_features=["skill_profile", "learning_history", "career_goals"],
+            model=f"{request.context}-recommender-v1"
+        )
+
+        return RecommendationResponse(
+            recommendations=recommendations,
+            personalization=personalization
+        )
+
     async def _recommend_courses(
         self,
         request: RecommendationRequest
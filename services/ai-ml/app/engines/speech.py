@@ -6,16 +6,22 @@ from fastapi import UploadFile
 import io
 
 from app.core.model_manager import model_manager
-from app.utils.logger import logger
+from app.core.inference import inference_executor, InferenceTimeoutError
+from app.core.startup import engine_startup
+from app.utils.logger import get_logger
 from app.models.schemas import (
     SpeechToTextResponse,
     WordTimestamp,
 )
 
+logger = get_logger("speech")
+
 
 class SpeechEngine:
     """Speech recognition and transcription engine."""
 
+    load_mode = "eager"
+
     def __init__(self):
         """Initialize speech engine."""
         self.whisper_pipeline = None
@@ -51,15 +57,19 @@ class SpeechEngine:
         Returns:
             Transcription result
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             # Read audio file
             contents = await audio.read()
 
             if self.whisper_pipeline:
                 # Use real Whisper model
-                result = self.whisper_pipeline(
+                result = await inference_executor.run(
+                    self.whisper_pipeline,
                     contents,
-                    return_timestamps="word"
+                    return_timestamps="word",
+                    label="speech"
                 )
 
                 transcription = result["text"]
@@ -98,6 +108,8 @@ class SpeechEngine:
                 model="whisper-large-v2"
             )
 
+        except InferenceTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Speech transcription failed: {e}")
             return SpeechToTextResponse(
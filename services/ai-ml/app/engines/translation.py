@@ -1,20 +1,55 @@
 """Translation engine using NLLB and other multilingual models."""
 
+import asyncio
 import time
-from typing import Optional
-from transformers import pipeline
-import torch
+from typing import Dict, List, Optional, Tuple
 
+from app.core.config import settings
 from app.core.model_manager import model_manager
+from app.core.batching import batch_scheduler
+from app.core.inference import InferenceTimeoutError
+from app.core.startup import engine_startup
 from app.services.cache import cache_service
 from app.services.events import event_publisher
-from app.utils.logger import logger
-from app.models.schemas import TranslationRequest, TranslationResponse
+from app.utils.logger import get_logger
+from app.utils.langid import language_detector
+from app.utils.segmentation import Segment, split_segments, join_segments
+from app.models.schemas import (
+    TranslationRequest,
+    TranslationResponse,
+    BatchTranslationRequest,
+    BatchTranslationResponse,
+)
+
+logger = get_logger("translation")
+
+# ISO 639-1 -> NLLB-200 (FLORES-200) codes for every language in get_supported_languages()
+NLLB_CODES: Dict[str, str] = {
+    "en": "eng_Latn", "es": "spa_Latn", "fr": "fra_Latn", "de": "deu_Latn",
+    "it": "ita_Latn", "pt": "por_Latn", "ru": "rus_Cyrl", "zh": "zho_Hans",
+    "ja": "jpn_Jpan", "ko": "kor_Hang", "ar": "arb_Arab", "hi": "hin_Deva",
+    "sw": "swh_Latn", "yo": "yor_Latn", "ig": "ibo_Latn", "am": "amh_Ethi",
+    "ha": "hau_Latn", "so": "som_Latn", "zu": "zul_Latn", "xh": "xho_Latn",
+    "sn": "sna_Latn", "ny": "nya_Latn", "rw": "kin_Latn", "st": "sot_Latn",
+    "tn": "tsn_Latn", "vi": "vie_Latn", "th": "tha_Thai", "id": "ind_Latn",
+    "ms": "zsm_Latn", "tl": "tgl_Latn", "bn": "ben_Beng", "ur": "urd_Arab",
+    "te": "tel_Telu", "mr": "mar_Deva", "ta": "tam_Taml", "gu": "guj_Gujr",
+    "kn": "kan_Knda", "ml": "mal_Mlym", "ne": "npi_Deva", "si": "sin_Sinh",
+    "pl": "pol_Latn", "uk": "ukr_Cyrl", "cs": "ces_Latn", "ro": "ron_Latn",
+    "el": "ell_Grek", "tr": "tur_Latn", "fa": "pes_Arab", "he": "heb_Hebr",
+    "nl": "nld_Latn", "sv": "swe_Latn",
+}
 
 
 class TranslationEngine:
     """Multilingual translation using open-source models."""
 
+    # Source language assumed when source_lang="auto" and detection fails
+    FALLBACK_SOURCE_LANG = "en"
+
+    # NLLB takes long to load; start it at startup without blocking readiness
+    load_mode = "background"
+
     def __init__(self):
         """Initialize translation engine."""
         self.model_name = "facebook/nllb-200-distilled-600M"
@@ -24,11 +59,12 @@ class TranslationEngine:
     async def initialize(self) -> bool:
         """Initialize the translation engine."""
         try:
-            # Load translation model
+            # Load translation model (pinned: the engine keeps a pipeline reference)
             success = await model_manager.load_model(
                 self.model_name,
                 model_type="pipeline",
-                version="latest"
+                version="latest",
+                pinned=True
             )
 
             if success:
@@ -59,77 +95,40 @@ class TranslationEngine:
         Returns:
             Translation response
         """
-        start_time = time.time()
-
-        # Check cache first
-        cached_result = await cache_service.get_translation(
-            request.text,
-            request.source_lang,
-            request.target_lang
-        )
-
-        if cached_result:
-            logger.info(f"Translation cache hit for {request.source_lang} -> {request.target_lang}")
-            return TranslationResponse(**cached_result, cached=True)
-
-        # Perform translation
-        try:
-            if self._initialized and self.pipeline:
-                # Use NLLB model
-                translated = await self._translate_with_nllb(
-                    request.text,
-                    request.source_lang,
-                    request.target_lang
-                )
-                model_used = self.model_name
-                confidence = 0.92  # NLLB typically has high confidence
-            else:
-                # Fallback: simple mock translation for development
-                translated = self._mock_translate(
-                    request.text,
-                    request.source_lang,
-                    request.target_lang
-                )
-                model_used = "mock-translator"
-                confidence = 0.75
+        source_lang, detected_lang = self._resolve_source(request.text, request.source_lang)
+        if source_lang != request.source_lang:
+            request = request.model_copy(update={"source_lang": source_lang})
 
-            inference_time = (time.time() - start_time) * 1000
-
-            response = TranslationResponse(
-                original_text=request.text,
-                translated_text=translated,
-                source_lang=request.source_lang,
-                target_lang=request.target_lang,
-                detected_lang=request.source_lang,  # TODO: Add language detection
-                confidence=confidence,
-                model=model_used,
-                cached=False
-            )
+        async def refresh() -> dict:
+            response = await self._run_translation(request, detected_lang)
+            return response.model_dump()
 
-            # Cache the result
-            await cache_service.set_translation(
+        async def compute() -> dict:
+            result = await refresh()
+            await event_publisher.publish_translation_completed(
                 request.text,
                 request.source_lang,
                 request.target_lang,
-                response.model_dump()
+                result["translated_text"],
+                user_id
             )
+            return result
 
-            # Publish event
-            await event_publisher.publish_translation_completed(
+        # Cached result, or exactly one translation shared by concurrent callers
+        try:
+            result, cached = await cache_service.get_or_compute_translation(
                 request.text,
                 request.source_lang,
                 request.target_lang,
-                translated,
-                user_id
-            )
-
-            logger.info(
-                f"Translation completed in {inference_time:.0f}ms "
-                f"({request.source_lang} -> {request.target_lang})"
+                compute,
+                preserve_formatting=(
+                    request.options.preserve_formatting if request.options else True
+                ),
+                # Background refreshes of stale entries publish no events
+                refresh=refresh
             )
-
-            return response
-
+        except InferenceTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Translation failed: {e}")
             # Return error or fallback
@@ -138,11 +137,377 @@ class TranslationEngine:
                 translated_text=f"[Translation error: {str(e)}]",
                 source_lang=request.source_lang,
                 target_lang=request.target_lang,
+                detected_lang=detected_lang,
                 confidence=0.0,
                 model="error",
                 cached=False
             )
 
+        if cached:
+            logger.info(f"Translation cache hit for {request.source_lang} -> {request.target_lang}")
+
+        return TranslationResponse(**{**result, "cached": cached})
+
+    async def translate_batch(
+        self,
+        request: BatchTranslationRequest,
+        user_id: Optional[str] = None
+    ) -> BatchTranslationResponse:
+        """
+        Translate many texts into one or more target languages.
+
+        Texts are split into sentence segments that are cached and
+        translated independently (see _translate_segments). With
+        source_lang="auto" each text is routed by its detected language.
+
+        Args:
+            request: Batch translation request
+            user_id: Optional user ID for tracking
+
+        Returns:
+            Results ordered by text, then target language
+        """
+        start_time = time.time()
+        preserve_formatting = request.options.preserve_formatting if request.options else True
+
+        await engine_startup.ensure_initialized(self)
+        splits = {text: self._split(text, preserve_formatting) for text in request.texts}
+        sources = await self._resolve_sources(request.texts, request.source_lang)
+
+        # One segment pass per source language
+        by_source: Dict[str, List[str]] = {}
+        for text, (source_lang, _) in sources.items():
+            by_source.setdefault(source_lang, []).append(text)
+        source_langs = list(by_source)
+        outcomes = await asyncio.gather(*(
+            self._translate_segments(
+                [
+                    (segment.text, target)
+                    for text in by_source[source_lang]
+                    for segment in splits[text][1]
+                    for target in request.target_langs
+                ],
+                source_lang
+            )
+            for source_lang in source_langs
+        ))
+        segment_results = dict(zip(source_langs, outcomes))
+
+        results: List[TranslationResponse] = []
+        for text in request.texts:
+            leading, segments = splits[text]
+            source_lang, detected_lang = sources[text]
+            translated, errors = segment_results[source_lang]
+            for target in request.target_langs:
+                try:
+                    response = self._assemble(
+                        text, source_lang, target, leading, segments, translated, errors,
+                        detected_lang
+                    )
+                except InferenceTimeoutError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Batch translation to {target} failed: {e}")
+                    response = TranslationResponse(
+                        original_text=text,
+                        translated_text=f"[Translation error: {str(e)}]",
+                        source_lang=source_lang,
+                        target_lang=target,
+                        detected_lang=detected_lang,
+                        confidence=0.0,
+                        model="error",
+                        cached=False
+                    )
+                results.append(response)
+
+        await asyncio.gather(*(
+            event_publisher.publish_translation_completed(
+                r.original_text, r.source_lang, r.target_lang, r.translated_text, user_id
+            )
+            for r in results
+            if not r.cached and r.model != "error"
+        ))
+
+        cached_count = sum(1 for r in results if r.cached)
+        logger.info(
+            f"Batch translation of {len(results)} items completed in "
+            f"{(time.time() - start_time) * 1000:.0f}ms ({cached_count} cached)"
+        )
+
+        return BatchTranslationResponse(
+            results=results,
+            total=len(results),
+            cached_count=cached_count
+        )
+
+    def _resolve_source(self, text: str, source_lang: str) -> Tuple[str, Optional[str]]:
+        """
+        Resolve source_lang="auto" by detecting the language of text.
+
+        Detections below translation_detect_min_confidence, or of languages
+        NLLB has no code for, fall back to FALLBACK_SOURCE_LANG. Explicit
+        source languages are used as given, without running detection.
+
+        Returns:
+            Tuple of (source language to translate from, detected language)
+        """
+        if source_lang != "auto":
+            return source_lang, None
+
+        detected_lang, confidence = language_detector.detect(text)
+        if (
+            detected_lang is None
+            or detected_lang not in NLLB_CODES
+            or confidence < settings.translation_detect_min_confidence
+        ):
+            logger.debug(
+                f"Could not detect source language ({detected_lang}, {confidence:.2f}), "
+                f"assuming {self.FALLBACK_SOURCE_LANG}"
+            )
+            return self.FALLBACK_SOURCE_LANG, None
+
+        logger.debug(f"Detected source language {detected_lang} ({confidence:.2f})")
+        return detected_lang, detected_lang
+
+    async def _resolve_sources(
+        self,
+        texts: List[str],
+        source_lang: str
+    ) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Resolve the source language of many texts, detecting off the event loop."""
+        if source_lang != "auto":
+            return {text: (source_lang, None) for text in texts}
+
+        # Up to 500 texts at ~0.6ms each would stall every other request
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: {text: self._resolve_source(text, source_lang) for text in texts}
+        )
+
+    def _split(self, text: str, preserve_formatting: bool = True) -> Tuple[str, List[Segment]]:
+        """Segment text for the model; mock translation keeps the text whole."""
+        if self._initialized and self.pipeline:
+            leading, segments = split_segments(
+                text,
+                settings.translation_segment_max_chars,
+                preserve_formatting
+            )
+            if segments:
+                return leading, segments
+        return "", [Segment(text, "")]
+
+    async def _translate_segments(
+        self,
+        pairs: List[Tuple[str, str]],
+        source_lang: str
+    ) -> Tuple[Dict[Tuple[str, str], TranslationResponse], Dict[str, Exception]]:
+        """
+        Translate (segment, target_lang) pairs through the per-segment cache.
+
+        Cached segments are resolved with a single MGET; only unique misses
+        are translated, in batched model passes per target language. Stale
+        cached segments are served and retranslated in the background.
+
+        Returns:
+            Tuple of (responses keyed by pair, errors keyed by target language)
+        """
+        pairs = list(dict.fromkeys(pairs))
+        cached_entries = await cache_service.get_translations(
+            [(text, source_lang, target) for text, target in pairs],
+            refresh=self._refresh_segments
+        )
+
+        translated: Dict[Tuple[str, str], TranslationResponse] = {}
+        misses: Dict[str, List[str]] = {}
+        for (text, target), entry in zip(pairs, cached_entries):
+            if entry is not None:
+                translated[(text, target)] = TranslationResponse(**{**entry, "cached": True})
+            else:
+                misses.setdefault(target, []).append(text)
+
+        # Translate misses concurrently per target language
+        targets = list(misses)
+        outcomes = await asyncio.gather(
+            *(self._translate_texts(misses[t], source_lang, t) for t in targets),
+            return_exceptions=True
+        )
+
+        errors: Dict[str, Exception] = {}
+        to_cache = []
+        for target, outcome in zip(targets, outcomes):
+            if isinstance(outcome, BaseException):
+                errors[target] = outcome
+                continue
+            texts, model_used, confidence = outcome
+            for text, translation in zip(misses[target], texts):
+                response = TranslationResponse(
+                    original_text=text,
+                    translated_text=translation,
+                    source_lang=source_lang,
+                    target_lang=target,
+                    confidence=confidence,
+                    model=model_used,
+                    cached=False
+                )
+                translated[(text, target)] = response
+                to_cache.append((text, source_lang, target, response.model_dump()))
+
+        if to_cache:
+            await cache_service.set_translations(to_cache)
+
+        return translated, errors
+
+    async def _refresh_segments(
+        self,
+        segments: List[Tuple[str, str, str]]
+    ) -> List[Optional[dict]]:
+        """
+        Retranslate stale cached (text, source_lang, target_lang) segments.
+
+        Returns:
+            Response dicts in input order; None for language pairs that failed
+        """
+        pairs: Dict[Tuple[str, str], List[str]] = {}
+        for text, source_lang, target_lang in segments:
+            pairs.setdefault((source_lang, target_lang), []).append(text)
+
+        outcomes = await asyncio.gather(
+            *(self._translate_texts(texts, *pair) for pair, texts in pairs.items()),
+            return_exceptions=True
+        )
+
+        refreshed: Dict[Tuple[str, str, str], dict] = {}
+        for (source_lang, target_lang), outcome in zip(pairs, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    f"Segment refresh failed ({source_lang} -> {target_lang}): {outcome}"
+                )
+                continue
+            texts, model_used, confidence = outcome
+            for text, translation in zip(pairs[source_lang, target_lang], texts):
+                refreshed[text, source_lang, target_lang] = TranslationResponse(
+                    original_text=text,
+                    translated_text=translation,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    confidence=confidence,
+                    model=model_used,
+                    cached=False
+                ).model_dump()
+
+        return [refreshed.get(segment) for segment in segments]
+
+    def _assemble(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        leading: str,
+        segments: List[Segment],
+        translated: Dict[Tuple[str, str], TranslationResponse],
+        errors: Dict[str, Exception],
+        detected_lang: Optional[str] = None
+    ) -> TranslationResponse:
+        """Reassemble segment translations into a document response."""
+        if target_lang in errors:
+            raise errors[target_lang]
+
+        parts = [translated[(segment.text, target_lang)] for segment in segments]
+        return TranslationResponse(
+            original_text=text,
+            translated_text=join_segments(leading, segments, [p.translated_text for p in parts]),
+            source_lang=source_lang,
+            target_lang=target_lang,
+            detected_lang=detected_lang,
+            confidence=sum(p.confidence for p in parts) / len(parts),
+            model=parts[0].model,
+            cached=all(p.cached for p in parts)
+        )
+
+    async def _translate_texts(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> Tuple[List[str], str, float]:
+        """
+        Translate texts for one language pair without consulting the cache.
+
+        Returns:
+            Tuple of (translations in input order, model name, confidence)
+        """
+        if self._initialized and self.pipeline:
+            # Concurrent submissions are coalesced into batches by the scheduler
+            translations = await asyncio.gather(*(
+                self._translate_with_nllb(text, source_lang, target_lang)
+                for text in texts
+            ))
+            return list(translations), self.model_name, 0.92
+
+        translations = [
+            self._mock_translate(text, source_lang, target_lang)
+            for text in texts
+        ]
+        return translations, "mock-translator", 0.75
+
+    async def _run_translation(
+        self,
+        request: TranslationRequest,
+        detected_lang: Optional[str] = None
+    ) -> TranslationResponse:
+        """
+        Translate without consulting the document cache; raises on failure.
+
+        Publishes no event; translate publishes one for each computed result.
+        """
+        await engine_startup.ensure_initialized(self)
+
+        start_time = time.time()
+        preserve_formatting = request.options.preserve_formatting if request.options else True
+
+        leading, segments = self._split(request.text, preserve_formatting)
+        if len(segments) == 1 and segments[0].text == request.text:
+            # Single segment: the document-level cache entry is the segment entry
+            texts, model_used, confidence = await self._translate_texts(
+                [request.text],
+                request.source_lang,
+                request.target_lang
+            )
+            translated = texts[0]
+        else:
+            # Segments are cached independently and translated as one batch
+            parts, errors = await self._translate_segments(
+                [(segment.text, request.target_lang) for segment in segments],
+                request.source_lang
+            )
+            document = self._assemble(
+                request.text, request.source_lang, request.target_lang,
+                leading, segments, parts, errors, detected_lang
+            )
+            translated, model_used, confidence = (
+                document.translated_text, document.model, document.confidence
+            )
+
+        inference_time = (time.time() - start_time) * 1000
+
+        response = TranslationResponse(
+            original_text=request.text,
+            translated_text=translated,
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+            detected_lang=detected_lang,
+            confidence=confidence,
+            model=model_used,
+            cached=False
+        )
+
+        logger.info(
+            f"Translation completed in {inference_time:.0f}ms "
+            f"({request.source_lang} -> {request.target_lang}, {len(segments)} segments)"
+        )
+
+        return response
+
     async def _translate_with_nllb(
         self,
         text: str,
@@ -158,12 +523,22 @@ class TranslationEngine:
             if not self.pipeline:
                 raise ValueError("Pipeline not initialized")
 
-            # Perform translation
-            result = self.pipeline(
+            pipe = self.pipeline
+
+            def run_batch(texts: list) -> list:
+                return pipe(
+                    texts,
+                    src_lang=src_code,
+                    tgt_lang=tgt_code,
+                    max_length=400,
+                    batch_size=len(texts)
+                )
+
+            # Perform translation, batched with concurrent requests for this pair
+            result = await batch_scheduler.submit(
+                f"translation:{self.model_name}:{src_code}:{tgt_code}",
                 text,
-                src_lang=src_code,
-                tgt_lang=tgt_code,
-                max_length=400
+                run_batch
             )
 
             if isinstance(result, list) and len(result) > 0:
@@ -180,29 +555,10 @@ class TranslationEngine:
     def _get_nllb_code(self, lang_code: str) -> str:
         """Convert ISO language code to NLLB format."""
         # NLLB uses format like "eng_Latn" for English
-        nllb_mapping = {
-            "en": "eng_Latn",
-            "es": "spa_Latn",
-            "fr": "fra_Latn",
-            "sw": "swh_Latn",
-            "ar": "arb_Arab",
-            "zh": "zho_Hans",
-            "hi": "hin_Deva",
-            "pt": "por_Latn",
-            "de": "deu_Latn",
-            "ja": "jpn_Jpan",
-            "ko": "kor_Hang",
-            "ru": "rus_Cyrl",
-            "it": "ita_Latn",
-            "tr": "tur_Latn",
-            "vi": "vie_Latn",
-            "th": "tha_Thai",
-            "id": "ind_Latn",
-            "pl": "pol_Latn",
-            "uk": "ukr_Cyrl",
-            "ro": "ron_Latn",
-        }
-        return nllb_mapping.get(lang_code, f"{lang_code}_Latn")
+        try:
+            return NLLB_CODES[lang_code]
+        except KeyError:
+            raise ValueError(f"Unsupported language for NLLB: {lang_code}")
 
     def _mock_translate(
         self,
@@ -2,22 +2,29 @@
 
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from fastapi import UploadFile
 import io
-from PIL import Image
 
-from app.utils.logger import logger
+if TYPE_CHECKING:
+    from PIL import Image
+
+from app.core.startup import engine_startup
+from app.utils.logger import get_logger
 from app.models.schemas import (
     ImageAnalysisResponse,
     Finding,
     OCRResponse,
 )
 
+logger = get_logger("vision")
+
 
 class ComputerVisionEngine:
     """Computer vision for OCR and image analysis."""
 
+    load_mode = "eager"
+
     def __init__(self):
         """Initialize computer vision engine."""
         self._initialized = False
@@ -51,10 +58,12 @@ class ComputerVisionEngine:
         Returns:
             OCR result
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             # Read image
             contents = await file.read()
-            image = Image.open(io.BytesIO(contents))
+            image = self._open_image(contents)
 
             # In production, use Tesseract or PaddleOCR
             # For now, mock implementation
@@ -95,10 +104,12 @@ class ComputerVisionEngine:
         Returns:
             Image analysis result
         """
+        await engine_startup.ensure_initialized(self)
+
         try:
             # Read image
             contents = await file.read()
-            image = Image.open(io.BytesIO(contents))
+            image = self._open_image(contents)
 
             # Mock implementations for different analysis types
             if analysis_type == "medical":
@@ -127,7 +138,14 @@ class ComputerVisionEngine:
                 model="error"
             )
 
-    async def _analyze_medical(self, image: Image.Image) -> List[Finding]:
+    @staticmethod
+    def _open_image(contents: bytes) -> "Image.Image":
+        """Decode image bytes (Pillow is imported on first use)."""
+        from PIL import Image
+
+        return Image.open(io.BytesIO(contents))
+
+    async def _analyze_medical(self, image: "Image.Image") -> List[Finding]:
         """Analyze medical image."""
         # Mock medical analysis
         return [
@@ -139,7 +157,7 @@ class ComputerVisionEngine:
             )
         ]
 
-    async def _analyze_general(self, image: Image.Image) -> List[Finding]:
+    async def _analyze_general(self, image: "Image.Image") -> List[Finding]:
         """General image analysis."""
         # Get image info
         width, height = image.size
@@ -154,7 +172,7 @@ class ComputerVisionEngine:
             )
         ]
 
-    async def _generate_description(self, image: Image.Image) -> List[Finding]:
+    async def _generate_description(self, image: "Image.Image") -> List[Finding]:
         """Generate accessibility description."""
         return [
             Finding(
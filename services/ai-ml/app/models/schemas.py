@@ -1,5 +1,6 @@
 """Pydantic schemas for API requests and responses."""
 
+import re
 from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 
@@ -17,7 +18,7 @@ class TranslationOptions(BaseModel):
 class TranslationRequest(BaseModel):
     """Request for translation."""
     text: str = Field(..., min_length=1, max_length=10000)
-    source_lang: str = Field(..., pattern=r"^[a-z]{2,3}$")
+    source_lang: str = Field(..., pattern=r"^([a-z]{2,3}|auto)$")
     target_lang: str = Field(..., pattern=r"^[a-z]{2,3}$")
     options: Optional[TranslationOptions] = None
 
@@ -34,6 +35,39 @@ class TranslationResponse(BaseModel):
     cached: bool
 
 
+class BatchTranslationRequest(BaseModel):
+    """Request for translating many texts into one or more languages."""
+    texts: List[str] = Field(..., min_length=1, max_length=500)
+    source_lang: str = Field(..., pattern=r"^([a-z]{2,3}|auto)$")
+    target_langs: List[str] = Field(..., min_length=1, max_length=20)
+    options: Optional[TranslationOptions] = None
+
+    @field_validator("texts")
+    @classmethod
+    def validate_texts(cls, texts: List[str]) -> List[str]:
+        """Apply the single-request text length limits to every text."""
+        for text in texts:
+            if not 1 <= len(text) <= 10000:
+                raise ValueError("each text must be between 1 and 10000 characters")
+        return texts
+
+    @field_validator("target_langs")
+    @classmethod
+    def validate_target_langs(cls, target_langs: List[str]) -> List[str]:
+        """Validate target language codes."""
+        for lang in target_langs:
+            if not re.fullmatch(r"[a-z]{2,3}", lang):
+                raise ValueError(f"invalid language code: {lang}")
+        return target_langs
+
+
+class BatchTranslationResponse(BaseModel):
+    """Response for batch translation, ordered by text then target language."""
+    results: List[TranslationResponse]
+    total: int
+    cached_count: int
+
+
 # ============================================================================
 # Prediction Models
 # ============================================================================
@@ -1,21 +1,99 @@
 """Redis caching service for AI/ML inference results."""
 
+import asyncio
 import json
 import hashlib
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import redis.asyncio as aioredis
 
 from app.core.config import settings
+from app.core.tracing import detach, traced
 from app.utils.logger import logger
 
 
+# Async producer of a cacheable (JSON-serializable) value
+ComputeFn = Callable[[], Awaitable[Any]]
+
+# Retranslates (text, source_lang, target_lang) segments; None where it failed
+SegmentRefreshFn = Callable[[List[Tuple[str, str, str]]], Awaitable[List[Optional[dict]]]]
+
+
+class LocalCache:
+    """Size- and TTL-bounded in-process LRU cache."""
+
+    def __init__(self, max_entries: int):
+        """Initialize local cache."""
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value if present and not expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value, evicting the least recently used entries beyond max_entries."""
+        self._data[key] = (time.time() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        self._data.pop(key, None)
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Remove keys matching a Redis-style glob pattern."""
+        keys = [key for key in self._data if fnmatchcase(key, pattern)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class CacheService:
-    """Redis-based caching for inference results."""
+    """Redis-based caching for inference results, with an optional in-process L1."""
 
     def __init__(self):
         """Initialize cache service."""
         self.redis: Optional[aioredis.Redis] = None
         self._connected = False
+        self.local: Optional[LocalCache] = (
+            LocalCache(settings.local_cache_max_entries)
+            if settings.enable_local_cache else None
+        )
+        self._prefix_ttls: Dict[str, int] = {
+            "translation": settings.translation_cache_ttl,
+            "prediction": settings.prediction_cache_ttl,
+            "recommendation": settings.recommendation_cache_ttl,
+        }
+        self.stats: Dict[str, int] = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "errors": 0,
+            "stale_hits": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+        }
+        # prefix -> {l1_hits, l2_hits, misses, errors}
+        self.prefix_stats: Dict[str, Dict[str, int]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
 
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -50,41 +128,147 @@ class CacheService:
         hash_value = hashlib.sha256(data.encode()).hexdigest()[:16]
         return f"{settings.service_name}:{prefix}:{hash_value}"
 
+    @staticmethod
+    def _prefix_of(key: str) -> str:
+        """Prefix part of a key built by _make_key."""
+        return key.rsplit(":", 2)[-2] if key.count(":") >= 2 else ""
+
+    def _count(self, stat: str, key: str, n: int = 1) -> None:
+        """Increment a lookup statistic, overall and for the key's prefix."""
+        self.stats[stat] += n
+        prefix = self._prefix_of(key)
+        counts = self.prefix_stats.get(prefix)
+        if counts is None:
+            counts = self.prefix_stats[prefix] = {
+                "l1_hits": 0, "l2_hits": 0, "misses": 0, "errors": 0
+            }
+        counts[stat] += n
+
+    def _local_ttl(self, key: str, ttl: Optional[int] = None) -> int:
+        """L1 TTL: the entry's (or its prefix's) TTL, capped by local_cache_ttl_seconds."""
+        if ttl is None:
+            ttl = self._prefix_ttls.get(self._prefix_of(key), settings.redis_cache_ttl_seconds)
+        return min(ttl, settings.local_cache_ttl_seconds)
+
+    @traced("cache")
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
+        """Get value from cache (L1 first, then Redis)."""
+        if self.local is not None:
+            value = self.local.get(key)
+            if value is not None:
+                self._count("l1_hits", key)
+                return value
+
         if not self._connected or not self.redis:
+            self._count("misses", key)
             return None
 
         try:
             value = await self.redis.get(key)
             if value:
-                return json.loads(value)
+                result = json.loads(value)
+                self._count("l2_hits", key)
+                if self.local is not None:
+                    self.local.set(key, result, self._local_ttl(key))
+                return result
+            self._count("misses", key)
             return None
         except Exception as e:
+            self._count("errors", key)
             logger.warning(f"Cache get error for key {key}: {e}")
             return None
 
+    @traced("cache_write")
     async def set(
         self,
         key: str,
         value: Any,
         ttl: Optional[int] = None
     ) -> bool:
-        """Set value in cache with optional TTL."""
+        """Set value in cache with optional TTL (write-through L1 and Redis)."""
+        if self.local is not None:
+            self.local.set(key, value, self._local_ttl(key, ttl))
+
         if not self._connected or not self.redis:
             return False
 
         try:
             ttl = ttl or settings.redis_cache_ttl_seconds
             serialized = json.dumps(value)
-            await self.redis.setex(key, ttl, serialized)
+            await self.redis.set(key, serialized, ex=ttl)
             return True
         except Exception as e:
+            self._count("errors", key)
             logger.warning(f"Cache set error for key {key}: {e}")
             return False
 
+    @traced("cache")
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get many values: L1 first, then a single Redis MGET for the rest."""
+        results: List[Optional[Any]] = [None] * len(keys)
+        remote: List[int] = []
+
+        for i, key in enumerate(keys):
+            value = self.local.get(key) if self.local is not None else None
+            if value is not None:
+                self._count("l1_hits", key)
+                results[i] = value
+            else:
+                remote.append(i)
+
+        if not remote:
+            return results
+
+        if not self._connected or not self.redis:
+            for i in remote:
+                self._count("misses", keys[i])
+            return results
+
+        try:
+            values = await self.redis.mget([keys[i] for i in remote])
+        except Exception as e:
+            self._count("errors", keys[remote[0]])
+            logger.warning(f"Cache mget error for {len(remote)} keys: {e}")
+            return results
+
+        for i, value in zip(remote, values):
+            if value:
+                results[i] = json.loads(value)
+                self._count("l2_hits", keys[i])
+                if self.local is not None:
+                    self.local.set(keys[i], results[i], self._local_ttl(keys[i]))
+            else:
+                self._count("misses", keys[i])
+
+        return results
+
+    @traced("cache_write")
+    async def mset(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set many values with one pipelined Redis round trip."""
+        if self.local is not None:
+            for key, value in items.items():
+                self.local.set(key, value, self._local_ttl(key, ttl))
+
+        if not items or not self._connected or not self.redis:
+            return False
+
+        try:
+            ttl = ttl or settings.redis_cache_ttl_seconds
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, json.dumps(value), ex=ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            self._count("errors", next(iter(items)))
+            logger.warning(f"Cache mset error for {len(items)} keys: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
+        if self.local is not None:
+            self.local.delete(key)
+
         if not self._connected or not self.redis:
             return False
 
@@ -96,7 +280,15 @@ class CacheService:
             return False
 
     async def invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate all keys matching pattern."""
+        """
+        Invalidate all keys matching pattern.
+
+        Clears this process's L1 as well; L1 entries in other processes
+        expire within local_cache_ttl_seconds.
+        """
+        if self.local is not None:
+            self.local.invalidate_pattern(pattern)
+
         if not self._connected or not self.redis:
             return 0
 
@@ -119,6 +311,100 @@ class CacheService:
             logger.warning(f"Cache invalidation error for pattern {pattern}: {e}")
             return 0
 
+    def _wrap(self, value: Any, ttl: int) -> Dict[str, Any]:
+        """Wrap a value with its soft expiry for stale-while-revalidate."""
+        return {
+            "__v": value,
+            "__fresh_until": time.time() + ttl * settings.cache_soft_ttl_ratio,
+        }
+
+    def _unwrap(self, entry: Any) -> Tuple[Any, Optional[float]]:
+        """Split a cached entry into (value, fresh_until); legacy entries never go stale."""
+        if isinstance(entry, dict) and "__fresh_until" in entry:
+            return entry["__v"], entry["__fresh_until"]
+        return entry, None
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: ComputeFn,
+        ttl: int,
+        refresh: Optional[ComputeFn] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Get a value, computing it at most once per key across concurrent callers.
+
+        Entries past their soft TTL (ttl * cache_soft_ttl_ratio) are returned
+        as-is while a single background task recomputes them; Redis expires
+        them at the hard TTL. Failed computations are not cached.
+
+        Args:
+            key: Cache key (from _make_key)
+            compute: Coroutine function producing the value
+            ttl: Hard TTL in seconds
+            refresh: Coroutine function used for background recomputation,
+                when it must not repeat side effects of compute (defaults to
+                compute)
+
+        Returns:
+            Tuple of (value, served_from_cache)
+        """
+        entry = await self.get(key)
+        if entry is not None:
+            value, fresh_until = self._unwrap(entry)
+            if fresh_until is not None and time.time() >= fresh_until:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, refresh or compute, ttl)
+            return value, True
+
+        return await self._compute_once(key, compute, ttl), False
+
+    async def _compute_once(self, key: str, compute: ComputeFn, ttl: int) -> Any:
+        """
+        Run compute for key, or join the computation already in flight.
+
+        The computation runs in its own task, so a cancelled caller (e.g. a
+        disconnected client) stops waiting without failing the others.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        async def run() -> Any:
+            value = await compute()
+            await self.set(key, self._wrap(value, ttl), ttl)
+            return value
+
+        def done(task: asyncio.Task) -> None:
+            self._inflight.pop(key, None)
+            # Mark exceptions as retrieved when every caller was cancelled
+            if not task.cancelled():
+                task.exception()
+
+        task = asyncio.ensure_future(run())
+        task.add_done_callback(done)
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    def _schedule_refresh(self, key: str, compute: ComputeFn, ttl: int) -> None:
+        """Start one background recomputation of a stale key."""
+        if key in self._refresh_tasks:
+            return
+
+        async def refresh() -> None:
+            # Runs after the triggering request was served
+            detach()
+            try:
+                await self._compute_once(key, compute, ttl)
+                self.stats["refreshes"] += 1
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed for key {key}: {e}")
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.ensure_future(refresh())
+
     async def get_translation(
         self,
         text: str,
@@ -127,7 +413,8 @@ class CacheService:
     ) -> Optional[dict]:
         """Get cached translation."""
         key = self._make_key("translation", text, source_lang, target_lang)
-        return await self.get(key)
+        entry = await self.get(key)
+        return self._unwrap(entry)[0] if entry is not None else None
 
     async def set_translation(
         self,
@@ -138,7 +425,106 @@ class CacheService:
     ) -> bool:
         """Cache translation result."""
         key = self._make_key("translation", text, source_lang, target_lang)
-        return await self.set(key, result, settings.translation_cache_ttl)
+        ttl = settings.translation_cache_ttl
+        return await self.set(key, self._wrap(result, ttl), ttl)
+
+    async def get_translations(
+        self,
+        segments: List[Tuple[str, str, str]],
+        refresh: Optional[SegmentRefreshFn] = None
+    ) -> List[Optional[dict]]:
+        """
+        Get cached translations for (text, source_lang, target_lang) segments in one round trip.
+
+        As in get_or_compute, entries past their soft TTL are returned as-is;
+        the stale segments are retranslated together by one background call
+        of refresh.
+        """
+        keys = [self._make_key("translation", *segment) for segment in segments]
+        entries = await self.mget(keys)
+
+        results: List[Optional[dict]] = []
+        stale: Dict[str, Tuple[str, str, str]] = {}
+        now = time.time()
+        for key, segment, entry in zip(keys, segments, entries):
+            if entry is None:
+                results.append(None)
+                continue
+            value, fresh_until = self._unwrap(entry)
+            if fresh_until is not None and now >= fresh_until:
+                self.stats["stale_hits"] += 1
+                stale[key] = segment
+            results.append(value)
+
+        if stale and refresh is not None:
+            self._schedule_segment_refresh(stale, refresh)
+        return results
+
+    def _schedule_segment_refresh(
+        self,
+        stale: Dict[str, Tuple[str, str, str]],
+        refresh: SegmentRefreshFn
+    ) -> None:
+        """Start one background retranslation of stale segments not already refreshing."""
+        stale = {key: segment for key, segment in stale.items() if key not in self._refresh_tasks}
+        if not stale:
+            return
+
+        async def run() -> None:
+            # Runs after the triggering request was served
+            detach()
+            try:
+                results = await refresh(list(stale.values()))
+                ttl = settings.translation_cache_ttl
+                items = {
+                    key: self._wrap(result, ttl)
+                    for key, result in zip(stale, results) if result is not None
+                }
+                if items:
+                    await self.mset(items, ttl)
+                    self.stats["refreshes"] += len(items)
+            except Exception as e:
+                logger.warning(f"Background refresh of {len(stale)} cached segments failed: {e}")
+            finally:
+                for key in stale:
+                    self._refresh_tasks.pop(key, None)
+
+        task = asyncio.ensure_future(run())
+        for key in stale:
+            self._refresh_tasks[key] = task
+
+    async def set_translations(
+        self,
+        results: List[Tuple[str, str, str, dict]]
+    ) -> bool:
+        """Cache (text, source_lang, target_lang, result) translations in one round trip."""
+        ttl = settings.translation_cache_ttl
+        items = {
+            self._make_key("translation", text, source_lang, target_lang): self._wrap(result, ttl)
+            for text, source_lang, target_lang, result in results
+        }
+        return await self.mset(items, ttl)
+
+    async def get_or_compute_translation(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        compute: ComputeFn,
+        preserve_formatting: bool = True,
+        refresh: Optional[ComputeFn] = None
+    ) -> Tuple[dict, bool]:
+        """
+        Get cached translation or compute it once (stale-while-revalidate).
+
+        A document translated without preserve_formatting is reassembled with
+        collapsed whitespace, so it is cached under its own key.
+        """
+        if preserve_formatting:
+            key = self._make_key("translation", text, source_lang, target_lang)
+        else:
+            key = self._make_key("translation", text, source_lang, target_lang, "flat")
+        return await self.get_or_compute(key, compute, settings.translation_cache_ttl, refresh)
 
     async def get_prediction(
         self,
@@ -147,7 +533,8 @@ class CacheService:
     ) -> Optional[dict]:
         """Get cached prediction."""
         key = self._make_key("prediction", model_type, features)
-        return await self.get(key)
+        entry = await self.get(key)
+        return self._unwrap(entry)[0] if entry is not None else None
 
     async def set_prediction(
         self,
@@ -157,7 +544,26 @@ class CacheService:
     ) -> bool:
         """Cache prediction result."""
         key = self._make_key("prediction", model_type, features)
-        return await self.set(key, result, settings.prediction_cache_ttl)
+        ttl = settings.prediction_cache_ttl
+        return await self.set(key, self._wrap(result, ttl), ttl)
+
+    async def get_or_compute_prediction(
+        self,
+        model_type: str,
+        features: dict,
+        compute: ComputeFn,
+        options: Optional[dict] = None
+    ) -> Tuple[dict, bool]:
+        """
+        Get cached prediction or compute it once (stale-while-revalidate).
+
+        Predictions with options are cached under their own key.
+        """
+        if options:
+            key = self._make_key("prediction", model_type, features, options)
+        else:
+            key = self._make_key("prediction", model_type, features)
+        return await self.get_or_compute(key, compute, settings.prediction_cache_ttl)
 
     async def get_recommendation(
         self,
@@ -167,7 +573,8 @@ class CacheService:
     ) -> Optional[dict]:
         """Get cached recommendations."""
         key = self._make_key("recommendation", user_id, context, filters)
-        return await self.get(key)
+        entry = await self.get(key)
+        return self._unwrap(entry)[0] if entry is not None else None
 
     async def set_recommendation(
         self,
@@ -178,7 +585,30 @@ class CacheService:
     ) -> bool:
         """Cache recommendation result."""
         key = self._make_key("recommendation", user_id, context, filters)
-        return await self.set(key, result, settings.recommendation_cache_ttl)
+        ttl = settings.recommendation_cache_ttl
+        return await self.set(key, self._wrap(result, ttl), ttl)
+
+    async def get_or_compute_recommendation(
+        self,
+        user_id: str,
+        context: str,
+        compute: ComputeFn,
+        filters: Optional[dict] = None
+    ) -> Tuple[dict, bool]:
+        """Get cached recommendations or compute them once (stale-while-revalidate)."""
+        key = self._make_key("recommendation", user_id, context, filters)
+        return await self.get_or_compute(key, compute, settings.recommendation_cache_ttl)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get L1/L2 hit, miss and error counts and hit rates."""
+        lookups = self.stats["l1_hits"] + self.stats["l2_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "l1_hit_rate": self.stats["l1_hits"] / lookups if lookups else 0.0,
+            "l2_hit_rate": self.stats["l2_hits"] / lookups if lookups else 0.0,
+            "l1_entries": len(self.local) if self.local is not None else 0,
+            "by_prefix": {prefix: dict(counts) for prefix, counts in self.prefix_stats.items()},
+        }
 
     @property
     def is_connected(self) -> bool:
@@ -0,0 +1,258 @@
+"""
+Compact binary encoding for ai.* CloudEvents.
+
+Layout (big-endian), format version 1:
+
+    magic    u8      0xAE
+    version  u8      FORMAT_VERSION
+    type     u8      EVENT_SCHEMAS index of the event type
+    id       16s     event UUID, raw bytes
+    time     i64     microseconds since the Unix epoch (UTC)
+    source   str
+    data     fields of the event type's schema, in schema order
+
+where str is a u16 byte length followed by UTF-8 (0xFFFF encodes None for
+optional strings), u32/f64 are fixed width. Schemas are append-only: new
+event types get new type ids, and changing the fields of an existing type
+requires a new FORMAT_VERSION.
+
+Events whose type has no schema (or whose data does not fit it) fall back to
+the CloudEvents JSON envelope. decode_event() accepts both, so consumers can
+import this module and read the stream regardless of the producer setting.
+"""
+
+import json
+import struct
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+
+MAGIC = 0xAE
+FORMAT_VERSION = 1
+
+JSON_CONTENT_TYPE = "application/cloudevents+json"
+BINARY_CONTENT_TYPE = f"application/vnd.ai-event.v{FORMAT_VERSION}+binary"
+
+SPEC_VERSION = "1.0"
+
+# Event type -> ordered (field, kind) pairs; the list index is the wire type id
+EVENT_SCHEMAS: List[Tuple[str, Tuple[Tuple[str, str], ...]]] = [
+    ("ai.translation.completed", (
+        ("source_lang", "str"),
+        ("target_lang", "str"),
+        ("character_count", "u32"),
+        ("user_id", "optstr"),
+    )),
+    ("ai.prediction.completed", (
+        ("model_type", "str"),
+        ("prediction", "str"),
+        ("probability", "f64"),
+        ("user_id", "optstr"),
+    )),
+    ("ai.recommendation.generated", (
+        ("user_id", "str"),
+        ("context", "str"),
+        ("recommendation_count", "u32"),
+    )),
+    ("ai.image.analyzed", (
+        ("analysis_type", "str"),
+        ("findings_count", "u32"),
+        ("user_id", "optstr"),
+    )),
+    ("ai.model.loaded", (
+        ("model_name", "str"),
+        ("version", "str"),
+        ("load_time_ms", "f64"),
+    )),
+    ("ai.model.failed", (
+        ("model_name", "str"),
+        ("error", "str"),
+    )),
+]
+
+_TYPE_IDS: Dict[str, int] = {name: i for i, (name, _) in enumerate(EVENT_SCHEMAS)}
+
+_HEADER = struct.Struct(">BBB16sq")
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_F64 = struct.Struct(">d")
+_NONE = 0xFFFF
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _pack_str(value: Optional[str], out: List[bytes]) -> None:
+    """Append a length-prefixed UTF-8 string (None as the 0xFFFF marker)."""
+    if value is None:
+        out.append(_U16.pack(_NONE))
+        return
+    raw = value.encode("utf-8")
+    if len(raw) >= _NONE:
+        raise ValueError("string too long for binary event encoding")
+    out.append(_U16.pack(len(raw)))
+    out.append(raw)
+
+
+def _unpack_str(buf: bytes, offset: int) -> Tuple[Optional[str], int]:
+    """Read a length-prefixed string at offset."""
+    (length,) = _U16.unpack_from(buf, offset)
+    offset += _U16.size
+    if length == _NONE:
+        return None, offset
+    return buf[offset:offset + length].decode("utf-8"), offset + length
+
+
+def _pack_field(kind: str, value: Any, out: List[bytes]) -> None:
+    """Append one schema field."""
+    if kind == "str":
+        if not isinstance(value, str):
+            raise ValueError("expected string")
+        _pack_str(value, out)
+    elif kind == "optstr":
+        if value is not None and not isinstance(value, str):
+            raise ValueError("expected string or None")
+        _pack_str(value, out)
+    elif kind == "u32":
+        out.append(_U32.pack(int(value)))
+    elif kind == "f64":
+        out.append(_F64.pack(float(value)))
+    else:
+        raise ValueError(f"unknown field kind {kind}")
+
+
+def _unpack_field(kind: str, buf: bytes, offset: int) -> Tuple[Any, int]:
+    """Read one schema field at offset."""
+    if kind in ("str", "optstr"):
+        return _unpack_str(buf, offset)
+    if kind == "u32":
+        return _U32.unpack_from(buf, offset)[0], offset + _U32.size
+    if kind == "f64":
+        return _F64.unpack_from(buf, offset)[0], offset + _F64.size
+    raise ValueError(f"unknown field kind {kind}")
+
+
+def _to_micros(timestamp: str) -> int:
+    """Convert a naive-UTC or offset ISO 8601 timestamp to epoch microseconds."""
+    moment = datetime.fromisoformat(timestamp)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = moment - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(micros: int) -> str:
+    """Convert epoch microseconds back to the naive-UTC ISO format we publish."""
+    seconds, remainder = divmod(micros, 1_000_000)
+    moment = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+        tzinfo=None, microsecond=remainder
+    )
+    return moment.isoformat()
+
+
+def encode_binary(event: Dict[str, Any]) -> bytes:
+    """
+    Encode a CloudEvents envelope with the compact binary layout.
+
+    Raises:
+        ValueError: If the event type has no schema or the data does not fit
+    """
+    type_id = _TYPE_IDS.get(event["type"])
+    if type_id is None:
+        raise ValueError(f"no binary schema for {event['type']}")
+
+    data = event["data"]
+    fields = EVENT_SCHEMAS[type_id][1]
+    if set(data) != {name for name, _ in fields}:
+        raise ValueError(f"data does not match the {event['type']} schema")
+
+    out = [_HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        type_id,
+        UUID(event["id"]).bytes,
+        _to_micros(event["time"])
+    )]
+    _pack_str(event["source"], out)
+    for name, kind in fields:
+        _pack_field(kind, data[name], out)
+    return b"".join(out)
+
+
+def decode_binary(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a binary event back into its CloudEvents envelope.
+
+    Raises:
+        ValueError: If the payload is not a supported binary event
+    """
+    if len(payload) < _HEADER.size:
+        raise ValueError("payload too short for a binary event")
+
+    magic, version, type_id, raw_id, micros = _HEADER.unpack_from(payload, 0)
+    if magic != MAGIC:
+        raise ValueError("not a binary event")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported binary event version {version}")
+    if type_id >= len(EVENT_SCHEMAS):
+        raise ValueError(f"unknown binary event type id {type_id}")
+
+    event_type, fields = EVENT_SCHEMAS[type_id]
+    source, offset = _unpack_str(payload, _HEADER.size)
+
+    data = {}
+    for name, kind in fields:
+        data[name], offset = _unpack_field(kind, payload, offset)
+
+    return {
+        "specversion": SPEC_VERSION,
+        "type": event_type,
+        "source": source,
+        "id": str(UUID(bytes=raw_id)),
+        "time": _from_micros(micros),
+        "data": data,
+    }
+
+
+def encode_json(event: Dict[str, Any]) -> bytes:
+    """Encode a CloudEvents envelope as JSON."""
+    return json.dumps(event).encode("utf-8")
+
+
+def encode_event(event: Dict[str, Any], encoding: str = "json") -> Tuple[bytes, str]:
+    """
+    Encode an event for Kafka.
+
+    Args:
+        event: CloudEvents envelope
+        encoding: "binary" for the compact layout (JSON fallback for event
+            types without a schema) or "json"
+
+    Returns:
+        Tuple of (payload, content type)
+    """
+    if encoding == "binary":
+        try:
+            return encode_binary(event), BINARY_CONTENT_TYPE
+        except (ValueError, KeyError, TypeError, struct.error):
+            pass
+    return encode_json(event), JSON_CONTENT_TYPE
+
+
+def decode_event(payload: bytes, content_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Decode an event from Kafka in either encoding.
+
+    Args:
+        payload: Record value
+        content_type: Value of the record's content-type header, if any;
+            without it the encoding is recognised by the leading byte
+
+    Returns:
+        CloudEvents envelope
+    """
+    if content_type == BINARY_CONTENT_TYPE or (
+        content_type is None and payload[:1] == bytes((MAGIC,))
+    ):
+        return decode_binary(payload)
+    return json.loads(payload)
+
@@ -0,0 +1,197 @@
+"""Append-only disk journal for events that could not be sent to Kafka."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.utils.logger import logger
+
+
+# (topic, CloudEvents envelope)
+JournalRecord = Tuple[str, Dict[str, Any]]
+
+_SEGMENT_PREFIX = "events-"
+_SEGMENT_SUFFIX = ".jsonl"
+
+
+class EventJournal:
+    """
+    Segment-rotated JSON-lines journal of unsent events.
+
+    Records are appended to the active segment until it reaches
+    segment_max_bytes, then a new segment is started. Replay consumes sealed
+    segments oldest first and deletes each once it has been delivered. When
+    the journal would exceed max_bytes, the oldest segments are discarded.
+
+    Methods block on file IO; call them from an executor thread.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        max_bytes: int = 512 * 1024 * 1024
+    ):
+        """
+        Initialize event journal.
+
+        Args:
+            directory: Directory holding the segment files
+            segment_max_bytes: Rotate the active segment beyond this size
+            max_bytes: Cap on total journal size
+        """
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._active: Optional[Path] = None
+        self._sizes: Dict[Path, int] = {}
+        self._counts: Dict[Path, int] = {}
+        self._next_seq = 0
+        self.stats: Dict[str, int] = {
+            "appended": 0,
+            "evicted": 0,
+            "corrupt": 0,
+        }
+
+    def open(self) -> None:
+        """Create the directory and index segments left by a previous run."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for path in self._segment_paths():
+                self._sizes[path] = path.stat().st_size
+                with open(path, "rb") as f:
+                    self._counts[path] = sum(1 for _ in f)
+                self._next_seq = max(self._next_seq, self._seq_of(path) + 1)
+
+            if self._sizes:
+                logger.info(
+                    f"Event journal has {self.pending_events} unsent events "
+                    f"in {len(self._sizes)} segments"
+                )
+
+    def append(self, records: Sequence[JournalRecord]) -> int:
+        """
+        Append records to the active segment.
+
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+
+        lines = [
+            json.dumps({"topic": topic, "event": event}, separators=(",", ":")) + "\n"
+            for topic, event in records
+        ]
+        payload = "".join(lines).encode("utf-8")
+
+        with self._lock:
+            self._make_room(len(payload))
+
+            if self._active is None or self._sizes[self._active] >= self.segment_max_bytes:
+                self._rotate()
+
+            with open(self._active, "ab") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._sizes[self._active] += len(payload)
+            self._counts[self._active] += len(lines)
+            self.stats["appended"] += len(lines)
+
+        return len(lines)
+
+    def seal(self) -> List[Path]:
+        """
+        Close the active segment for replay.
+
+        Returns:
+            All segments with unsent records, oldest first
+        """
+        with self._lock:
+            self._active = None
+            return sorted(self._sizes, key=self._seq_of)
+
+    def read_segment(self, path: Path) -> List[JournalRecord]:
+        """Read the records of a sealed segment, skipping torn or corrupt lines."""
+        records = []
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    records.append((entry["topic"], entry["event"]))
+                except (ValueError, KeyError, TypeError):
+                    self.stats["corrupt"] += 1
+        return records
+
+    def remove(self, path: Path) -> None:
+        """Delete a segment whose records have been delivered."""
+        with self._lock:
+            self._forget(path)
+
+    @property
+    def pending_events(self) -> int:
+        """Records waiting in the journal."""
+        return sum(self._counts.values())
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes used by the journal."""
+        return sum(self._sizes.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal statistics."""
+        return {
+            **self.stats,
+            "pending_events": self.pending_events,
+            "pending_bytes": self.pending_bytes,
+            "segments": len(self._sizes),
+            "max_bytes": self.max_bytes,
+        }
+
+    def _segment_paths(self) -> List[Path]:
+        """Segment files on disk, oldest first."""
+        return sorted(
+            self.directory.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"),
+            key=self._seq_of
+        )
+
+    @staticmethod
+    def _seq_of(path: Path) -> int:
+        """Sequence number encoded in a segment file name."""
+        return int(path.name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+
+    def _rotate(self) -> None:
+        """Start a new active segment."""
+        path = self.directory / f"{_SEGMENT_PREFIX}{self._next_seq:012d}{_SEGMENT_SUFFIX}"
+        self._next_seq += 1
+        path.touch()
+        self._active = path
+        self._sizes[path] = 0
+        self._counts[path] = 0
+
+    def _make_room(self, incoming: int) -> None:
+        """Discard the oldest segments until incoming bytes fit under max_bytes."""
+        while self._sizes and self.pending_bytes + incoming > self.max_bytes:
+            oldest = min(self._sizes, key=self._seq_of)
+            evicted = self._counts.get(oldest, 0)
+            self.stats["evicted"] += evicted
+            logger.warning(
+                f"Event journal full, discarding {evicted} events from {oldest.name}"
+            )
+            self._forget(oldest)
+
+    def _forget(self, path: Path) -> None:
+        """Delete a segment and drop it from the index."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        self._sizes.pop(path, None)
+        self._counts.pop(path, None)
+        if path == self._active:
+            self._active = None
@@ -1,76 +1,456 @@
 """Kafka event publisher for AI/ML service."""
 
-import json
+import asyncio
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 from aiokafka import AIOKafkaProducer
 
 from app.core.config import settings
+from app.core.metrics import service_metrics
+from app.core.tracing import traced
+from app.services.event_codec import encode_event
+from app.services.event_journal import EventJournal, JournalRecord
 from app.utils.logger import logger
 
 
+# Overflow policies for the in-memory event queue
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+# Wire encodings for event payloads
+EVENT_ENCODINGS = ("json", "binary")
+
+# Creates an unstarted producer exposing start(), stop() and send()
+ProducerFactory = Callable[[], Any]
+
+MB = 1024 * 1024
+
+
 class EventPublisher:
-    """Publish events to Kafka for async processing and integration."""
+    """
+    Publish events to Kafka for async processing and integration.
 
-    def __init__(self):
-        """Initialize event publisher."""
+    publish() only enqueues onto a bounded in-memory queue; a background task
+    drains it in batches so Kafka latency never reaches the request path.
+    While Kafka is unreachable, drained events are spilled to a disk journal
+    and replayed in bulk once a reconnect succeeds (at-least-once delivery).
+    """
+
+    def __init__(
+        self,
+        producer_factory: Optional[ProducerFactory] = None,
+        journal: Optional[EventJournal] = None
+    ):
+        """
+        Initialize event publisher.
+
+        Args:
+            producer_factory: Producer constructor (default: AIOKafkaProducer
+                from settings); lets tests substitute a local stand-in
+            journal: Spill journal (default: from settings, None if disabled)
+        """
         self.producer: Optional[AIOKafkaProducer] = None
         self._connected = False
+        self._producer_factory = producer_factory or self._create_producer
+        if journal is None and settings.enable_event_journal:
+            journal = EventJournal(
+                settings.event_journal_dir,
+                segment_max_bytes=settings.event_journal_segment_mb * MB,
+                max_bytes=settings.event_journal_max_mb * MB
+            )
+        self.journal = journal
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=settings.event_queue_max_size)
+        self._drain_task: Optional[asyncio.Task] = None
+        self._recover_task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.overflow_policy = settings.event_overflow_policy
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            logger.warning(
+                f"Unknown event overflow policy {self.overflow_policy}, using drop_oldest"
+            )
+            self.overflow_policy = "drop_oldest"
+        self.encoding = settings.event_encoding
+        if self.encoding not in EVENT_ENCODINGS:
+            logger.warning(f"Unknown event encoding {self.encoding}, using json")
+            self.encoding = "json"
+        # Events leave the queue exactly once, as sent, spilled or failed
+        # (undelivered and not journaled); dropped also counts events
+        # rejected by the overflow policy. Replays are in replay_stats.
+        self.stats: Dict[str, int] = {
+            "enqueued": 0,
+            "sent": 0,
+            "dropped": 0,
+            "failed": 0,
+            "spilled": 0,
+            "batches": 0,
+        }
+        self.replay_stats: Dict[str, float] = {
+            "replays": 0,
+            "replayed": 0,
+            "replay_seconds_total": 0.0,
+            "last_replay_events_per_second": 0.0,
+        }
+
+    @staticmethod
+    def _create_producer() -> AIOKafkaProducer:
+        """Create the Kafka producer from settings."""
+        compression = settings.event_compression
+        return AIOKafkaProducer(
+            bootstrap_servers=settings.kafka_brokers_list,
+            linger_ms=settings.event_linger_ms,
+            max_batch_size=settings.event_max_batch_bytes,
+            compression_type=None if compression in (None, "", "none") else compression,
+        )
 
     async def connect(self) -> None:
-        """Connect to Kafka."""
+        """Connect to Kafka and start the background sender."""
+        self._closing = False
+        if self.journal:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.journal.open)
+            except Exception as e:
+                logger.error(f"Failed to open event journal, spilling disabled: {e}")
+                self.journal = None
+
         try:
-            self.producer = AIOKafkaProducer(
-                bootstrap_servers=settings.kafka_brokers_list,
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-            )
-            await self.producer.start()
-            self._connected = True
+            await self._start_producer()
             logger.info("✅ Kafka event publisher connected")
         except Exception as e:
             logger.error(f"Failed to connect to Kafka: {e}")
             self._connected = False
             # Continue without events in development
-            if settings.is_production:
+            if settings.is_production and self.journal is None:
                 raise
 
+        self._drain_task = asyncio.create_task(self._drain())
+
+        # Keep retrying the broker, and replay events journaled by a previous run
+        if not self._connected or (self.journal and self.journal.pending_events):
+            self._start_recovery()
+
     async def disconnect(self) -> None:
-        """Disconnect from Kafka."""
+        """Flush queued events and disconnect from Kafka."""
+        # Events spilled by the flush stay journaled for the next run
+        self._closing = True
+
+        if self._drain_task:
+            try:
+                await asyncio.wait_for(self._queue.join(), settings.event_flush_timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Event flush timed out with {self._queue.qsize()} events queued"
+                )
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+        if self._recover_task:
+            self._recover_task.cancel()
+            try:
+                await self._recover_task
+            except asyncio.CancelledError:
+                pass
+            self._recover_task = None
+
         if self.producer:
             await self.producer.stop()
+            self.producer = None
             self._connected = False
             logger.info("Kafka event publisher disconnected")
 
+    async def _start_producer(self) -> None:
+        """Create and start a producer; raises if the broker is unreachable."""
+        producer = self._producer_factory()
+        try:
+            await producer.start()
+        except BaseException:
+            # A producer that failed to start still holds a client and sockets
+            try:
+                await producer.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Kafka producer: {e}")
+            raise
+        self.producer = producer
+        self._connected = True
+
+    async def _connection_lost(self) -> None:
+        """Drop the producer after a failed batch and start reconnecting."""
+        if not self._connected:
+            return
+
+        logger.error("Lost connection to Kafka, spilling events until it recovers")
+        self._connected = False
+        producer, self.producer = self.producer, None
+        try:
+            await asyncio.wait_for(producer.stop(), settings.event_flush_timeout_seconds)
+        except Exception as e:
+            logger.debug(f"Error stopping Kafka producer: {e}")
+
+        self._start_recovery()
+
+    def _start_recovery(self) -> None:
+        """Start the reconnect/replay task unless it is already running or closing."""
+        if self._closing:
+            return
+        if self._recover_task is None or self._recover_task.done():
+            self._recover_task = asyncio.create_task(self._recover())
+
+    async def _recover(self) -> None:
+        """Background task: reconnect to Kafka, then replay the journal."""
+        interval = settings.event_reconnect_interval_seconds
+        while True:
+            if not self._connected:
+                await asyncio.sleep(interval)
+                try:
+                    await self._start_producer()
+                    logger.info("✅ Kafka event publisher reconnected")
+                except Exception as e:
+                    logger.warning(f"Kafka reconnect failed: {e}")
+                    continue
+
+            if self.journal is None:
+                return
+            if await self._replay():
+                # Segments spilled during the replay were not in its list
+                if self.journal.pending_events == 0:
+                    return
+                continue
+
+            await asyncio.sleep(interval)
+
+    async def _replay(self) -> bool:
+        """
+        Send journaled events to Kafka, oldest segment first.
+
+        A segment is deleted only after all of its events were acknowledged;
+        a partially replayed segment is replayed again in full later.
+
+        Returns:
+            True if the journal was fully replayed
+        """
+        loop = asyncio.get_running_loop()
+        segments = await loop.run_in_executor(None, self.journal.seal)
+        if not segments:
+            return True
+
+        start_time = time.time()
+        replayed = 0
+        complete = True
+        batch_size = settings.event_replay_batch_size
+
+        for path in segments:
+            try:
+                records = await loop.run_in_executor(None, self.journal.read_segment, path)
+            except FileNotFoundError:
+                # Evicted by the disk cap while we were replaying
+                continue
+
+            for i in range(0, len(records), batch_size):
+                chunk = records[i:i + batch_size]
+                failed = await self._send_batch(chunk)
+                replayed += len(chunk) - len(failed)
+                if failed:
+                    complete = False
+                    break
+
+            if not complete:
+                break
+            await loop.run_in_executor(None, self.journal.remove, path)
+
+        elapsed = time.time() - start_time
+        self.replay_stats["replays"] += 1
+        self.replay_stats["replayed"] += replayed
+        self.replay_stats["replay_seconds_total"] += elapsed
+        self.replay_stats["last_replay_events_per_second"] = (
+            replayed / elapsed if elapsed > 0 else 0.0
+        )
+        logger.info(
+            f"Replayed {replayed} journaled events in {elapsed * 1000:.0f}ms"
+            f"{'' if complete else ' (incomplete, will retry)'}"
+        )
+        return complete
+
+    @traced("events")
     async def publish(
         self,
         event_type: str,
         data: Dict[str, Any],
         topic: Optional[str] = None
     ) -> bool:
-        """Publish event to Kafka."""
-        if not self._connected or not self.producer:
+        """
+        Queue an event for publishing to Kafka.
+
+        Returns as soon as the event is queued; delivery happens in the
+        background. When the queue is full the overflow policy decides
+        whether the oldest event, this event, or the caller (up to
+        event_enqueue_timeout_ms) gives way.
+
+        Returns:
+            True if the event was queued
+        """
+        # Without a journal there is nowhere to keep events while disconnected
+        if self._drain_task is None or (not self._connected and self.journal is None):
             logger.warning(f"Cannot publish event {event_type}: not connected")
             return False
 
+        topic = topic or f"{settings.kafka_topic_prefix}.events"
+
+        event = {
+            "specversion": "1.0",
+            "type": event_type,
+            "source": f"/{settings.service_name}",
+            "id": str(uuid4()),
+            "time": datetime.utcnow().isoformat(),
+            "data": data,
+        }
+
+        return await self._enqueue(topic, event)
+
+    async def _enqueue(self, topic: str, event: Dict[str, Any]) -> bool:
+        """Put an event on the queue, applying the overflow policy."""
+        item = (topic, event)
         try:
-            topic = topic or f"{settings.kafka_topic_prefix}.events"
-
-            event = {
-                "specversion": "1.0",
-                "type": event_type,
-                "source": f"/{settings.service_name}",
-                "id": str(uuid4()),
-                "time": datetime.utcnow().isoformat(),
-                "data": data,
-            }
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self.overflow_policy == "drop_newest":
+                self._drop(event, "queue full")
+                return False
 
-            await self.producer.send(topic, value=event)
-            logger.debug(f"Published event {event_type} to {topic}")
-            return True
+            if self.overflow_policy == "block":
+                try:
+                    await asyncio.wait_for(
+                        self._queue.put(item),
+                        settings.event_enqueue_timeout_ms / 1000
+                    )
+                except asyncio.TimeoutError:
+                    self._drop(event, "enqueue timed out")
+                    return False
+            else:
+                # drop_oldest: make room by discarding the head of the queue
+                try:
+                    _, oldest = self._queue.get_nowait()
+                    self._queue.task_done()
+                    self._drop(oldest, "queue full")
+                except asyncio.QueueEmpty:
+                    pass
+                self._queue.put_nowait(item)
+
+        self.stats["enqueued"] += 1
+        return True
+
+    def _drop(self, event: Dict[str, Any], reason: str) -> None:
+        """Count and log a dropped event."""
+        self.stats["dropped"] += 1
+        logger.debug(f"Dropped event {event['type']}: {reason}")
+
+    async def _drain(self) -> None:
+        """Background task: hand queued events to the producer in batches."""
+        linger = settings.event_linger_ms / 1000
+        while True:
+            batch = [await self._queue.get()]
+
+            # Give a sparse queue a moment to fill before sending
+            if self._queue.qsize() < settings.event_batch_size - 1 and linger > 0:
+                await asyncio.sleep(linger)
+
+            while len(batch) < settings.event_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            failed = batch
+            try:
+                if self._connected:
+                    failed = await self._send_batch(batch)
+                    self.stats["sent"] += len(batch) - len(failed)
+                    if failed and len(failed) == len(batch):
+                        await self._connection_lost()
+                await self._spill(failed)
+            except Exception as e:
+                logger.error(f"Failed to send event batch: {e}")
+                self.stats["failed"] += len(failed)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _send_batch(self, batch: List[JournalRecord]) -> List[JournalRecord]:
+        """
+        Send a batch of events and wait for broker acknowledgements.
+
+        Returns:
+            Records that were not delivered
+        """
+        results = await asyncio.gather(
+            *(self._deliver(topic, event) for topic, event in batch),
+            return_exceptions=True
+        )
+
+        failed = [
+            record for record, result in zip(batch, results)
+            if isinstance(result, BaseException)
+        ]
+        self.stats["batches"] += 1
+
+        if failed:
+            error = next(r for r in results if isinstance(r, BaseException))
+            logger.error(f"Failed to publish {len(failed)}/{len(batch)} events: {error}")
+        else:
+            logger.debug(f"Published batch of {len(batch)} events")
+
+        return failed
+
+    async def _deliver(self, topic: str, event: Dict[str, Any]) -> Any:
+        """Send one event and wait for its acknowledgement."""
+        if self.producer is None:
+            raise ConnectionError("Kafka producer not connected")
+        payload, content_type = encode_event(event, self.encoding)
+        start_time = time.perf_counter()
+        # send() only appends to the producer's accumulator (linger/compression
+        # batching happens there); the returned future resolves on broker ack
+        delivery = await self.producer.send(
+            topic,
+            value=payload,
+            headers=[("content-type", content_type.encode("ascii"))]
+        )
+        metadata = await delivery
+        service_metrics.observe_event_send(topic, time.perf_counter() - start_time)
+        return metadata
+
+    async def _spill(self, records: List[JournalRecord]) -> None:
+        """Write undelivered events to the journal, if enabled."""
+        if not records:
+            return
+        if self.journal is None:
+            self.stats["failed"] += len(records)
+            return
+
+        try:
+            written = await asyncio.get_running_loop().run_in_executor(
+                None, self.journal.append, records
+            )
+            self.stats["spilled"] += written
+            self._start_recovery()
         except Exception as e:
-            logger.error(f"Failed to publish event {event_type}: {e}")
-            return False
+            self.stats["dropped"] += len(records)
+            logger.error(f"Failed to journal {len(records)} events: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get event publishing statistics."""
+        return {
+            **self.stats,
+            "queue_depth": self._queue.qsize(),
+            "queue_max_size": self._queue.maxsize,
+            "overflow_policy": self.overflow_policy,
+            "encoding": self.encoding,
+            "connected": self._connected,
+            "journal": self.journal.get_stats() if self.journal else None,
+            "replay": dict(self.replay_stats),
+        }
 
     async def publish_translation_completed(
         self,
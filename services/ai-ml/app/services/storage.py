@@ -1,9 +1,19 @@
 """MinIO storage service for ML models."""
 
+import hashlib
+import io
+import json
 import os
+import shutil
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+from dataclasses import dataclass, field
 from minio import Minio
 from minio.error import S3Error
 
@@ -11,6 +21,20 @@ from app.core.config import settings
 from app.utils.logger import logger
 
 
+MB = 1024 * 1024
+
+# Read size when streaming object data and hashing files
+_IO_BLOCK = 1 * MB
+
+# Per-model record of the objects a local model directory was built from
+LOCAL_MANIFEST = ".manifest.json"
+
+INDEX_FORMAT = 1
+
+# Upload progress callback: (bytes uploaded, total bytes)
+ProgressCallback = Callable[[int, int], None]
+
+
 @dataclass
 class ModelMetadata:
     """Metadata for a stored model."""
@@ -21,6 +45,207 @@ class ModelMetadata:
     path: str
 
 
+@dataclass
+class RemoteFile:
+    """Object belonging to a stored model version."""
+    object_name: str
+    relative_path: str
+    size: int
+    etag: str
+    sha256: Optional[str] = None
+
+
+@dataclass
+class _FileDownload:
+    """Chunked download of one object into a preallocated .part file."""
+    remote: RemoteFile
+    target: Path
+    chunk_size: int
+    done: Set[int] = field(default_factory=set)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def part_path(self) -> Path:
+        """Preallocated file the chunks are written into."""
+        return self.target.with_name(self.target.name + ".part")
+
+    @property
+    def state_path(self) -> Path:
+        """Sidecar recording completed chunks."""
+        return self.target.with_name(self.target.name + ".part.json")
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of ranged GETs for this object."""
+        return max(1, -(-self.remote.size // self.chunk_size))
+
+    def chunk_range(self, index: int) -> Tuple[int, int]:
+        """Offset and length of a chunk."""
+        offset = index * self.chunk_size
+        return offset, min(self.chunk_size, self.remote.size - offset)
+
+    def prepare(self) -> None:
+        """Reuse a matching partial download, or preallocate a fresh one."""
+        try:
+            state = json.loads(self.state_path.read_text())
+            if (
+                state["etag"] == self.remote.etag
+                and state["size"] == self.remote.size
+                and state["chunk_size"] == self.chunk_size
+                and self.part_path.stat().st_size == self.remote.size
+            ):
+                self.done = set(state["done"])
+                return
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.part_path, "wb") as f:
+            f.truncate(self.remote.size)
+        self.done = set()
+        self._save_state()
+
+    def mark_done(self, index: int) -> None:
+        """Record a completed chunk so an interrupted download can resume."""
+        with self.lock:
+            self.done.add(index)
+            self._save_state()
+
+    def _save_state(self) -> None:
+        """Persist the resume state."""
+        self.state_path.write_text(json.dumps({
+            "etag": self.remote.etag,
+            "size": self.remote.size,
+            "chunk_size": self.chunk_size,
+            "done": sorted(self.done),
+        }))
+
+
+class _TransferProgress:
+    """Aggregate byte progress of a multi-file transfer."""
+
+    def __init__(
+        self,
+        label: str,
+        total_bytes: int,
+        callback: Optional[ProgressCallback] = None
+    ):
+        """Initialize progress tracker."""
+        self.label = label
+        self.total_bytes = total_bytes
+        self.done_bytes = 0
+        self.callback = callback
+        self._next_log_percent = 10
+        self._lock = threading.Lock()
+
+    def update(self, size: int) -> None:
+        """Record transferred bytes (called from transfer threads)."""
+        with self._lock:
+            self.done_bytes += size
+            done, total = self.done_bytes, self.total_bytes
+            percent = 100 * done // total if total else 100
+            if percent >= self._next_log_percent:
+                self._next_log_percent = (percent // 10 + 1) * 10
+                logger.info(f"{self.label}: {percent}% ({done / MB:.1f}/{total / MB:.1f} MB)")
+
+        if self.callback:
+            self.callback(done, total)
+
+
+class _ObjectProgress(threading.Thread):
+    """
+    Per-object progress sink for minio-py.
+
+    minio-py requires progress objects to be Thread instances exposing
+    set_meta() and update(); this one is never started and only forwards
+    byte counts to the shared tracker.
+    """
+
+    def __init__(self, tracker: _TransferProgress):
+        """Initialize progress sink."""
+        super().__init__(daemon=True)
+        self.tracker = tracker
+
+    def set_meta(self, object_name: str, total_length: int) -> None:
+        """Called by minio-py before the upload starts."""
+
+    def update(self, size: int) -> None:
+        """Called by minio-py after each uploaded part."""
+        self.tracker.update(size)
+
+
+def _hash_file(path: Path, algorithm: str = "md5") -> str:
+    """Hex digest of a file (MD5 is the ETag of a single-part upload)."""
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_IO_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _reserved_prefixes() -> Tuple[str, str]:
+    """Top-level prefixes holding the index and uploaded revisions, not models."""
+    return (
+        settings.storage_index_prefix.split("/")[0] + "/",
+        settings.storage_revision_prefix.split("/")[0] + "/",
+    )
+
+
+def _group_versions(objects: List[Any]) -> Dict[Tuple[str, str], List[Any]]:
+    """
+    Group listed objects of the <model>/<version>/<file> layout by (model, version).
+
+    Model names may contain "/" (e.g. facebook/nllb-200-distilled-600M), so
+    the version directory is taken to be the shallowest directory, at least
+    two levels deep, that directly holds a file; files in its
+    subdirectories belong to the same version.
+    """
+    files = [obj for obj in objects if not obj.is_dir]
+    holders = {
+        obj.object_name.rsplit("/", 1)[0]
+        for obj in files
+        if obj.object_name.count("/") >= 2
+    }
+
+    groups: Dict[Tuple[str, str], List[Any]] = {}
+    for obj in files:
+        parts = obj.object_name.split("/")
+        for depth in range(2, len(parts)):
+            directory = "/".join(parts[:depth])
+            if directory in holders:
+                model_name, version = directory.rsplit("/", 1)
+                groups.setdefault((model_name, version), []).append(obj)
+                break
+    return groups
+
+
+def _has_prefix(sorted_names: List[str], prefix: str) -> bool:
+    """Whether any name in a sorted list starts with prefix."""
+    i = bisect_left(sorted_names, prefix)
+    return i < len(sorted_names) and sorted_names[i].startswith(prefix)
+
+
+def _is_single_part_etag(etag: str) -> bool:
+    """Multipart ETags carry a -<parts> suffix and are not a content MD5."""
+    return len(etag) == 32 and "-" not in etag
+
+
+def _checksum_matches(path: Path, remote: RemoteFile) -> Optional[bool]:
+    """
+    Compare a file with the object's SHA-256 (from the index) or MD5 ETag.
+
+    Returns:
+        Whether the checksums match, or None if the object has neither
+        (a multipart upload that was never indexed)
+    """
+    # SHA-256 from the index also covers multipart uploads
+    if remote.sha256:
+        return _hash_file(path, "sha256") == remote.sha256
+    if _is_single_part_etag(remote.etag):
+        return _hash_file(path) == remote.etag
+    return None
+
+
 class ModelStorage:
     """MinIO-based storage for ML models and artifacts."""
 
@@ -29,6 +254,13 @@ class ModelStorage:
         self.client: Optional[Minio] = None
         self._connected = False
         self.bucket = settings.minio_bucket
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_loaded_at = 0.0
+        self._index_lock = threading.Lock()
+        # Index entry object name -> (ETag, entry or None if unreadable)
+        self._index_entries: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self._bucket_models: List[ModelMetadata] = []
+        self._bucket_scanned_at = 0.0
 
     def connect(self) -> None:
         """Connect to MinIO."""
@@ -67,6 +299,18 @@ class ModelStorage:
         """
         Download model from MinIO to local cache.
 
+        Objects are fetched concurrently; objects larger than
+        storage_chunk_size_mb are split into parallel ranged GETs. Files are
+        written into a staging directory next to the target and verified
+        against their size and ETag before the directory is renamed into
+        place, so the cache never holds a half-populated model. An
+        interrupted download resumes from its completed chunks.
+
+        If the model is already cached, its local manifest is compared with
+        the bucket listing: unchanged files are hard-linked into the staging
+        directory and only new or changed objects are transferred. A model
+        that is fully up to date costs a single listing.
+
         Args:
             model_name: Name of the model
             version: Version of the model (default: "latest")
@@ -79,48 +323,42 @@ class ModelStorage:
             return None
 
         try:
-            # Construct object prefix
-            object_prefix = f"{model_name}/{version}/"
-
-            # Create local directory
+            start_time = time.time()
             local_path = Path(settings.model_cache_dir) / model_name / version
-            local_path.mkdir(parents=True, exist_ok=True)
-
-            # List and download all objects with this prefix
-            objects = self.client.list_objects(
-                self.bucket,
-                prefix=object_prefix,
-                recursive=True
-            )
 
-            downloaded_files = 0
-            for obj in objects:
-                # Get relative path within model directory
-                relative_path = obj.object_name[len(object_prefix):]
-                if not relative_path:  # Skip directory entries
-                    continue
-
-                # Download file
-                local_file = local_path / relative_path
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-
-                self.client.fget_object(
-                    self.bucket,
-                    obj.object_name,
-                    str(local_file)
-                )
-                downloaded_files += 1
-
-            if downloaded_files > 0:
-                logger.info(
-                    f"Downloaded model {model_name} v{version} "
-                    f"({downloaded_files} files) to {local_path}"
-                )
-                return local_path
-            else:
+            remote_files = self.list_model_files(model_name, version)
+            if not remote_files:
                 logger.warning(f"No files found for model {model_name} v{version}")
                 return None
 
+            self.restore_interrupted_swap(local_path)
+            local_manifest = self.read_local_manifest(local_path)
+            unchanged = [f for f in remote_files if self._is_unchanged(f, local_path, local_manifest)]
+            if len(unchanged) == len(remote_files) and len(local_manifest) == len(remote_files):
+                logger.info(f"Model {model_name} v{version} is up to date")
+                return local_path
+
+            staging = local_path.with_name(f".{version}.staging")
+            staging.mkdir(parents=True, exist_ok=True)
+
+            for remote in unchanged:
+                self._reuse_file(local_path / remote.relative_path, staging / remote.relative_path)
+            reused = {f.relative_path for f in unchanged}
+            changed = [f for f in remote_files if f.relative_path not in reused]
+
+            transferred = self._download_files(changed, staging)
+            self._write_local_manifest(staging, model_name, version, remote_files)
+            self._swap_into_place(staging, local_path)
+
+            elapsed = time.time() - start_time
+            logger.info(
+                f"Downloaded model {model_name} v{version} "
+                f"({len(changed)} files, {transferred / MB:.1f} MB in {elapsed:.1f}s, "
+                f"{transferred / MB / max(elapsed, 1e-6):.1f} MB/s; "
+                f"{len(unchanged)} unchanged files reused) to {local_path}"
+            )
+            return local_path
+
         except S3Error as e:
             logger.error(f"Failed to download model {model_name}: {e}")
             return None
@@ -128,19 +366,280 @@ class ModelStorage:
             logger.error(f"Unexpected error downloading model {model_name}: {e}")
             return None
 
+    def list_model_files(self, model_name: str, version: str) -> List[RemoteFile]:
+        """List the objects of a model version (from the index when it has them)."""
+        object_prefix = f"{model_name}/{version}/"
+        entry = self._index_entry(model_name, version)
+        if entry is not None:
+            # Entries written by upload_model point at their revision
+            object_prefix = entry.get("prefix") or object_prefix
+            return [
+                RemoteFile(
+                    object_name=object_prefix + relative_path,
+                    relative_path=relative_path,
+                    size=info["size"],
+                    etag=info["etag"],
+                    sha256=info.get("sha256"),
+                )
+                for relative_path, info in entry["files"].items()
+            ]
+
+        files = []
+        for obj in self.client.list_objects(self.bucket, prefix=object_prefix, recursive=True):
+            relative_path = obj.object_name[len(object_prefix):]
+            if not relative_path or obj.is_dir:  # Skip directory entries
+                continue
+            files.append(RemoteFile(
+                object_name=obj.object_name,
+                relative_path=relative_path,
+                size=obj.size or 0,
+                etag=(obj.etag or "").strip('"'),
+            ))
+        return files
+
+    def read_local_manifest(self, local_path: Path) -> Dict[str, Dict[str, object]]:
+        """
+        Read the manifest of a cached model directory.
+
+        Returns:
+            Mapping of relative path to {"size", "etag"}; empty if missing
+        """
+        try:
+            manifest = json.loads((local_path / LOCAL_MANIFEST).read_text())
+            return manifest["files"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _write_local_manifest(
+        self,
+        path: Path,
+        model_name: str,
+        version: str,
+        remote_files: List[RemoteFile]
+    ) -> None:
+        """Record the objects a model directory was built from."""
+        manifest = {
+            "model": model_name,
+            "version": version,
+            "updated_at": time.time(),
+            "files": {
+                f.relative_path: {"size": f.size, "etag": f.etag}
+                for f in remote_files
+            },
+        }
+        (path / LOCAL_MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    @staticmethod
+    def _is_unchanged(
+        remote: RemoteFile,
+        local_path: Path,
+        local_manifest: Dict[str, Dict[str, object]]
+    ) -> bool:
+        """Check whether the cached copy of an object matches the bucket."""
+        entry = local_manifest.get(remote.relative_path)
+        if not entry or entry.get("etag") != remote.etag or entry.get("size") != remote.size:
+            return False
+        try:
+            return (local_path / remote.relative_path).stat().st_size == remote.size
+        except OSError:
+            return False
+
+    @staticmethod
+    def _reuse_file(source: Path, target: Path) -> None:
+        """Hard-link (or copy, across filesystems) a cached file into staging."""
+        # Whatever an earlier attempt left here may be from another object version
+        target.unlink(missing_ok=True)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def _download_files(self, remote_files: List[RemoteFile], staging: Path) -> int:
+        """
+        Download objects into staging, skipping files already completed there.
+
+        Returns:
+            Bytes transferred
+        """
+        chunk_size = settings.storage_chunk_size_mb * MB
+        downloads: List[_FileDownload] = []
+        for remote in remote_files:
+            target = staging / remote.relative_path
+            if self._is_completed(target, remote):
+                continue  # Completed by an earlier, interrupted attempt
+            target.unlink(missing_ok=True)
+            download = _FileDownload(remote=remote, target=target, chunk_size=chunk_size)
+            download.prepare()
+            downloads.append(download)
+
+        transferred = 0
+        with ThreadPoolExecutor(
+            max_workers=settings.storage_transfer_workers,
+            thread_name_prefix="model-download"
+        ) as pool:
+            chunk_futures: Dict[Future, _FileDownload] = {}
+            remaining: Dict[int, int] = {}
+            finalize_futures: List[Future] = []
+
+            for download in downloads:
+                pending = [i for i in range(download.chunk_count) if i not in download.done]
+                remaining[id(download)] = len(pending)
+                if not pending:
+                    finalize_futures.append(pool.submit(self._finalize_download, download))
+                for index in pending:
+                    chunk_futures[pool.submit(self._download_chunk, download, index)] = download
+
+            try:
+                # Files are verified and renamed as soon as their last chunk lands
+                for future in as_completed(chunk_futures):
+                    download = chunk_futures[future]
+                    transferred += future.result()
+                    remaining[id(download)] -= 1
+                    if remaining[id(download)] == 0:
+                        finalize_futures.append(pool.submit(self._finalize_download, download))
+
+                for future in finalize_futures:
+                    future.result()
+            except Exception:
+                # Completed chunks are kept for the next attempt to resume from
+                for future in list(chunk_futures) + finalize_futures:
+                    future.cancel()
+                raise
+
+        return transferred
+
+    @staticmethod
+    def _is_completed(target: Path, remote: RemoteFile) -> bool:
+        """
+        Check whether a file left in staging holds the object's current content.
+
+        The object may have been replaced since the interrupted attempt, and
+        retrained weights often keep their size, so only a checksum match
+        counts; files that cannot be verified are downloaded again.
+        """
+        try:
+            if target.stat().st_size != remote.size:
+                return False
+        except OSError:
+            return False
+        return bool(_checksum_matches(target, remote))
+
+    def _download_chunk(self, download: _FileDownload, index: int) -> int:
+        """Fetch one byte range of an object into its .part file."""
+        offset, length = download.chunk_range(index)
+        if length <= 0:
+            download.mark_done(index)
+            return 0
+
+        response = self.client.get_object(
+            self.bucket,
+            download.remote.object_name,
+            offset=offset,
+            length=length
+        )
+        position = offset
+        try:
+            fd = os.open(download.part_path, os.O_WRONLY)
+            try:
+                for data in response.stream(_IO_BLOCK):
+                    os.pwrite(fd, data, position)
+                    position += len(data)
+            finally:
+                os.close(fd)
+        finally:
+            response.close()
+            response.release_conn()
+
+        if position - offset != length:
+            raise IOError(
+                f"Short read for {download.remote.object_name} at {offset}: "
+                f"{position - offset} of {length} bytes"
+            )
+
+        download.mark_done(index)
+        return length
+
+    def _finalize_download(self, download: _FileDownload) -> None:
+        """Verify a completed .part file and move it to its final name."""
+        remote = download.remote
+        size = download.part_path.stat().st_size
+        if size != remote.size:
+            raise IOError(f"Size mismatch for {remote.object_name}: {size} != {remote.size}")
+
+        if (
+            settings.storage_verify_checksums
+            and _checksum_matches(download.part_path, remote) is False
+        ):
+            # Discard the partial state so the next attempt starts clean
+            download.part_path.unlink()
+            download.state_path.unlink(missing_ok=True)
+            raise IOError(f"Checksum mismatch for {remote.object_name}")
+
+        os.replace(download.part_path, download.target)
+        download.state_path.unlink(missing_ok=True)
+
+    def _swap_into_place(self, staging: Path, local_path: Path) -> None:
+        """Atomically rename a completed staging directory to local_path."""
+        if not local_path.exists():
+            os.replace(staging, local_path)
+            return
+
+        # Directories cannot be replaced in one rename; move the old one aside
+        # first (restore_interrupted_swap recovers it if we stop in between)
+        retired = local_path.with_name(f".{local_path.name}.old-{int(time.time() * 1000)}")
+        os.replace(local_path, retired)
+        os.replace(staging, local_path)
+        shutil.rmtree(retired, ignore_errors=True)
+
+    def restore_interrupted_swap(self, local_path: Path) -> None:
+        """
+        Recover from a _swap_into_place that stopped between its two renames.
+
+        If local_path is missing, the newest copy moved aside is renamed back;
+        copies left behind next to an existing local_path are removed.
+        """
+        retired = sorted(
+            local_path.parent.glob(f".{local_path.name}.old-*"),
+            key=lambda path: int(path.name.rsplit("-", 1)[1])
+        )
+        if not retired:
+            return
+
+        if not local_path.exists():
+            os.replace(retired.pop(), local_path)
+            logger.warning(f"Restored cached model {local_path} after an interrupted update")
+        for path in retired:
+            shutil.rmtree(path, ignore_errors=True)
+
     def upload_model(
         self,
         model_name: str,
         version: str,
-        local_path: Path
+        local_path: Path,
+        progress: Optional[ProgressCallback] = None
     ) -> bool:
         """
         Upload model from local path to MinIO.
 
+        Files are uploaded concurrently on storage_transfer_workers threads;
+        large files use multipart uploads with storage_upload_part_size_mb
+        parts, storage_upload_parallel_parts at a time.
+
+        Each upload writes to a fresh revision prefix under
+        storage_revision_prefix, which nothing reads until the version's
+        index entry is switched to it once every file is uploaded. Readers
+        therefore never see a partially uploaded version, and re-uploading
+        a version never overwrites objects a download may be reading. The
+        revision being replaced is kept for downloads still in flight; older
+        ones are deleted, while newer ones (concurrent uploads of the same
+        version) are left to their publishers.
+
         Args:
             model_name: Name of the model
             version: Version of the model
             local_path: Path to local model directory
+            progress: Optional callback receiving (bytes uploaded, total bytes)
 
         Returns:
             True if upload successful, False otherwise
@@ -154,25 +653,53 @@ class ModelStorage:
                 logger.error(f"Local path does not exist: {local_path}")
                 return False
 
+            start_time = time.time()
+            file_paths = [
+                p for p in local_path.rglob("*")
+                if p.is_file() and p.name != LOCAL_MANIFEST
+            ]
+            tracker = _TransferProgress(
+                f"Uploading {model_name} v{version}",
+                sum(p.stat().st_size for p in file_paths),
+                progress
+            )
+
+            revision = f"{int(time.time() * 1000)}-{uuid4().hex[:8]}"
+            object_prefix = f"{self._revisions_prefix(model_name, version)}{revision}/"
+
             # Upload all files in directory
-            uploaded_files = 0
-            for file_path in local_path.rglob("*"):
-                if file_path.is_file():
-                    # Construct object name
-                    relative_path = file_path.relative_to(local_path)
-                    object_name = f"{model_name}/{version}/{relative_path}"
-
-                    # Upload file
-                    self.client.fput_object(
-                        self.bucket,
-                        object_name,
-                        str(file_path)
-                    )
-                    uploaded_files += 1
+            files: Dict[str, Dict[str, Any]] = {}
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=settings.storage_transfer_workers,
+                    thread_name_prefix="model-upload"
+                ) as pool:
+                    futures = [
+                        pool.submit(self._upload_file, object_prefix, local_path, p, tracker)
+                        for p in file_paths
+                    ]
+                    try:
+                        for future in as_completed(futures):
+                            relative_path, entry = future.result()
+                            files[relative_path] = entry
+                    except Exception:
+                        for future in futures:
+                            future.cancel()
+                        raise
+            except Exception:
+                # The pool has waited for running uploads; nothing publishes this revision
+                self._remove_prefix(object_prefix)
+                raise
 
+            # Publish: the index entry is the only pointer to a revision
+            previous = (self._index_entry(model_name, version, refresh=True) or {}).get("prefix")
+            self._record_version(model_name, version, files, object_prefix)
+            self._remove_old_revisions(model_name, version, object_prefix, previous)
+
+            elapsed = time.time() - start_time
             logger.info(
                 f"Uploaded model {model_name} v{version} "
-                f"({uploaded_files} files) to MinIO"
+                f"({len(files)} files, {tracker.total_bytes / MB:.1f} MB in {elapsed:.1f}s) to MinIO"
             )
             return True
 
@@ -183,10 +710,103 @@ class ModelStorage:
             logger.error(f"Unexpected error uploading model {model_name}: {e}")
             return False
 
+    def _upload_file(
+        self,
+        object_prefix: str,
+        local_path: Path,
+        file_path: Path,
+        tracker: _TransferProgress
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Checksum and upload one model file.
+
+        Returns:
+            Tuple of (relative path, index entry)
+        """
+        # Construct object name
+        relative_path = file_path.relative_to(local_path).as_posix()
+        object_name = f"{object_prefix}{relative_path}"
+        sha256 = _hash_file(file_path, "sha256")
+
+        result = self.client.fput_object(
+            self.bucket,
+            object_name,
+            str(file_path),
+            part_size=settings.storage_upload_part_size_mb * MB,
+            num_parallel_uploads=settings.storage_upload_parallel_parts,
+            progress=_ObjectProgress(tracker)
+        )
+        return relative_path, {
+            "size": file_path.stat().st_size,
+            "etag": (result.etag or "").strip('"'),
+            "sha256": sha256,
+        }
+
+    @staticmethod
+    def _revisions_prefix(model_name: str, version: str) -> str:
+        """Prefix holding the uploaded revisions of a model version."""
+        return f"{settings.storage_revision_prefix}{model_name}/{version}/"
+
+    def _remove_prefix(self, prefix: str) -> None:
+        """Delete every object under a prefix (best effort)."""
+        try:
+            for obj in self.client.list_objects(self.bucket, prefix=prefix, recursive=True):
+                self.client.remove_object(self.bucket, obj.object_name)
+        except Exception as e:
+            logger.warning(f"Failed to remove objects under {prefix}: {e}")
+
+    def _remove_old_revisions(
+        self,
+        model_name: str,
+        version: str,
+        own: str,
+        replaced: Optional[str]
+    ) -> None:
+        """
+        Delete revisions of a model version older than the one replaced.
+
+        The replaced revision is kept for downloads still in flight. Newer
+        revisions may belong to concurrent uploads of the same version that
+        have not been recorded yet, so only older ones are deleted.
+        """
+        if replaced is None:
+            return
+
+        cutoff = self._revision_started(replaced)
+        try:
+            revisions = [
+                obj.object_name
+                for obj in self.client.list_objects(
+                    self.bucket, prefix=self._revisions_prefix(model_name, version)
+                )
+                if obj.is_dir
+                and obj.object_name != own
+                # Revisions started in the same millisecond are not older
+                and self._revision_started(obj.object_name) < cutoff
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to list old revisions of {model_name} v{version}: {e}")
+            return
+
+        for prefix in revisions:
+            self._remove_prefix(prefix)
+
+    @staticmethod
+    def _revision_started(prefix: str) -> int:
+        """Upload start (epoch ms) encoded in a revision prefix."""
+        started = prefix.rstrip("/").rsplit("/", 1)[-1].partition("-")[0]
+        return int(started) if started.isdigit() else 0
+
     def list_models(self) -> List[ModelMetadata]:
         """
         List all available models in storage.
 
+        Indexed versions are read from the cached index (one listing per
+        refresh). Versions that are not indexed, such as models uploaded
+        before the index existed or written without upload_model, come from
+        a walk of the bucket that is repeated at most once per
+        storage_bucket_scan_ttl_seconds (or by rebuild_index).
+
         Returns:
             List of model metadata
         """
@@ -194,45 +814,70 @@ class ModelStorage:
             return []
 
         try:
-            models = []
-            objects = self.client.list_objects(self.bucket, recursive=False)
-
-            for obj in objects:
-                # Object names are in format: model_name/
-                if obj.is_dir:
-                    model_name = obj.object_name.rstrip("/")
-
-                    # List versions for this model
-                    versions = self.client.list_objects(
-                        self.bucket,
-                        prefix=f"{model_name}/",
-                        recursive=False
-                    )
-
-                    for version_obj in versions:
-                        if version_obj.is_dir:
-                            version = version_obj.object_name.split("/")[1]
-                            models.append(ModelMetadata(
-                                name=model_name,
-                                version=version,
-                                size_bytes=version_obj.size or 0,
-                                last_modified=str(version_obj.last_modified),
-                                path=version_obj.object_name
-                            ))
+            index = self.get_index()
+            if index is None:
+                return list(self._scan_bucket())
 
+            models = [
+                ModelMetadata(
+                    name=model_name,
+                    version=version,
+                    size_bytes=entry["size_bytes"],
+                    last_modified=entry["last_modified"],
+                    path=entry.get("prefix") or f"{model_name}/{version}/"
+                )
+                for model_name, versions in index["models"].items()
+                for version, entry in versions.items()
+            ]
+            models.extend(
+                model for model in self._scan_bucket()
+                if model.version not in index["models"].get(model.name, {})
+            )
             return models
 
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
             return []
 
+    def _scan_bucket(self, refresh: bool = False) -> List[ModelMetadata]:
+        """Models found by walking the bucket, cached for storage_bucket_scan_ttl_seconds."""
+        age = time.time() - self._bucket_scanned_at
+        if refresh or age >= settings.storage_bucket_scan_ttl_seconds:
+            self._bucket_models = self._list_models_from_bucket()
+            self._bucket_scanned_at = time.time()
+        return self._bucket_models
+
+    def _list_models_from_bucket(self) -> List[ModelMetadata]:
+        """List models by walking the bucket (one recursive listing)."""
+        reserved = _reserved_prefixes()
+        objects = [
+            obj for obj in self.client.list_objects(self.bucket, recursive=True)
+            if not obj.object_name.startswith(reserved)
+        ]
+
+        return [
+            ModelMetadata(
+                name=model_name,
+                version=version,
+                size_bytes=sum(obj.size or 0 for obj in version_objects),
+                last_modified=max(str(obj.last_modified) for obj in version_objects),
+                path=f"{model_name}/{version}/"
+            )
+            for (model_name, version), version_objects in _group_versions(objects).items()
+        ]
+
     def model_exists(self, model_name: str, version: str = "latest") -> bool:
         """Check if model exists in storage."""
         if not self._connected or not self.client:
             return False
 
         try:
-            # Check if any objects exist with this prefix
+            if self._index_entry(model_name, version) is not None:
+                return True
+
+            # Not indexed (or no index): the model may have been uploaded
+            # without upload_model, so check the prefix directly. Uploads in
+            # progress write under storage_revision_prefix and are not seen.
             objects = list(self.client.list_objects(
                 self.bucket,
                 prefix=f"{model_name}/{version}/",
@@ -242,6 +887,234 @@ class ModelStorage:
         except Exception:
             return False
 
+    def get_index(self, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get the model index, cached for storage_index_ttl_seconds.
+
+        The index is one small object per model version under
+        storage_index_prefix, so publishers of different versions never
+        overwrite each other's entries. A refresh is one listing of that
+        prefix plus a GET for each entry added or changed since the last one.
+
+        Args:
+            refresh: Bypass the in-process cache
+
+        Returns:
+            Index document {"format", "models": {name: {version: entry}}},
+            or None if the bucket has no index entries
+        """
+        with self._index_lock:
+            fresh = time.time() - self._index_loaded_at < settings.storage_index_ttl_seconds
+            if fresh and not refresh:
+                return self._index
+
+            try:
+                models = self._load_index_entries()
+            except Exception as e:
+                logger.warning(f"Failed to read model index: {e}")
+                return self._index
+
+            self._index = {"format": INDEX_FORMAT, "models": models} if models else None
+            self._index_loaded_at = time.time()
+            return self._index
+
+    def _load_index_entries(self) -> Dict[str, Dict[str, Any]]:
+        """List the index prefix and fetch entries not already cached at their ETag."""
+        listed: Dict[str, Tuple[str, Tuple[str, str]]] = {}
+        for obj in self.client.list_objects(
+            self.bucket, prefix=settings.storage_index_prefix, recursive=True
+        ):
+            key = self._index_key(obj.object_name)
+            if key is not None:
+                listed[obj.object_name] = ((obj.etag or "").strip('"'), key)
+
+        stale = [
+            object_name for object_name, (etag, _) in listed.items()
+            if self._index_entries.get(object_name, ("",))[0] != etag
+        ]
+        if stale:
+            with ThreadPoolExecutor(
+                max_workers=settings.storage_transfer_workers,
+                thread_name_prefix="model-index"
+            ) as pool:
+                for object_name, entry in zip(stale, pool.map(self._read_index_entry, stale)):
+                    self._index_entries[object_name] = (listed[object_name][0], entry)
+
+        # Forget entries deleted since the last refresh
+        self._index_entries = {name: self._index_entries[name] for name in listed}
+
+        models: Dict[str, Dict[str, Any]] = {}
+        for object_name, (_, (model_name, version)) in listed.items():
+            entry = self._index_entries[object_name][1]
+            if entry is not None:
+                models.setdefault(model_name, {})[version] = entry
+        return models
+
+    def _read_index_entry(self, object_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch one index entry; None if it vanished or has an unknown format."""
+        try:
+            response = self.client.get_object(self.bucket, object_name)
+            try:
+                entry = json.loads(response.read())
+            finally:
+                response.close()
+                response.release_conn()
+        except S3Error as e:
+            if e.code != "NoSuchKey":
+                raise
+            return None
+
+        if entry.get("format") != INDEX_FORMAT:
+            logger.warning(
+                f"Ignoring index entry {object_name} with unknown format {entry.get('format')}"
+            )
+            return None
+        return entry
+
+    @staticmethod
+    def _index_object(model_name: str, version: str) -> str:
+        """Object name of a model version's index entry."""
+        return f"{settings.storage_index_prefix}{model_name}/{version}.json"
+
+    @staticmethod
+    def _index_key(object_name: str) -> Optional[Tuple[str, str]]:
+        """(model, version) of an index entry object name, if it is one."""
+        name = object_name[len(settings.storage_index_prefix):]
+        if not name.endswith(".json"):
+            return None
+        # Model names may contain "/"; versions do not
+        model_name, _, version = name[:-len(".json")].rpartition("/")
+        if not model_name or not version:
+            return None
+        return model_name, version
+
+    def _index_entry(
+        self,
+        model_name: str,
+        version: str,
+        refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Index entry of a model version, if indexed."""
+        index = self.get_index(refresh=refresh)
+        if index is None:
+            return None
+        return index["models"].get(model_name, {}).get(version)
+
+    def _record_version(
+        self,
+        model_name: str,
+        version: str,
+        files: Dict[str, Dict[str, Any]],
+        prefix: str
+    ) -> None:
+        """Write the index entry of a model version (replacing any previous one)."""
+        self._write_index_entry(model_name, version, {
+            "format": INDEX_FORMAT,
+            "prefix": prefix,
+            "size_bytes": sum(f["size"] for f in files.values()),
+            "last_modified": datetime.now(timezone.utc).isoformat(),
+            "files": files,
+        })
+
+    def _write_index_entry(self, model_name: str, version: str, entry: Dict[str, Any]) -> None:
+        """Upload an index entry and add it to the in-process copy."""
+        object_name = self._index_object(model_name, version)
+        payload = json.dumps(entry, separators=(",", ":")).encode("utf-8")
+        result = self.client.put_object(
+            self.bucket,
+            object_name,
+            io.BytesIO(payload),
+            len(payload),
+            content_type="application/json"
+        )
+        with self._index_lock:
+            self._index_entries[object_name] = ((result.etag or "").strip('"'), entry)
+            if self._index is None:
+                self._index = {"format": INDEX_FORMAT, "models": {}}
+            self._index["models"].setdefault(model_name, {})[version] = entry
+
+    def _remove_index_entry(self, model_name: str, version: str) -> None:
+        """Delete an index entry and drop it from the in-process copy."""
+        object_name = self._index_object(model_name, version)
+        self.client.remove_object(self.bucket, object_name)
+        with self._index_lock:
+            self._index_entries.pop(object_name, None)
+            if self._index is not None:
+                self._index["models"].get(model_name, {}).pop(version, None)
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the index from a full bucket listing.
+
+        Registers models uploaded without upload_model and removes entries
+        whose objects are gone. Versions published by upload_model keep
+        their entry while its revision exists. SHA-256 checksums are kept
+        for files whose ETag is unchanged since they were indexed; unchanged
+        entries are not rewritten.
+
+        Returns:
+            Number of model versions indexed
+        """
+        previous = self.get_index(refresh=True) or {"models": {}}
+        reserved = _reserved_prefixes()
+        revision_prefix = settings.storage_revision_prefix
+        models: Dict[str, Dict[str, Any]] = {}
+        revision_objects: List[str] = []
+        model_objects = []
+
+        for obj in self.client.list_objects(self.bucket, recursive=True):
+            if obj.object_name.startswith(revision_prefix):
+                revision_objects.append(obj.object_name)
+            elif not obj.object_name.startswith(reserved):
+                model_objects.append(obj)
+
+        for (model_name, version), version_objects in _group_versions(model_objects).items():
+            prefix = f"{model_name}/{version}/"
+            known = previous["models"].get(model_name, {}).get(version, {}).get("files", {})
+            entry = models.setdefault(model_name, {})[version] = {
+                "format": INDEX_FORMAT,
+                "size_bytes": 0,
+                "last_modified": "",
+                "files": {},
+            }
+            for obj in version_objects:
+                relative_path = obj.object_name[len(prefix):]
+                etag = (obj.etag or "").strip('"')
+                entry["files"][relative_path] = {"size": obj.size or 0, "etag": etag}
+                if relative_path in known and known[relative_path].get("etag") == etag:
+                    entry["files"][relative_path]["sha256"] = known[relative_path].get("sha256")
+                entry["size_bytes"] += obj.size or 0
+                entry["last_modified"] = max(entry["last_modified"], str(obj.last_modified))
+
+        # Revision prefixes are recorded in the entries, so they are matched, not parsed
+        revision_objects.sort()
+        for model_name, versions in previous["models"].items():
+            for version, entry in versions.items():
+                prefix = entry.get("prefix")
+                if prefix and _has_prefix(revision_objects, prefix):
+                    models.setdefault(model_name, {})[version] = entry
+
+        removed = [
+            (model_name, version)
+            for model_name, versions in previous["models"].items()
+            for version in versions
+            if version not in models.get(model_name, {})
+        ]
+        for model_name, versions in models.items():
+            for version, entry in versions.items():
+                known = previous["models"].get(model_name, {}).get(version)
+                if known is None or known.get("files") != entry["files"]:
+                    self._write_index_entry(model_name, version, entry)
+        for model_name, version in removed:
+            self._remove_index_entry(model_name, version)
+
+        # The walk above saw every model; the next list_models rescans
+        self._bucket_scanned_at = 0.0
+
+        count = sum(len(versions) for versions in models.values())
+        logger.info(f"Rebuilt model index with {count} model versions")
+        return count
+
     @property
     def is_connected(self) -> bool:
         """Check if storage is connected."""
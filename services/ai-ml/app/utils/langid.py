@@ -0,0 +1,221 @@
+"""Compact character n-gram language identification."""
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from app.utils.langid_samples import training_corpus
+
+
+# Unicode ranges for scripts; languages with a unique script need no n-grams
+_SCRIPT_RANGES: List[Tuple[int, int, str]] = [
+    (0x0041, 0x024F, "latin"),
+    (0x1E00, 0x1EFF, "latin"),
+    (0x0370, 0x03FF, "greek"),
+    (0x0400, 0x04FF, "cyrillic"),
+    (0x0590, 0x05FF, "hebrew"),
+    (0x0600, 0x06FF, "arabic"),
+    (0x0750, 0x077F, "arabic"),
+    (0xFB50, 0xFDFF, "arabic"),
+    (0xFE70, 0xFEFF, "arabic"),
+    (0x0900, 0x097F, "devanagari"),
+    (0x0980, 0x09FF, "bengali"),
+    (0x0A80, 0x0AFF, "gujarati"),
+    (0x0B80, 0x0BFF, "tamil"),
+    (0x0C00, 0x0C7F, "telugu"),
+    (0x0C80, 0x0CFF, "kannada"),
+    (0x0D00, 0x0D7F, "malayalam"),
+    (0x0D80, 0x0DFF, "sinhala"),
+    (0x0E00, 0x0E7F, "thai"),
+    (0x1200, 0x139F, "ethiopic"),
+    (0x1100, 0x11FF, "hangul"),
+    (0x3130, 0x318F, "hangul"),
+    (0xAC00, 0xD7AF, "hangul"),
+    (0x3040, 0x309F, "kana"),
+    (0x30A0, 0x30FF, "kana"),
+    (0x4E00, 0x9FFF, "han"),
+    (0x3400, 0x4DBF, "han"),
+]
+
+_SCRIPT_LANGUAGES: Dict[str, str] = {
+    "greek": "el",
+    "hebrew": "he",
+    "bengali": "bn",
+    "gujarati": "gu",
+    "tamil": "ta",
+    "telugu": "te",
+    "kannada": "kn",
+    "malayalam": "ml",
+    "sinhala": "si",
+    "thai": "th",
+    "ethiopic": "am",
+    "hangul": "ko",
+    "kana": "ja",
+    "han": "zh",
+}
+
+_NON_LETTERS = re.compile(r"[\W\d_]+")
+
+# Whole words count as much as this many n-grams; they separate languages whose
+# character statistics are close (Italian/Spanish, Turkish/Indonesian) and carry
+# short inputs like "Hi" or "Merhaba" that have few n-grams to go on
+WORD_WEIGHT = 3
+
+# Probability of an n-gram a language never produced, relative to one seen once
+# in the largest profile. Lower values let rare but telling n-grams count more.
+UNSEEN_WEIGHT = 0.1
+
+
+@lru_cache(maxsize=4096)
+def _script_of(char: str) -> Optional[str]:
+    """Return the script name of a character, or None if not a known letter."""
+    code = ord(char)
+    for low, high, script in _SCRIPT_RANGES:
+        if low <= code <= high:
+            return script
+    return None
+
+
+def _ngrams(text: str, order: int) -> Counter:
+    """
+    Counts of space-padded character n-grams (1..order) of each word in text.
+
+    Words longer than the n-grams are also counted whole, WORD_WEIGHT times.
+    """
+    grams: Counter = Counter()
+    for word in _NON_LETTERS.sub(" ", text).split():
+        padded = f" {word} "
+        for n in range(1, order + 1):
+            grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+        if len(padded) > order:
+            grams[padded] += WORD_WEIGHT
+    return grams
+
+
+class LanguageDetector:
+    """
+    Naive Bayes language identifier over character n-grams.
+
+    The dominant script decides the language outright where only one supported
+    language uses it (Korean, Thai, Greek, ...). Shared scripts (Latin,
+    Cyrillic, Devanagari, Arabic) are scored against per-language n-gram
+    profiles built once from embedded sample text. Profiles are indexed per
+    script, so an input is only scored against languages written in it.
+    """
+
+    def __init__(
+        self,
+        samples: Optional[Mapping[str, str]] = None,
+        order: int = 3,
+        max_chars: int = 120
+    ):
+        """
+        Build n-gram profiles.
+
+        Args:
+            samples: Training text per language code (default: embedded corpus)
+            order: Longest n-gram length
+            max_chars: Only the first max_chars characters are scored
+        """
+        self.order = order
+        self.max_chars = max_chars
+        self._script_candidates: Dict[str, List[str]] = {}
+        # script -> n-gram -> [(candidate position, log P(n-gram | language) - unseen floor)]
+        self._index: Dict[str, Dict[str, List[Tuple[int, float]]]] = {}
+
+        profiles = {}
+        for lang, text in (samples or training_corpus()).items():
+            text = unicodedata.normalize("NFC", text.lower())
+            profiles[lang] = (text, _ngrams(text, order))
+
+        # One floor for n-grams a language never produced, so that languages
+        # with more training text are not penalised for it
+        largest = max(sum(counts.values()) for _, counts in profiles.values())
+        self._unseen = math.log(UNSEEN_WEIGHT / largest)
+
+        for lang, (text, counts) in profiles.items():
+            script = self._dominant_script(text)
+            if not script:
+                continue
+            candidates = self._script_candidates.setdefault(script, [])
+            index = self._index.setdefault(script, {})
+            position = len(candidates)
+            candidates.append(lang)
+
+            total = sum(counts.values())
+            for gram, count in counts.items():
+                index.setdefault(gram, []).append(
+                    (position, math.log(count / total) - self._unseen)
+                )
+
+    @property
+    def languages(self) -> List[str]:
+        """Language codes this detector can return."""
+        trained = {lang for langs in self._script_candidates.values() for lang in langs}
+        return sorted(trained | set(_SCRIPT_LANGUAGES.values()))
+
+    @staticmethod
+    def _dominant_script(text: str) -> Optional[str]:
+        """Most frequent script among the letters of text."""
+        counts: Counter = Counter()
+        for char in text:
+            if char.isalpha():
+                script = _script_of(char)
+                if script:
+                    counts[script] += 1
+        if not counts:
+            return None
+        # Japanese mixes kana with kanji; any kana means Japanese, not Chinese
+        if counts.get("kana") and counts.get("han"):
+            return "kana"
+        return counts.most_common(1)[0][0]
+
+    def detect(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Identify the language of text.
+
+        Args:
+            text: Input text (only the first max_chars characters are used)
+
+        Returns:
+            Tuple of (ISO 639-1 code or None if undetermined, confidence 0-1)
+        """
+        sample = unicodedata.normalize("NFC", text[:self.max_chars].lower())
+        script = self._dominant_script(sample)
+        if script is None:
+            return None, 0.0
+
+        if script in _SCRIPT_LANGUAGES:
+            return _SCRIPT_LANGUAGES[script], 1.0
+
+        candidates = self._script_candidates.get(script)
+        if not candidates:
+            return None, 0.0
+        if len(candidates) == 1:
+            return candidates[0], 1.0
+
+        grams = _ngrams(sample, self.order)
+        total = sum(grams.values())
+        if not total:
+            return None, 0.0
+
+        # Every language starts at the unseen floor; only n-grams it has seen
+        # move its score, so the cost scales with the input, not the languages
+        index = self._index[script]
+        scores = [0.0] * len(candidates)
+        for gram, count in grams.items():
+            for position, delta in index.get(gram, ()):
+                scores[position] += count * delta
+
+        # Softmax over per-n-gram average log-likelihoods, sharpened with length
+        top = max(scores)
+        sharpness = 1 / math.sqrt(total)
+        norm = sum(math.exp((score - top) * sharpness) for score in scores)
+        return candidates[scores.index(top)], round(1 / norm, 4)
+
+
+# Global language detector instance (profiles are built at import)
+language_detector = LanguageDetector()
@@ -0,0 +1,390 @@
+"""Training text for the n-gram language identifier.
+
+Each sample is Article 1 of the Universal Declaration of Human Rights plus a
+few everyday sentences. Languages with a unique script (Korean, Thai, Greek,
+...) are identified by script alone and need no sample.
+"""
+
+from typing import Dict
+
+SAMPLES: Dict[str, str] = {
+    # Latin script
+    "en": (
+        "All human beings are born free and equal in dignity and rights. They are endowed "
+        "with reason and conscience and should act towards one another in a spirit of "
+        "brotherhood. Hello, how are you today? Thank you very much for your help. Where is "
+        "the nearest hospital? The teacher and the students are in the school."
+    ),
+    "es": (
+        "Todos los seres humanos nacen libres e iguales en dignidad y derechos y, dotados "
+        "como están de razón y conciencia, deben comportarse fraternalmente los unos con los "
+        "otros. Hola, ¿cómo estás hoy? Muchas gracias por tu ayuda. ¿Dónde está el hospital "
+        "más cercano? El maestro y los estudiantes están en la escuela."
+    ),
+    "fr": (
+        "Tous les êtres humains naissent libres et égaux en dignité et en droits. Ils sont "
+        "doués de raison et de conscience et doivent agir les uns envers les autres dans un "
+        "esprit de fraternité. Bonjour, comment allez-vous aujourd'hui ? Merci beaucoup pour "
+        "votre aide. Où est l'hôpital le plus proche ? Le professeur et les élèves sont à l'école."
+    ),
+    "de": (
+        "Alle Menschen sind frei und gleich an Würde und Rechten geboren. Sie sind mit "
+        "Vernunft und Gewissen begabt und sollen einander im Geist der Brüderlichkeit "
+        "begegnen. Hallo, wie geht es dir heute? Vielen Dank für deine Hilfe. Wo ist das "
+        "nächste Krankenhaus? Der Lehrer und die Schüler sind in der Schule."
+    ),
+    "it": (
+        "Tutti gli esseri umani nascono liberi ed eguali in dignità e diritti. Essi sono "
+        "dotati di ragione e di coscienza e devono agire gli uni verso gli altri in spirito "
+        "di fratellanza. Ciao, come stai oggi? Grazie mille per il tuo aiuto. Dov'è "
+        "l'ospedale più vicino? L'insegnante e gli studenti sono a scuola."
+    ),
+    "pt": (
+        "Todos os seres humanos nascem livres e iguais em dignidade e em direitos. Dotados "
+        "de razão e de consciência, devem agir uns para com os outros em espírito de "
+        "fraternidade. Olá, como você está hoje? Muito obrigado pela sua ajuda. Onde fica o "
+        "hospital mais próximo? O professor e os alunos estão na escola."
+    ),
+    "sw": (
+        "Watu wote wamezaliwa huru, hadhi na haki zao ni sawa. Wote wamejaliwa akili na "
+        "dhamiri, hivyo yapasa watendeane kindugu. Habari, hujambo leo? Asante sana kwa "
+        "msaada wako. Hospitali iliyo karibu iko wapi? Mwalimu na wanafunzi wako shuleni."
+    ),
+    "yo": (
+        "Gbogbo ènìyàn ni a bí ní òmìnira; iyì àti ẹ̀tọ́ kọ̀ọ̀kan sì dọ́gba. Wọ́n ní ẹ̀bùn ti "
+        "làákàyè àti ti ẹ̀rí-ọkàn, ó sì yẹ kí wọn ó máa hùwà sí ara wọn gẹ́gẹ́ bí ọmọ ìyá. "
+        "Báwo ni, ṣé dáadáa ni? E ṣé púpọ̀ fún ìrànlọ́wọ́ yín. Níbo ni ilé ìwòsàn tó sún mọ́ "
+        "jù wà? Olùkọ́ àti àwọn akẹ́kọ̀ọ́ wà ní ilé ìwé."
+    ),
+    "ig": (
+        "Onye ọ bụla ka amụrụ nwere onwe ya, nweekwa ugwu na ikike nha anya. E nyere ha uche "
+        "na mmụọ ime ihe ziri ezi, ha kwesịrị ịkpaso ibe ha agwa n'obi nwanne na nwanne. "
+        "Ndewo, kedu ka ị mere taa? Daalụ nke ukwuu maka enyemaka gị. Ebee ka ụlọ ọgwụ kacha "
+        "nso dị? Onye nkuzi na ụmụ akwụkwọ nọ n'ụlọ akwụkwọ."
+    ),
+    "ha": (
+        "Su dai 'yan-adam, ana haihuwarsu ne duka 'yantattu, kuma kowannensu na da mutunci da "
+        "hakkoki daidai da na kowa. Suna da hankali da tunani, saboda haka duk abin da za su "
+        "aikata wa juna, ya kamata su yi shi a cikin 'yan-uwanci. Sannu, yaya kake yau? Na "
+        "gode sosai da taimakon ka. Ina asibiti mafi kusa yake? Malami da dalibai suna makaranta."
+    ),
+    "so": (
+        "Aadanaha dhammaantiis wuxuu dhashaa isagoo xor ah kana siman xagga sharafta iyo "
+        "xuquuqda. Waxaa Alle siiyay aqoon iyo wacyi, waana in qof la arkaa qofka kale ula "
+        "dhaqmaa si walaaltinimo ah. Salaan, sidee tahay maanta? Aad baad u mahadsantahay "
+        "caawimaaddaada. Xaggee buu ku yaal isbitaalka ugu dhow? Macallinka iyo ardayda "
+        "waxay joogaan dugsiga."
+    ),
+    "zu": (
+        "Bonke abantu bazalwa bekhululekile belingana ngesithunzi nangamalungelo. Banikwe "
+        "umcabango nonembeza futhi kufanele baphathane ngomoya wobunye. Sawubona, unjani "
+        "namuhla? Ngiyabonga kakhulu ngosizo lwakho. Sikuphi isibhedlela esiseduze? Uthisha "
+        "nabafundi basesikoleni."
+    ),
+    "xh": (
+        "Bonke abantu bazalwa bekhululekile kwaye belingana ngesidima nangokweemfanelo. "
+        "Bonke banesiphiwo sesazela nesizathu sokwenza isenzo ngomoya wobuzalwana. Molo, "
+        "unjani namhlanje? Enkosi kakhulu ngoncedo lwakho. Siphi isibhedlele esikufutshane? "
+        "Utitshala nabafundi basesikolweni."
+    ),
+    "sn": (
+        "Vanhu vese vanoberekwa vakasununguka uye vakaenzana pakodzero nechiremera. "
+        "Vakapihwa njere nehana uye vanofanira kubatana nomweya wehukama. Mhoro, makadii "
+        "nhasi? Ndatenda zvikuru nerubatsiro rwenyu. Chipatara chiri pedyo chiri kupi? "
+        "Mudzidzisi nevadzidzi vari kuchikoro."
+    ),
+    "ny": (
+        "Anthu onse amabadwa aufulu ndiponso ofanana mu ulemu ndi ufulu wawo. Iwo ali ndi "
+        "nzeru ndi chikumbumtima ndipo ayenera kuchitirana wina ndi mnzake mwaubale. Moni, "
+        "muli bwanji lero? Zikomo kwambiri chifukwa cha thandizo lanu. Chipatala chapafupi "
+        "chili kuti? Mphunzitsi ndi ophunzira ali kusukulu."
+    ),
+    "rw": (
+        "Abantu bose bavuka bafite umudendezo kandi bareshya mu gaciro no mu burenganzira. "
+        "Bafite ubushobozi bwo gutekereza n'umutimanama kandi bagomba gukorera bagenzi babo "
+        "mu mwuka wa kivandimwe. Muraho, amakuru yawe uyu munsi? Murakoze cyane ku bufasha "
+        "bwanyu. Ibitaro biri hafi biri he? Umwarimu n'abanyeshuri bari ku ishuri."
+    ),
+    "st": (
+        "Batho bohle ba tswalwa ba lokolohile mme ba lekana ka seriti le ditokelo. Ba "
+        "tswetswe le monahano le letswalo mme ba tlameha ho phedisana le ba bang ka moya wa "
+        "boena. Dumela, o phela jwang kajeno? Ke a leboha haholo ka thuso ya hao. Sepetlele "
+        "se haufi se hokae? Mosuwe le baithuti ba sekolong."
+    ),
+    "tn": (
+        "Batho botlhe ba tsetswe ba gololesegile e bile ba lekalekana ka seriti le "
+        "ditshwanelo. Ba abetswe go akanya le maikutlo, mme ba tshwanetse go direlana ka "
+        "mowa wa bokaulengwe. Dumela, o tsogile jang gompieno? Ke a leboga thata ka thuso ya "
+        "gago. Bookelo jo bo gaufi bo kae? Morutabana le baithuti ba kwa sekolong."
+    ),
+    "vi": (
+        "Tất cả mọi người sinh ra đều được tự do và bình đẳng về nhân phẩm và quyền. Mọi con "
+        "người đều được tạo hóa ban cho lý trí và lương tâm và cần phải đối xử với nhau trong "
+        "tình anh em. Xin chào, hôm nay bạn có khỏe không? Cảm ơn bạn rất nhiều vì sự giúp "
+        "đỡ. Bệnh viện gần nhất ở đâu? Giáo viên và học sinh đang ở trường."
+    ),
+    "id": (
+        "Semua orang dilahirkan merdeka dan mempunyai martabat dan hak-hak yang sama. Mereka "
+        "dikaruniai akal dan hati nurani dan hendaknya bergaul satu sama lain dalam semangat "
+        "persaudaraan. Halo, apa kabar hari ini? Terima kasih banyak atas bantuan Anda. Di "
+        "mana rumah sakit terdekat? Guru dan murid-murid ada di sekolah."
+    ),
+    "ms": (
+        "Semua manusia dilahirkan bebas dan samarata dari segi kemuliaan dan hak-hak. Mereka "
+        "mempunyai pemikiran dan perasaan hati dan hendaklah bertindak di antara satu sama "
+        "lain dengan semangat persaudaraan. Helo, apa khabar hari ini? Terima kasih banyak "
+        "atas bantuan anda. Di manakah hospital yang terdekat? Cikgu dan pelajar berada di sekolah."
+    ),
+    "tl": (
+        "Ang lahat ng tao ay isinilang na malaya at pantay-pantay sa karangalan at mga "
+        "karapatan. Sila ay pinagkalooban ng katwiran at budhi at dapat magturingan sa isa't "
+        "isa sa diwa ng pagkakapatiran. Kumusta, kumusta ka ngayon? Maraming salamat sa "
+        "iyong tulong. Nasaan ang pinakamalapit na ospital? Ang guro at ang mga estudyante "
+        "ay nasa paaralan."
+    ),
+    "pl": (
+        "Wszyscy ludzie rodzą się wolni i równi pod względem swej godności i swych praw. Są "
+        "oni obdarzeni rozumem i sumieniem i powinni postępować wobec innych w duchu "
+        "braterstwa. Cześć, jak się dzisiaj masz? Bardzo dziękuję za twoją pomoc. Gdzie jest "
+        "najbliższy szpital? Nauczyciel i uczniowie są w szkole."
+    ),
+    "cs": (
+        "Všichni lidé rodí se svobodní a sobě rovní co do důstojnosti a práv. Jsou nadáni "
+        "rozumem a svědomím a mají spolu jednat v duchu bratrství. Ahoj, jak se dnes máš? "
+        "Moc děkuji za tvou pomoc. Kde je nejbližší nemocnice? Učitel a studenti jsou ve škole."
+    ),
+    "ro": (
+        "Toate ființele umane se nasc libere și egale în demnitate și în drepturi. Ele sunt "
+        "înzestrate cu rațiune și conștiință și trebuie să se comporte unele față de altele "
+        "în spiritul fraternității. Bună ziua, ce mai faci astăzi? Mulțumesc foarte mult "
+        "pentru ajutor. Unde este cel mai apropiat spital? Profesorul și elevii sunt la școală."
+    ),
+    "tr": (
+        "Bütün insanlar hür, haysiyet ve haklar bakımından eşit doğarlar. Akıl ve vicdana "
+        "sahiptirler ve birbirlerine karşı kardeşlik zihniyeti ile hareket etmelidirler. "
+        "Merhaba, bugün nasılsın? Yardımın için çok teşekkür ederim. En yakın hastane nerede? "
+        "Öğretmen ve öğrenciler okulda."
+    ),
+    "nl": (
+        "Alle mensen worden vrij en gelijk in waardigheid en rechten geboren. Zij zijn "
+        "begiftigd met verstand en geweten, en behoren zich jegens elkander in een geest van "
+        "broederschap te gedragen. Hallo, hoe gaat het vandaag met je? Heel erg bedankt voor "
+        "je hulp. Waar is het dichtstbijzijnde ziekenhuis? De leraar en de leerlingen zijn op school."
+    ),
+    "sv": (
+        "Alla människor är födda fria och lika i värde och rättigheter. De är utrustade med "
+        "förnuft och samvete och bör handla gentemot varandra i en anda av broderskap. Hej, "
+        "hur mår du idag? Tack så mycket för din hjälp. Var ligger närmaste sjukhus? Läraren "
+        "och eleverna är i skolan."
+    ),
+    # Cyrillic script
+    "ru": (
+        "Все люди рождаются свободными и равными в своем достоинстве и правах. Они наделены "
+        "разумом и совестью и должны поступать в отношении друг друга в духе братства. "
+        "Здравствуйте, как у вас дела сегодня? Большое спасибо за помощь. Где находится "
+        "ближайшая больница?"
+    ),
+    "uk": (
+        "Всі люди народжуються вільними і рівними у своїй гідності та правах. Вони наділені "
+        "розумом і совістю і повинні діяти у відношенні один до одного в дусі братерства. "
+        "Привіт, як у вас справи сьогодні? Щиро дякую за допомогу. Де знаходиться найближча "
+        "лікарня?"
+    ),
+    # Devanagari script
+    "hi": (
+        "सभी मनुष्यों को गौरव और अधिकारों के मामले में जन्मजात स्वतन्त्रता और समानता प्राप्त "
+        "है। उन्हें बुद्धि और अन्तरात्मा की देन प्राप्त है और परस्पर उन्हें भाईचारे के भाव से "
+        "बर्ताव करना चाहिए। नमस्ते, आज आप कैसे हैं? आपकी मदद के लिए बहुत धन्यवाद। सबसे "
+        "नज़दीकी अस्पताल कहाँ है?"
+    ),
+    "mr": (
+        "सर्व मानवी व्यक्ति जन्मतःच स्वतंत्र आहेत व त्यांना समान प्रतिष्ठा व समान अधिकार "
+        "आहेत. त्यांना विचारशक्ती व सदसद्विवेकबुद्धी लाभलेली आहे व त्यांनी एकमेकांशी "
+        "बंधुत्वाच्या भावनेने आचरण करावे. नमस्कार, आज तुम्ही कसे आहात? तुमच्या मदतीबद्दल "
+        "खूप धन्यवाद. सर्वात जवळचे रुग्णालय कुठे आहे?"
+    ),
+    "ne": (
+        "सबै व्यक्तिहरू जन्मजात स्वतन्त्र हुन् ती सबैको समान अधिकार र महत्व छ। निजहरूमा "
+        "विचार शक्ति र सद्विचार भएकोले निजहरूले आपसमा भातृत्वको भावनाबाट व्यवहार गर्नु "
+        "पर्छ। नमस्ते, आज तपाईंलाई कस्तो छ? तपाईंको सहयोगको लागि धेरै धन्यवाद। "
+        "सबैभन्दा नजिकको अस्पताल कहाँ छ?"
+    ),
+    # Arabic script
+    "ar": (
+        "يولد جميع الناس أحرارًا متساوين في الكرامة والحقوق. وقد وهبوا عقلاً وضميرًا وعليهم "
+        "أن يعامل بعضهم بعضًا بروح الإخاء. مرحبا، كيف حالك اليوم؟ شكرا جزيلا على مساعدتك. "
+        "أين أقرب مستشفى؟"
+    ),
+    "fa": (
+        "تمام افراد بشر آزاد به دنیا می‌آیند و از لحاظ حیثیت و حقوق با هم برابرند. همه دارای "
+        "عقل و وجدان هستند و باید نسبت به یکدیگر با روح برادری رفتار کنند. سلام، امروز حال "
+        "شما چطور است؟ خیلی ممنون از کمک شما. نزدیک‌ترین بیمارستان کجاست؟"
+    ),
+    "ur": (
+        "تمام انسان آزاد اور حقوق و عزت کے اعتبار سے برابر پیدا ہوئے ہیں۔ انہیں ضمیر اور عقل "
+        "ودیعت ہوئی ہے۔ اس لیے انہیں ایک دوسرے کے ساتھ بھائی چارے کا سلوک کرنا چاہیے۔ "
+        "السلام علیکم، آج آپ کیسے ہیں؟ آپ کی مدد کا بہت شکریہ۔ سب سے قریبی ہسپتال کہاں ہے؟"
+    ),
+}
+
+# Frequent function words; they dominate short inputs
+COMMON_WORDS: Dict[str, str] = {
+    "en": (
+        "the of and to in is you that it he was for on are as with his they at be this "
+        "have from or one had by but not what all were we when your can said there an "
+        "which she do how their if will up about out many then them so my would"
+    ),
+    "es": (
+        "de la que el en y a los del se las por un para con no una su al lo como más pero "
+        "sus le ya o este sí porque esta entre cuando muy sin sobre también me hasta hay "
+        "donde quien desde todo nos todos uno les ni ellos esto yo otro él mucho nada ella "
+        "año niño niña mañana señor pequeño hijo hija tiene tengo"
+    ),
+    "fr": (
+        "de la le et les des en un du une que est pour qui dans par plus pas au sur ne se "
+        "ce il sont avec son mais comme on ou ses nous vous elle leur été fait aussi bien "
+        "je tout cette très sans peut mon ma mes"
+    ),
+    "de": (
+        "der die und in den von zu das mit sich des auf für ist im dem nicht ein eine als "
+        "auch es an werden aus er hat dass sie nach wird bei einer um am sind noch wie "
+        "einem über einen so zum war haben nur oder aber vor zur bis mehr durch man ich"
+    ),
+    "it": (
+        "di e il la che è per un in non una del le si con sono da al mi ma lo gli della "
+        "come ha anche più questo se ci io ne tu nel alla quando molto sua suo loro "
+        "perché cosa sei mio mia"
+    ),
+    "pt": (
+        "de a o que e do da em um para é com não uma os no se na por mais as dos como mas "
+        "foi ao ele das tem à seu sua ou ser quando muito há nos já está eu também só pelo "
+        "pela até isso ela entre era depois sem mesmo aos ter seus meu minha"
+    ),
+    "sw": (
+        "na ya wa kwa la ni katika za kuwa hiyo hii cha yake kama lakini pia sana mimi "
+        "wewe yeye sisi wao baada kabla sasa leo kesho nyumba mtu watu kazi"
+    ),
+    "yo": (
+        "ni ti àti ó láti ní kí wọ́n a sí fún pé mo o rẹ̀ yìí kò jẹ́ bí nínú ṣùgbọ́n tí ń "
+        "lè àwọn wa"
+    ),
+    "ig": (
+        "na nke ya n'ime ka ọ bụ m ha gị anyị unu ihe onye mmadụ ebe oge ma ọzọ niile "
+        "kwa ga nwere"
+    ),
+    "ha": (
+        "da a na ya ba su ta ce cikin kuma don ga wannan shi mu ku za amma haka sun yi ne "
+        "ko daga kan wanda"
+    ),
+    "so": (
+        "iyo oo ka ku u ee waa in ah ayaa uu ay la waxaa ugu soo si ayuu kale hadda maxaa "
+        "sidoo laakiin"
+    ),
+    "zu": (
+        "futhi uma kodwa ngoba lokho abantu kakhulu manje ukuthi yini kanjani lapha lapho "
+        "bona thina nina wena mina"
+    ),
+    "xh": (
+        "kwaye ukuba kodwa ngokuba abantu kakhulu ngoku ukuthi yintoni njani apha apho "
+        "bona thina nina wena mna"
+    ),
+    "sn": (
+        "uye asi nekuti vanhu zvakanaka zvino kuti chii sei pano ipapo ivo isu imi iwe "
+        "ini zvose kana zvakare"
+    ),
+    "ny": (
+        "ndi kuti koma chifukwa anthu kwambiri tsopano chiyani bwanji pano apo iwo ife "
+        "inu iwe ine onse ngati komanso"
+    ),
+    "rw": (
+        "kandi ariko kuko abantu cyane ubu ngo iki gute hano aho bo twe mwe wowe njye "
+        "bose niba kugira"
+    ),
+    "st": (
+        "le mme hobane batho haholo jwale hore eng jwang mona moo bona rona lona wena nna "
+        "bohle ha hape"
+    ),
+    "tn": (
+        "le mme ka gore batho thata jaanong eng jang fano kwa bone rona lona wena nna "
+        "botlhe fa gape"
+    ),
+    "vi": (
+        "của và các có được là trong cho không người những một với này đã để khi đến ra "
+        "như từ cũng nhiều sẽ tôi chúng ta họ rằng thì làm"
+    ),
+    "id": (
+        "yang dan di itu dengan untuk tidak ini dari dalam akan pada juga saya ke karena "
+        "tersebut bisa ada mereka lebih kami sudah atau adalah oleh sebagai harus kita "
+        "jika belum sangat uang pemerintah"
+    ),
+    "ms": (
+        "yang dan di itu dengan untuk tidak ini dari dalam akan pada juga saya ke kerana "
+        "tersebut boleh ada mereka lebih kami sudah atau ialah oleh sebagai perlu kita "
+        "jika belum sangat wang kerajaan"
+    ),
+    "tl": (
+        "ang ng sa na at mga ay hindi ko ako siya mo ka niya ito kung may para pa lang "
+        "naman kami sila din rin po kanyang yung nang"
+    ),
+    "pl": (
+        "i w nie na się z do to że jest o jak co ale po tak od za czy już dla tylko jego "
+        "jej przez może być był bardzo ich są także który która które kiedy gdzie jeszcze"
+    ),
+    "cs": (
+        "a se na je v to že s z o do i jako by ale pro jsem který jak tak jsou po k jeho "
+        "už jen co když nebo jsme není bylo být mají také které ve velmi"
+    ),
+    "ro": (
+        "și de la în a pe cu nu că o să se un din mai este ce care au fost pentru lui ca "
+        "dar ei sunt îl am foarte când acest această iar fi sau"
+    ),
+    "tr": (
+        "ve bir bu da de için ile ne çok daha gibi ama o olarak var ben sen en her kadar "
+        "sonra olan değil mi diye şey yok bunu ki göre nasıl neden şimdi lütfen yarın gün "
+        "iyi bana sana ona onlar biz siz çocuk ağır kız ışık"
+    ),
+    "nl": (
+        "de van een het en in is dat op te zijn met voor niet die aan er om hij ook als "
+        "bij of dan nog maar wat uit zo worden naar kan door wordt over we ze heeft "
+        "hebben ik jij wij meer mijn"
+    ),
+    "sv": (
+        "och i att det som en på är av för med till den har de inte om ett han men var "
+        "jag sig från vi så kan man när år säger hon under också efter eller nu sin där "
+        "vid mot ska skulle kommer ut får finns vara mitt min"
+    ),
+}
+
+
+# Greetings and courtesies: short chat messages often consist of nothing else
+SHORT_PHRASES: Dict[str, str] = {
+    "en": (
+        "hi hello hey thanks thank you please yes no okay ok sorry bye goodbye good morning "
+        "good night welcome great nice see you tomorrow"
+    ),
+    "es": "hola gracias por favor sí adiós buenos días buenas noches hasta luego mañana bien",
+    "fr": "bonjour salut merci oui non au revoir bonsoir à demain bien",
+    "de": "hallo danke bitte ja nein tschüss guten morgen guten abend bis morgen gut",
+    "it": (
+        "ciao grazie prego buongiorno buonasera buonanotte arrivederci sì scusa a domani "
+        "ci vediamo bene"
+    ),
+    "pt": "olá oi obrigado obrigada sim não tchau bom dia boa noite até amanhã",
+    "sw": "habari jambo asante tafadhali ndiyo hapana kwaheri karibu asubuhi kesho",
+    "id": "halo terima kasih ya tidak selamat pagi selamat malam sampai jumpa besok",
+    "nl": "hallo dank je bedankt alsjeblieft ja nee goedemorgen tot ziens tot morgen",
+    "sv": "hej tack ja nej god morgon hejdå välkommen vi ses i morgon",
+    "pl": "cześć dziękuję proszę tak nie dzień dobry do widzenia do jutra",
+    "tr": (
+        "merhaba selam teşekkürler teşekkür ederim evet hayır günaydın iyi akşamlar "
+        "nasılsın görüşürüz tamam"
+    ),
+}
+
+
+def training_corpus() -> Dict[str, str]:
+    """Sample sentences plus frequent words and short phrases, per language."""
+    return {
+        lang: f"{text} {COMMON_WORDS.get(lang, '')} {SHORT_PHRASES.get(lang, '')}"
+        for lang, text in SAMPLES.items()
+    }
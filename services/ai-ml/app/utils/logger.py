@@ -1,21 +1,53 @@
 """Structured logging configuration."""
 
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
-from typing import Any, Dict
-import json
-from datetime import datetime
+import time
+import traceback
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
 from app.core.config import settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record dict (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return json.dumps(data, default=str)
+
 
 class JSONFormatter(logging.Formatter):
     """Format logs as JSON for structured logging."""
 
+    def __init__(self):
+        """Initialize formatter."""
+        super().__init__()
+        # Records within the same second share the formatted date and time
+        self._cached_second = -1
+        self._cached_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        """Naive-UTC ISO 8601 timestamp with microseconds."""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._cached_prefix}.{int((created - second) * 1_000_000):06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -25,20 +57,122 @@ class JSONFormatter(logging.Formatter):
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
 
         # Add extra fields
         if hasattr(record, "extra"):
             log_data.update(record.extra)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of low-severity records from chatty loggers.
+
+    Rates are keyed by logger name; a record matches the longest configured
+    name that equals its logger or is a parent of it. WARNING and above are
+    never sampled.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        """
+        Initialize sampling filter.
+
+        Args:
+            rates: Logger name -> fraction of INFO/DEBUG records to keep
+        """
+        super().__init__()
+        self.rates = rates
+        self.sampled_out = 0
+        self._resolved: Dict[str, Optional[float]] = {}
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        """Sample rate for a logger name, resolved once per name."""
+        if name not in self._resolved:
+            rate = None
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether to keep a record."""
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+
+        rate = self._rate_for(record.name)
+        if rate is None or random.random() < rate:
+            return True
+
+        self.sampled_out += 1
+        return False
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Hand records to the listener thread without blocking the caller.
+
+    Formatting and writing happen on the listener thread; the caller only
+    resolves the message. When the queue is full the record is dropped and
+    counted, and the next record that fits is preceded by a warning.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        """Initialize handler."""
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make the record safe to format on another thread, cheaply."""
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Traceback objects pin frames; render them now
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, dropping it if the queue is full."""
+        if self._unreported:
+            notice = logging.LogRecord(
+                settings.service_name, logging.WARNING, __file__, 0,
+                f"Dropped {self._unreported} log records (log queue full)", None, None
+            )
+            try:
+                self.queue.put_nowait(notice)
+                self._unreported = 0
+            except queue.Full:
+                pass
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[BoundedQueueHandler] = None
+_sampling_filter: Optional[SamplingFilter] = None
 
 
 def setup_logging() -> logging.Logger:
     """Configure and return logger instance."""
+    global _listener, _queue_handler, _sampling_filter
+
     logger = logging.getLogger(settings.service_name)
     logger.setLevel(getattr(logging, settings.log_level.upper()))
 
     # Remove existing handlers
+    shutdown_logging()
     logger.handlers.clear()
 
     # Console handler
@@ -55,11 +189,55 @@ def setup_logging() -> logging.Logger:
         )
         console_handler.setFormatter(formatter)
 
-    logger.addHandler(console_handler)
+    _sampling_filter = SamplingFilter(settings.log_sample_rates)
+
+    if settings.log_async:
+        # Callers enqueue; a listener thread formats and writes to stdout
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=settings.log_queue_size)
+        _queue_handler = BoundedQueueHandler(log_queue)
+        _queue_handler.addFilter(_sampling_filter)
+        logger.addHandler(_queue_handler)
+        _listener = QueueListener(log_queue, console_handler)
+        _listener.start()
+    else:
+        console_handler.addFilter(_sampling_filter)
+        logger.addHandler(console_handler)
+
     logger.propagate = False
 
     return logger
 
 
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a child of the service logger.
+
+    Child loggers share the service handlers; their names are what
+    LOG_SAMPLE_RATES matches against.
+
+    Args:
+        name: Component name, e.g. "translation"
+    """
+    return logger.getChild(name)
+
+
+def get_log_stats() -> Dict[str, int]:
+    """Get dropped, sampled-out and queued record counts."""
+    return {
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+        "sampled_out": _sampling_filter.sampled_out if _sampling_filter else 0,
+        "queued": _queue_handler.queue.qsize() if _queue_handler else 0,
+    }
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 # Global logger instance
 logger = setup_logging()
+atexit.register(shutdown_logging)
@@ -0,0 +1,123 @@
+"""Sentence-aware text segmentation for translation."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+
+@dataclass
+class Segment:
+    """Translatable unit and the whitespace that followed it in the source."""
+    text: str
+    separator: str
+
+
+# Line breaks (with surrounding whitespace) always end a segment
+_LINE_BREAK = re.compile(r"[ \t]*\n\s*")
+
+# Latin-style terminators need trailing whitespace; CJK terminators do not
+_SENTENCE_END = re.compile(r"[.!?]+[\"'”’)\]]*(\s+)|[。！？]+(\s*)")
+
+# Words whose trailing period does not end a sentence
+_ABBREVIATIONS = {
+    "dr", "mr", "mrs", "ms", "prof", "st", "sr", "jr", "vs", "etc",
+    "e.g", "i.e", "no", "fig", "approx", "dept",
+}
+
+
+def _is_abbreviation(block: str, end: int) -> bool:
+    """Check whether the period ending at block[end] belongs to an abbreviation."""
+    word = block[:end].rsplit(None, 1)[-1].lower() if block[:end].strip() else ""
+    return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def _split_sentences(block: str) -> List[Segment]:
+    """Split one line/paragraph into sentences."""
+    segments = []
+    start = 0
+
+    for match in _SENTENCE_END.finditer(block):
+        group = 1 if match.group(1) is not None else 2
+        end = match.start(group)
+        if match.end() >= len(block):
+            break
+        if block[match.start()] == "." and _is_abbreviation(block, match.start()):
+            continue
+        segments.append(Segment(block[start:end], match.group(group)))
+        start = match.end()
+
+    segments.append(Segment(block[start:], ""))
+    return segments
+
+
+def _split_long(segment: Segment, max_chars: int) -> List[Segment]:
+    """Hard-split a segment longer than max_chars at whitespace."""
+    if len(segment.text) <= max_chars:
+        return [segment]
+
+    pieces = []
+    text = segment.text
+    while len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(Segment(text[:cut], " " if text[cut:cut + 1] == " " else ""))
+        text = text[cut:].lstrip(" ")
+    pieces.append(Segment(text, segment.separator))
+    return pieces
+
+
+def split_segments(
+    text: str,
+    max_chars: int = 600,
+    preserve_formatting: bool = True
+) -> Tuple[str, List[Segment]]:
+    """
+    Split text into sentence segments for independent translation.
+
+    Args:
+        text: Source document
+        max_chars: Maximum characters per segment
+        preserve_formatting: Keep original whitespace and line breaks; if
+            False, whitespace is collapsed and segments are joined by spaces
+
+    Returns:
+        Tuple of (leading whitespace, segments); join_segments reverses it
+    """
+    body = text.strip()
+    leading = text[:len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()):]
+
+    if not body:
+        return text, []
+
+    if not preserve_formatting:
+        body = " ".join(body.split())
+        leading = trailing = ""
+
+    segments: List[Segment] = []
+    position = 0
+    for match in _LINE_BREAK.finditer(body):
+        for sentence in _split_sentences(body[position:match.start()]):
+            segments.extend(_split_long(sentence, max_chars))
+        segments[-1].separator = match.group(0)
+        position = match.end()
+
+    for sentence in _split_sentences(body[position:]):
+        segments.extend(_split_long(sentence, max_chars))
+    segments[-1].separator = trailing
+
+    return leading, segments
+
+
+def join_segments(
+    leading: str,
+    segments: Sequence[Segment],
+    translations: Sequence[str]
+) -> str:
+    """Reassemble translated segments with the original separators."""
+    parts = [leading]
+    for segment, translation in zip(segments, translations):
+        parts.append(translation)
+        parts.append(segment.separator)
+    return "".join(parts)
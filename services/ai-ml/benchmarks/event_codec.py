@@ -0,0 +1,106 @@
+"""
+Compare event payload size and encode/decode cost: JSON vs compact binary.
+
+Usage (from services/ai-ml):
+    python -m benchmarks.event_codec [--iterations N]
+"""
+
+import argparse
+import gzip
+import timeit
+from datetime import datetime
+from uuid import uuid4
+
+from app.services.event_codec import (
+    decode_binary,
+    decode_event,
+    encode_binary,
+    encode_json,
+)
+
+
+SAMPLE_DATA = {
+    "ai.translation.completed": {
+        "source_lang": "en",
+        "target_lang": "sw",
+        "character_count": 184,
+        "user_id": "user-5f2c9a",
+    },
+    "ai.prediction.completed": {
+        "model_type": "student_dropout",
+        "prediction": "low_risk",
+        "probability": 0.87,
+        "user_id": None,
+    },
+    "ai.recommendation.generated": {
+        "user_id": "user-5f2c9a",
+        "context": "learning",
+        "recommendation_count": 10,
+    },
+    "ai.image.analyzed": {
+        "analysis_type": "medical",
+        "findings_count": 3,
+        "user_id": "user-5f2c9a",
+    },
+    "ai.model.loaded": {
+        "model_name": "facebook/nllb-200-distilled-600M",
+        "version": "latest",
+        "load_time_ms": 8421.5,
+    },
+}
+
+
+def make_event(event_type: str) -> dict:
+    """Build an envelope the way EventPublisher.publish does."""
+    return {
+        "specversion": "1.0",
+        "type": event_type,
+        "source": "/ai-ml-service",
+        "id": str(uuid4()),
+        "time": datetime.utcnow().isoformat(),
+        "data": SAMPLE_DATA[event_type],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    print(f"{'event type':30} {'json B':>7} {'bin B':>6} {'ratio':>6} "
+          f"{'json enc us':>11} {'bin enc us':>10} {'json dec us':>11} {'bin dec us':>10}")
+
+    total_json = total_binary = 0
+    for event_type in SAMPLE_DATA:
+        event = make_event(event_type)
+        as_json = encode_json(event)
+        as_binary = encode_binary(event)
+        assert decode_event(as_binary) == event, f"round trip failed for {event_type}"
+        total_json += len(as_json)
+        total_binary += len(as_binary)
+
+        timings = [
+            timeit.timeit(lambda: encode_json(event), number=n),
+            timeit.timeit(lambda: encode_binary(event), number=n),
+            timeit.timeit(lambda: decode_event(as_json), number=n),
+            timeit.timeit(lambda: decode_binary(as_binary), number=n),
+        ]
+        print(f"{event_type:30} {len(as_json):7} {len(as_binary):6} "
+              f"{len(as_binary) / len(as_json):6.2f} "
+              + " ".join(f"{t / n * 1e6:{w}.2f}" for t, w in zip(timings, (11, 10, 11, 10))))
+
+    # Kafka compresses record batches; compare compressed batches of 500 events
+    events = [make_event(t) for t in SAMPLE_DATA for _ in range(100)]
+    json_batch = gzip.compress(b"".join(encode_json(e) for e in events))
+    binary_batch = gzip.compress(b"".join(encode_binary(e) for e in events))
+
+    print()
+    print(f"total uncompressed: json {total_json} B, binary {total_binary} B "
+          f"({total_binary / total_json:.0%})")
+    print(f"gzip batch of {len(events)}: json {len(json_batch)} B, binary {len(binary_batch)} B "
+          f"({len(binary_batch) / len(json_batch):.0%})")
+
+
+if __name__ == "__main__":
+    main()
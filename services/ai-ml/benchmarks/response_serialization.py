@@ -0,0 +1,104 @@
+"""
+Compare per-response serialization cost: dict + jsonable_encoder + stdlib
+JSONResponse (the previous route code path) vs api_response().
+
+Usage (from services/ai-ml):
+    python -m benchmarks.response_serialization [--iterations N]
+"""
+
+import argparse
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.responses import api_response
+from app.models.schemas import (
+    BatchTranslationResponse,
+    Recommendation,
+    RecommendationResponse,
+    TranslationResponse,
+)
+
+
+def make_translation(i: int = 0) -> TranslationResponse:
+    """A typical single translation result."""
+    return TranslationResponse(
+        original_text=f"Where is the nearest hospital? I need help with my prescription ({i}).",
+        translated_text=f"Hospitali iliyo karibu iko wapi? Nahitaji msaada na dawa yangu ({i}).",
+        source_lang="en",
+        target_lang="sw",
+        detected_lang="en",
+        confidence=0.92,
+        model="facebook/nllb-200-distilled-600M",
+        cached=False
+    )
+
+
+def make_samples() -> dict:
+    """Responses of the shapes the routes return most."""
+    batch = [make_translation(i) for i in range(50)]
+    return {
+        "translation": (make_translation(), {"cached": False, "character_count": 72}),
+        "batch_translation_50": (
+            BatchTranslationResponse(results=batch, total=len(batch), cached_count=12),
+            {"total": len(batch), "cached_count": 12, "character_count": 3600},
+        ),
+        "recommendation_10": (
+            RecommendationResponse(
+                recommendations=[
+                    Recommendation(
+                        id=f"course_{i:03d}",
+                        title=f"Community health worker module {i}",
+                        relevance_score=0.9 - i * 0.05,
+                        reasoning="Matches your current learning path",
+                        metadata={"duration_minutes": 45, "language": "sw"}
+                    )
+                    for i in range(10)
+                ],
+                personalization={
+                    "user_id": "user-5f2c9a",
+                    "profile_features": ["skill_profile", "learning_history"],
+                    "model": "collaborative-filtering-v1"
+                }
+            ),
+            None,
+        ),
+    }
+
+
+def before(result, metadata) -> bytes:
+    """Previous path: model_dump() dict, encoded by FastAPI, stdlib json render."""
+    content = {"success": True, "message": "Done", "data": result.model_dump()}
+    if metadata is not None:
+        content["metadata"] = metadata
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def after(result, metadata) -> bytes:
+    """api_response(): pydantic-core JSON spliced into an orjson envelope."""
+    return api_response(result, "Done", metadata=metadata).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'response':<24}{'bytes':>8}{'before us':>12}{'after us':>12}{'speedup':>10}")
+    for name, (result, metadata) in make_samples().items():
+        assert json.loads(before(result, metadata)) == json.loads(after(result, metadata))
+
+        t_before = timeit.timeit(lambda: before(result, metadata), number=args.iterations)
+        t_after = timeit.timeit(lambda: after(result, metadata), number=args.iterations)
+        print(
+            f"{name:<24}{len(after(result, metadata)):>8}"
+            f"{t_before / args.iterations * 1e6:>12.1f}"
+            f"{t_after / args.iterations * 1e6:>12.1f}"
+            f"{t_before / t_after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
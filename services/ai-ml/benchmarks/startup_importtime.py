@@ -0,0 +1,109 @@
+"""
+Measure how long it takes to import the service, using ``python -X importtime``.
+
+Imports the application module in a fresh interpreter, reports the total
+import time and the slowest top-level packages, and fails (exit code 1) if
+heavy ML libraries were imported: those must only load when a real model is.
+
+Usage (from services/ai-ml):
+    python -m benchmarks.startup_importtime [--runs N] [--top N] [--module app.py]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+# Must not be imported at startup
+HEAVY_MODULES = ("torch", "transformers", "PIL", "numpy", "tokenizers", "safetensors")
+
+# Load app.py by path: the app/ package shadows it on a plain "import app"
+IMPORT_APP = (
+    "import importlib.util as u; "
+    "s = u.spec_from_file_location('service_main', {path!r}); "
+    "s.loader.exec_module(u.module_from_spec(s))"
+)
+
+
+def run_importtime(module: str) -> List[Tuple[int, str]]:
+    """
+    Import the module in a fresh interpreter.
+
+    Returns:
+        (self time in microseconds, dotted module name) for every import
+    """
+    if module.endswith(".py"):
+        code = IMPORT_APP.format(path=module)
+    else:
+        code = f"import {module}"
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "LOG_LEVEL": "WARNING"},
+    )
+    if result.returncode != 0:
+        sys.exit(f"import failed:\n{result.stderr[-2000:]}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        imports.append((int(self_us), name.strip()))
+    return imports
+
+
+def by_package(imports: List[Tuple[int, str]]) -> Dict[str, int]:
+    """Self time summed per top-level package."""
+    totals: Dict[str, int] = defaultdict(int)
+    for self_us, name in imports:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="app.py", help="app.py or a dotted module")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    totals = []
+    packages: Dict[str, List[int]] = defaultdict(list)
+    loaded = set()
+    for _ in range(args.runs):
+        imports = run_importtime(args.module)
+        totals.append(sum(self_us for self_us, _ in imports))
+        for package, self_us in by_package(imports).items():
+            packages[package].append(self_us)
+        loaded.update(name for _, name in imports)
+
+    print(f"Importing {args.module} ({args.runs} runs, fresh interpreter each)")
+    print(
+        f"  total: median {statistics.median(totals) / 1000:.1f} ms, "
+        f"min {min(totals) / 1000:.1f} ms, max {max(totals) / 1000:.1f} ms"
+    )
+    print(f"  modules imported: {len(loaded)}")
+    print()
+    print(f"{'package':<28}{'median ms':>12}")
+    slowest = sorted(packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for package, samples in slowest[:args.top]:
+        print(f"{package:<28}{statistics.median(samples) / 1000:>12.1f}")
+
+    heavy = sorted({name.split(".")[0] for name in loaded} & set(HEAVY_MODULES))
+    print()
+    if heavy:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(heavy)}")
+        sys.exit(1)
+    print(f"OK: none of {', '.join(HEAVY_MODULES)} imported at startup")
+
+
+if __name__ == "__main__":
+    main()
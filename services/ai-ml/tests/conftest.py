@@ -0,0 +1,196 @@
+"""Pytest configuration and fixtures."""
+
+import asyncio
+import hashlib
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from minio.error import S3Error
+
+from app.core.config import settings
+from app.services.storage import ModelStorage
+
+
+class FakeKafkaProducer:
+    """
+    Local stand-in for AIOKafkaProducer.
+
+    Records acknowledged sends in `sent`; set `fail_start` or `fail_send` to
+    simulate an unreachable broker.
+    """
+
+    def __init__(self, broker: "FakeKafkaBroker"):
+        """Initialize producer bound to a fake broker."""
+        self.broker = broker
+        self.started = False
+        self.stopped = False
+
+    async def start(self) -> None:
+        """Connect to the fake broker."""
+        self.broker.start_attempts += 1
+        if self.broker.down:
+            raise ConnectionError("broker unreachable")
+        self.started = True
+
+    async def stop(self) -> None:
+        """Close the producer."""
+        self.stopped = True
+
+    async def send(self, topic: str, value: bytes, headers: Optional[List[Any]] = None):
+        """Append a message; the returned future resolves on acknowledgement."""
+        future = asyncio.get_running_loop().create_future()
+        if self.broker.down:
+            future.set_exception(ConnectionError("broker unreachable"))
+        else:
+            self.broker.sent.append((topic, value))
+            future.set_result(None)
+        return future
+
+
+class FakeKafkaBroker:
+    """Producer factory whose producers share one in-memory topic log."""
+
+    def __init__(self):
+        """Initialize broker."""
+        self.down = False
+        self.sent: List[Tuple[str, bytes]] = []
+        self.producers: List[FakeKafkaProducer] = []
+        self.start_attempts = 0
+
+    def __call__(self) -> FakeKafkaProducer:
+        """Create an unstarted producer."""
+        producer = FakeKafkaProducer(self)
+        self.producers.append(producer)
+        return producer
+
+
+@pytest.fixture
+def kafka() -> FakeKafkaBroker:
+    """Fake Kafka broker to pass as an EventPublisher producer_factory."""
+    return FakeKafkaBroker()
+
+
+@pytest.fixture
+def fast_events(monkeypatch):
+    """Shrink event publisher timings so background tasks settle quickly."""
+    monkeypatch.setattr(settings, "event_linger_ms", 0)
+    monkeypatch.setattr(settings, "event_reconnect_interval_seconds", 0.01)
+    monkeypatch.setattr(settings, "event_flush_timeout_seconds", 1)
+
+
+class FakeMinioObject:
+    """Listing entry, shaped like minio.datatypes.Object."""
+
+    def __init__(self, object_name: str, size: int = 0, etag: str = "", is_dir: bool = False):
+        """Initialize listing entry."""
+        self.object_name = object_name
+        self.size = size
+        self.etag = etag
+        self.is_dir = is_dir
+        self.last_modified = "2024-01-01 00:00:00+00:00"
+
+
+class FakeMinioResponse:
+    """GetObject response body."""
+
+    def __init__(self, data: bytes):
+        """Initialize response."""
+        self.data = data
+
+    def read(self) -> bytes:
+        """Read the whole body."""
+        return self.data
+
+    def stream(self, amt: int):
+        """Yield the body in blocks."""
+        for i in range(0, len(self.data), amt):
+            yield self.data[i:i + amt]
+
+    def close(self) -> None:
+        """Close the response."""
+
+    def release_conn(self) -> None:
+        """Return the connection to the pool."""
+
+
+class FakeMinio:
+    """In-memory stand-in for the minio.Minio client (one bucket)."""
+
+    def __init__(self):
+        """Initialize an empty bucket."""
+        self.objects: Dict[str, bytes] = {}
+        self.lock = threading.Lock()
+
+    def put(self, object_name: str, data: bytes) -> None:
+        """Store an object directly (as an out-of-band upload would)."""
+        with self.lock:
+            self.objects[object_name] = data
+
+    def bucket_exists(self, bucket: str) -> bool:
+        """The bucket always exists."""
+        return True
+
+    def list_objects(self, bucket: str, prefix: str = "", recursive: bool = False):
+        """List objects under prefix, grouping by "/" unless recursive."""
+        with self.lock:
+            names = sorted(name for name in self.objects if name.startswith(prefix))
+            objects = dict(self.objects)
+
+        dirs = set()
+        for name in names:
+            rest = name[len(prefix):]
+            if not recursive and "/" in rest:
+                directory = prefix + rest.split("/", 1)[0] + "/"
+                if directory not in dirs:
+                    dirs.add(directory)
+                    yield FakeMinioObject(directory, is_dir=True)
+                continue
+            data = objects[name]
+            yield FakeMinioObject(name, len(data), hashlib.md5(data).hexdigest())
+
+    def get_object(self, bucket: str, object_name: str, offset: int = 0, length: Optional[int] = None):
+        """Fetch an object, or a byte range of it."""
+        with self.lock:
+            data = self.objects.get(object_name)
+        if data is None:
+            raise S3Error("NoSuchKey", "Object does not exist", object_name, "", "", None)
+        end = len(data) if length is None else offset + length
+        return FakeMinioResponse(data[offset:end])
+
+    def put_object(self, bucket: str, object_name: str, data, length: int, **kwargs):
+        """Store an object from a stream."""
+        self.put(object_name, data.read(length))
+        return SimpleNamespace(etag=hashlib.md5(self.objects[object_name]).hexdigest())
+
+    def fput_object(self, bucket: str, object_name: str, file_path: str, progress=None, **kwargs):
+        """Store an object from a file."""
+        with open(file_path, "rb") as f:
+            data = f.read()
+        self.put(object_name, data)
+        if progress is not None:
+            progress.set_meta(object_name, len(data))
+            progress.update(len(data))
+        return SimpleNamespace(etag=hashlib.md5(data).hexdigest())
+
+    def remove_object(self, bucket: str, object_name: str) -> None:
+        """Delete an object."""
+        with self.lock:
+            self.objects.pop(object_name, None)
+
+
+@pytest.fixture
+def minio() -> FakeMinio:
+    """Fake MinIO bucket."""
+    return FakeMinio()
+
+
+@pytest.fixture
+def storage(minio, tmp_path, monkeypatch) -> ModelStorage:
+    """ModelStorage connected to the fake bucket, caching models under tmp_path."""
+    monkeypatch.setattr(settings, "model_cache_dir", str(tmp_path / "models"))
+    storage = ModelStorage()
+    storage.client = minio
+    storage._connected = True
+    return storage
@@ -0,0 +1,120 @@
+"""Tests for the micro-batching scheduler."""
+
+import asyncio
+
+import pytest
+
+from app.core.batching import BatchScheduler
+
+
+def recording(batches):
+    """Batch function that upper-cases inputs and records each batch."""
+    def batch_fn(items):
+        batches.append(list(items))
+        return [item.upper() for item in items]
+    return batch_fn
+
+
+class TestBatchScheduler:
+    """Concurrent submissions share forward passes."""
+
+    async def test_results_fan_out_to_callers_in_order(self):
+        scheduler = BatchScheduler(max_batch_size=8, max_wait_ms=10)
+        batches = []
+
+        results = await asyncio.gather(*(
+            scheduler.submit("m", text, recording(batches)) for text in ["a", "b", "c"]
+        ))
+
+        assert results == ["A", "B", "C"]
+        assert batches == [["a", "b", "c"]]
+        assert scheduler.get_stats()["items"] == 3
+
+    async def test_full_batches_are_dispatched_without_waiting(self):
+        scheduler = BatchScheduler(max_batch_size=2, max_wait_ms=60000)
+        batches = []
+
+        results = await asyncio.wait_for(asyncio.gather(*(
+            scheduler.submit("m", text, recording(batches)) for text in ["a", "b", "c", "d"]
+        )), 5)
+
+        assert results == ["A", "B", "C", "D"]
+        assert batches == [["a", "b"], ["c", "d"]]
+
+    async def test_keys_are_batched_separately(self):
+        scheduler = BatchScheduler(max_batch_size=8, max_wait_ms=10)
+        batches = []
+
+        results = await asyncio.gather(
+            scheduler.submit("en:fr", "a", recording(batches)),
+            scheduler.submit("en:sw", "b", recording(batches)),
+            scheduler.submit("en:fr", "c", recording(batches)),
+        )
+
+        assert results == ["A", "B", "C"]
+        assert sorted(batches) == [["a", "c"], ["b"]]
+
+    async def test_failed_batch_fails_every_caller(self):
+        scheduler = BatchScheduler(max_batch_size=8, max_wait_ms=10)
+
+        def short(items):
+            return items[:1]
+
+        results = await asyncio.gather(
+            scheduler.submit("m", "a", short),
+            scheduler.submit("m", "b", short),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert scheduler.get_stats()["failed_batches"] == 1
+
+    async def test_cancelled_caller_is_left_out_of_the_batch(self):
+        scheduler = BatchScheduler(max_batch_size=8, max_wait_ms=10)
+        batches = []
+
+        cancelled = asyncio.ensure_future(scheduler.submit("m", "a", recording(batches)))
+        kept = asyncio.ensure_future(scheduler.submit("m", "b", recording(batches)))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == "B"
+        assert batches == [["b"]]
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+
+class TestBatchMetrics:
+    """Batch size and queue wait are exported as Prometheus histograms."""
+
+    async def test_batches_are_exported_per_engine(self, monkeypatch):
+        from app.core import batching
+        from app.core.metrics import ServiceMetrics, _StatsCollector
+        from tests.test_metrics import family
+
+        metrics = ServiceMetrics()
+        monkeypatch.setattr(batching, "service_metrics", metrics)
+        scheduler = BatchScheduler(max_batch_size=8, max_wait_ms=10)
+        batches = []
+
+        await asyncio.gather(*(
+            scheduler.submit("nllb:en:fr", text, recording(batches)) for text in ["a", "b", "c"]
+        ))
+        await scheduler.submit("whisper", "d", recording(batches))
+
+        families = list(_StatsCollector(metrics).collect())
+        sizes = {
+            (sample.labels["engine"], sample.labels["le"]): sample.value
+            for sample in family(families, "ai_batch_size").samples
+            if sample.name == "ai_batch_size_bucket"
+        }
+        assert sizes[("nllb", "2")] == 0
+        assert sizes[("nllb", "4")] == 1
+        assert sizes[("whisper", "1")] == 1
+
+        waits = {
+            sample.labels["engine"]: sample.value
+            for sample in family(families, "ai_batch_queue_wait_seconds").samples
+            if sample.name == "ai_batch_queue_wait_seconds_count"
+        }
+        assert waits == {"nllb": 3, "whisper": 1}
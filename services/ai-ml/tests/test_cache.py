@@ -0,0 +1,177 @@
+"""Tests for the inference result cache."""
+
+import asyncio
+import time
+import warnings
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from app.core.config import settings
+from app.services.cache import CacheService, LocalCache
+
+
+@pytest.fixture
+def cache() -> CacheService:
+    """Cache without Redis (in-process L1 only)."""
+    return CacheService()
+
+
+@pytest.fixture
+def two_tier() -> CacheService:
+    """Cache with an in-process L1 in front of a fake Redis."""
+    cache = CacheService()
+    cache.redis = FakeRedis(decode_responses=True)
+    cache._connected = True
+    return cache
+
+
+class TestLocalCache:
+    """In-process LRU."""
+
+    def test_expired_entries_are_not_returned(self):
+        local = LocalCache(max_entries=10)
+        local.set("a", 1, 0)
+        assert local.get("a") is None
+        assert len(local) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        local = LocalCache(max_entries=2)
+        local.set("a", 1, 60)
+        local.set("b", 2, 60)
+        local.get("a")
+        local.set("c", 3, 60)
+
+        assert [local.get(key) for key in ("a", "b", "c")] == [1, None, 3]
+
+
+class TestTwoTierCache:
+    """L1 in front of Redis."""
+
+    async def test_redis_hit_fills_l1(self, two_tier):
+        await two_tier.redis.set("svc:translation:k", '{"v": 1}')
+
+        assert await two_tier.get("svc:translation:k") == {"v": 1}
+        await two_tier.redis.delete("svc:translation:k")
+        assert await two_tier.get("svc:translation:k") == {"v": 1}
+
+        assert two_tier.stats["l2_hits"] == 1 and two_tier.stats["l1_hits"] == 1
+        assert two_tier.prefix_stats["translation"]["l1_hits"] == 1
+
+    async def test_l1_ttl_is_capped_and_redis_keeps_the_full_ttl(self, two_tier, monkeypatch):
+        monkeypatch.setattr(settings, "local_cache_ttl_seconds", 30)
+
+        await two_tier.set("svc:prediction:k", {"v": 1}, ttl=3600)
+
+        expires_at, _ = two_tier.local._data["svc:prediction:k"]
+        assert expires_at - time.time() <= 30
+        assert 3590 < await two_tier.redis.ttl("svc:prediction:k") <= 3600
+
+    async def test_l1_ttl_of_a_redis_hit_follows_its_prefix(self, two_tier, monkeypatch):
+        monkeypatch.setattr(settings, "local_cache_ttl_seconds", 3600)
+        await two_tier.redis.set("svc:prediction:k", "1")
+
+        await two_tier.get("svc:prediction:k")
+
+        expires_at, _ = two_tier.local._data["svc:prediction:k"]
+        assert expires_at - time.time() <= settings.prediction_cache_ttl
+
+    async def test_invalidate_pattern_clears_l1_and_redis(self, two_tier):
+        await two_tier.set("svc:translation:a", 1)
+        await two_tier.set("svc:translation:b", 2)
+        await two_tier.set("svc:prediction:c", 3)
+
+        assert await two_tier.invalidate_pattern("svc:translation:*") == 2
+
+        assert await two_tier.mget(
+            ["svc:translation:a", "svc:translation:b", "svc:prediction:c"]
+        ) == [None, None, 3]
+        assert await two_tier.redis.exists("svc:translation:a") == 0
+
+
+    async def test_writes_set_their_ttl_without_deprecated_commands(self, two_tier):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            await two_tier.set("svc:prediction:a", 1, ttl=60)
+            await two_tier.mset({"svc:prediction:b": 2, "svc:prediction:c": 3}, ttl=120)
+
+        assert 50 < await two_tier.redis.ttl("svc:prediction:a") <= 60
+        assert 110 < await two_tier.redis.ttl("svc:prediction:c") <= 120
+        assert await two_tier.redis.get("svc:prediction:b") == "2"
+
+
+class TestComputeOnce:
+    """Concurrent misses share one computation."""
+
+    async def test_cancelled_leader_does_not_fail_waiters(self, cache):
+        release = asyncio.Event()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await release.wait()
+            return {"value": 1}
+
+        leader = asyncio.ensure_future(cache.get_or_compute("svc:p:k", compute, 60))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_compute("svc:p:k", compute, 60))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        assert await waiter == ({"value": 1}, False)
+        assert leader.cancelled()
+        assert calls == [1]
+        assert await cache.get_or_compute("svc:p:k", compute, 60) == ({"value": 1}, True)
+
+    async def test_stale_entries_are_refreshed_with_refresh(self, cache, monkeypatch):
+        monkeypatch.setattr(settings, "cache_soft_ttl_ratio", 0)
+        calls = []
+
+        async def compute():
+            calls.append("compute")
+            return len(calls)
+
+        async def refresh():
+            calls.append("refresh")
+            return len(calls)
+
+        assert await cache.get_or_compute("svc:p:k", compute, 60, refresh) == (1, False)
+        assert await cache.get_or_compute("svc:p:k", compute, 60, refresh) == (1, True)
+        await asyncio.gather(*cache._refresh_tasks.values())
+
+        assert calls == ["compute", "refresh"]
+        assert (await cache.get_or_compute("svc:p:k", compute, 60, refresh))[0] == 2
+
+
+class TestSegmentCache:
+    """Cached translation segments are revalidated like single entries."""
+
+    async def test_stale_segments_are_served_and_refreshed_once(self, cache, monkeypatch):
+        monkeypatch.setattr(settings, "cache_soft_ttl_ratio", 0)
+        segments = [("a", "en", "fr"), ("b", "en", "fr"), ("c", "en", "fr")]
+        await cache.set_translations([(*segment, {"v": 1}) for segment in segments[:2]])
+        refreshed = []
+
+        async def refresh(stale):
+            refreshed.append(stale)
+            return [{"v": 2}, None]
+
+        first = await cache.get_translations(segments, refresh)
+        second = await cache.get_translations(segments, refresh)
+        await asyncio.gather(*cache._refresh_tasks.values())
+
+        assert first == second == [{"v": 1}, {"v": 1}, None]
+        assert refreshed == [segments[:2]]
+        assert cache.stats["stale_hits"] == 4 and cache.stats["refreshes"] == 1
+        assert await cache.get_translations(segments) == [{"v": 2}, {"v": 1}, None]
+
+    async def test_fresh_segments_are_not_refreshed(self, cache):
+        await cache.set_translations([("a", "en", "fr", {"v": 1})])
+
+        async def refresh(stale):
+            raise AssertionError("fresh segment refreshed")
+
+        assert await cache.get_translations([("a", "en", "fr")], refresh) == [{"v": 1}]
+        assert cache._refresh_tasks == {}
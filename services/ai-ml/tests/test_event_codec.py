@@ -0,0 +1,91 @@
+"""Tests for the compact binary event encoding."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.services.event_codec import (
+    BINARY_CONTENT_TYPE,
+    EVENT_SCHEMAS,
+    JSON_CONTENT_TYPE,
+    decode_event,
+    encode_event,
+)
+
+
+SAMPLE_VALUES = {"str": "fr", "optstr": None, "u32": 42, "f64": 0.87}
+
+
+def envelope(event_type: str, data: dict) -> dict:
+    """CloudEvents envelope as EventPublisher.publish builds it."""
+    return {
+        "specversion": "1.0",
+        "type": event_type,
+        "source": "/ai-ml",
+        "id": str(uuid4()),
+        "time": "2024-01-02T03:04:05.000006",
+        "data": data,
+    }
+
+
+class TestBinaryEncoding:
+    """Binary events decode to the envelope they were encoded from."""
+
+    @pytest.mark.parametrize("event_type,fields", EVENT_SCHEMAS)
+    def test_every_event_type_round_trips(self, event_type, fields):
+        event = envelope(event_type, {name: SAMPLE_VALUES[kind] for name, kind in fields})
+
+        payload, content_type = encode_event(event, "binary")
+
+        assert content_type == BINARY_CONTENT_TYPE
+        assert decode_event(payload, content_type) == event
+        assert decode_event(payload) == event
+        assert len(payload) < len(encode_event(event, "json")[0])
+
+    def test_wire_format_is_stable(self):
+        event = envelope("ai.model.failed", {"model_name": "m", "error": "oom"})
+        event["id"] = "12345678-1234-5678-1234-567812345678"
+
+        payload, _ = encode_event(event, "binary")
+
+        assert payload.hex() == (
+            "ae0105" "12345678123456781234567812345678" "00060dedc04dd346"
+            "00062f61692d6d6c" "00016d" "00036f6f6d"
+        )
+
+    def test_offset_timestamps_are_stored_as_utc(self):
+        event = envelope("ai.model.failed", {"model_name": "m", "error": "oom"})
+        event["time"] = "2024-01-02T05:04:05.000006+02:00"
+
+        payload, _ = encode_event(event, "binary")
+
+        assert decode_event(payload)["time"] == "2024-01-02T03:04:05.000006"
+
+
+class TestJsonFallback:
+    """Events the binary layout cannot carry are sent as JSON."""
+
+    def test_unknown_event_type_falls_back_to_json(self):
+        event = envelope("ai.custom.event", {"anything": [1, 2]})
+
+        payload, content_type = encode_event(event, "binary")
+
+        assert content_type == JSON_CONTENT_TYPE
+        assert decode_event(payload, content_type) == event
+        assert decode_event(payload) == event
+
+    def test_data_not_matching_the_schema_falls_back_to_json(self):
+        event = envelope("ai.model.failed", {"model_name": "m", "error": "oom", "extra": 1})
+
+        payload, content_type = encode_event(event, "binary")
+
+        assert content_type == JSON_CONTENT_TYPE
+        assert decode_event(payload) == event
+
+    def test_json_encoding_is_the_cloudevents_envelope(self):
+        event = envelope("ai.model.failed", {"model_name": "m", "error": "oom"})
+
+        payload, content_type = encode_event(event)
+
+        assert content_type == JSON_CONTENT_TYPE
+        assert decode_event(payload) == event
@@ -0,0 +1,129 @@
+"""Tests for the Kafka event publisher and its spill journal."""
+
+import asyncio
+
+import pytest
+
+from app.services.event_journal import EventJournal
+from app.services.events import EventPublisher
+
+
+async def wait_until(condition, timeout: float = 2.0) -> None:
+    """Poll until condition() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+def recover_tasks():
+    """Running EventPublisher recovery tasks."""
+    return [
+        task for task in asyncio.all_tasks()
+        if not task.done() and "EventPublisher._recover" in repr(task.get_coro())
+    ]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Journal in a temporary directory."""
+    return EventJournal(str(tmp_path / "journal"))
+
+
+@pytest.mark.usefixtures("fast_events")
+class TestJournalSpillAndReplay:
+    """Events survive a broker outage through the journal."""
+
+    async def test_events_spill_while_broker_down_and_replay_on_reconnect(self, kafka, journal):
+        kafka.down = True
+        publisher = EventPublisher(producer_factory=kafka, journal=journal)
+        await publisher.connect()
+        assert not publisher.is_connected
+
+        for i in range(5):
+            assert await publisher.publish("ai.test", {"i": i})
+        await wait_until(lambda: journal.pending_events == 5)
+        assert kafka.sent == []
+
+        kafka.down = False
+        await wait_until(lambda: journal.pending_events == 0)
+        assert publisher.is_connected
+        assert len(kafka.sent) == 5
+        assert publisher.replay_stats["replayed"] == 5
+
+        await publisher.disconnect()
+
+    async def test_events_spilled_during_a_replay_are_replayed(self, kafka, journal):
+        kafka.down = True
+        publisher = EventPublisher(producer_factory=kafka, journal=journal)
+        await publisher.connect()
+        for i in range(3):
+            await publisher.publish("ai.test", {"i": i})
+        await wait_until(lambda: journal.pending_events == 3)
+
+        # A batch fails and is spilled while the first segment is being replayed
+        read_segment = journal.read_segment
+        def spilling_read(path):
+            journal.read_segment = read_segment
+            journal.append([("ai.events", {"type": "ai.test", "data": {"i": i}}) for i in range(2)])
+            return read_segment(path)
+        journal.read_segment = spilling_read
+
+        kafka.down = False
+        await wait_until(lambda: journal.pending_events == 0)
+        assert len(kafka.sent) == 5
+
+        await publisher.disconnect()
+
+    async def test_journal_from_previous_run_is_replayed_on_connect(self, kafka, tmp_path):
+        directory = str(tmp_path / "journal")
+        previous = EventJournal(directory)
+        previous.open()
+        previous.append([("ai.events", {"type": "ai.test", "data": {"i": i}}) for i in range(3)])
+
+        journal = EventJournal(directory)
+        publisher = EventPublisher(producer_factory=kafka, journal=journal)
+        await publisher.connect()
+
+        await wait_until(lambda: len(kafka.sent) == 3)
+        await wait_until(lambda: journal.pending_events == 0)
+        await publisher.disconnect()
+
+    async def test_flush_on_disconnect_keeps_undelivered_events_journaled(self, kafka, journal):
+        kafka.down = True
+        publisher = EventPublisher(producer_factory=kafka, journal=journal)
+        await publisher.connect()
+        await publisher.publish("ai.test", {})
+        await publisher.disconnect()
+
+        assert journal.pending_events == 1
+
+
+@pytest.mark.usefixtures("fast_events")
+class TestShutdownAndReconnect:
+    """Recovery does not outlive the publisher or leak producers."""
+
+    async def test_disconnect_leaves_no_recovery_task(self, kafka, journal):
+        kafka.down = True
+        publisher = EventPublisher(producer_factory=kafka, journal=journal)
+        await publisher.connect()
+        await publisher.publish("ai.test", {})
+
+        await publisher.disconnect()
+
+        assert recover_tasks() == []
+        attempts = kafka.start_attempts
+        kafka.down = False
+        await asyncio.sleep(0.05)
+        assert kafka.start_attempts == attempts
+        assert publisher.producer is None
+
+    async def test_producers_that_fail_to_start_are_stopped(self, kafka, journal):
+        kafka.down = True
+        publisher = EventPublisher(producer_factory=kafka, journal=journal)
+        await publisher.connect()
+        await wait_until(lambda: kafka.start_attempts >= 3)
+        await publisher.disconnect()
+
+        assert all(producer.stopped for producer in kafka.producers)
@@ -0,0 +1,62 @@
+"""Tests for the bounded inference executor."""
+
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import ai_routes
+from app.core.inference import InferenceExecutor, InferenceTimeoutError
+
+
+@pytest.fixture
+def executor():
+    """Single-worker executor with a short timeout."""
+    executor = InferenceExecutor(max_workers=1, timeout_seconds=0.05)
+    yield executor
+    executor.shutdown()
+
+
+class TestInferenceTimeout:
+    """Calls past inference_timeout_seconds give up without blocking the pool."""
+
+    async def test_queued_call_is_dropped_on_timeout(self, executor):
+        release = threading.Event()
+        ran = []
+        busy = executor._executor.submit(release.wait, 5)
+
+        with pytest.raises(InferenceTimeoutError):
+            await executor.run(ran.append, "queued")
+        release.set()
+        busy.result(5)
+        assert await executor.run(lambda: "next") == "next"
+
+        assert ran == []
+        assert executor.get_stats()["in_flight"] == 0
+
+    async def test_running_call_times_out_and_frees_its_slot(self, executor):
+        release = threading.Event()
+
+        with pytest.raises(InferenceTimeoutError):
+            await executor.run(release.wait, 5)
+        assert executor.get_stats()["in_flight"] == 0
+
+        release.set()
+        assert await executor.run(lambda: "next", timeout=5) == "next"
+
+    def test_timeout_maps_to_504(self, monkeypatch):
+        async def translate(request):
+            raise InferenceTimeoutError("Inference timed out after 0.05s")
+
+        monkeypatch.setattr(ai_routes.translation_engine, "translate", translate)
+        app = FastAPI()
+        app.include_router(ai_routes.router)
+
+        response = TestClient(app).post(
+            "/api/v1/ai/translate",
+            json={"text": "Hello", "source_lang": "en", "target_lang": "fr"}
+        )
+
+        assert response.status_code == 504
+        assert "timed out" in response.json()["detail"]
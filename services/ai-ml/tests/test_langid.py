@@ -0,0 +1,88 @@
+"""Tests for the n-gram language identifier."""
+
+import re
+
+import pytest
+
+from app.core.config import settings
+from app.utils.langid import language_detector
+from app.utils.langid_samples import SAMPLES
+
+
+# Indonesian and Malay share most of their vocabulary; either answer is usable
+INTERCHANGEABLE = {"id": {"id", "ms"}, "ms": {"id", "ms"}}
+
+
+def sentences():
+    """(language, sentence) for every sentence of the bundled samples."""
+    for lang, text in SAMPLES.items():
+        for sentence in re.split(r"[.?!;]", text):
+            if len(sentence.strip()) > 2:
+                yield lang, sentence.strip()
+
+
+def detected(text):
+    """Detected language, or None if below the translation confidence threshold."""
+    lang, confidence = language_detector.detect(text)
+    return lang if confidence >= settings.translation_detect_min_confidence else None
+
+
+class TestAccuracy:
+    """Detections that clear the translation confidence threshold."""
+
+    def test_bundled_sample_sentences(self):
+        results = [(lang, detected(sentence), sentence) for lang, sentence in sentences()]
+
+        wrong = [r for r in results if r[1] not in INTERCHANGEABLE.get(r[0], {r[0]})]
+
+        assert len(results) > 150
+        assert wrong == []
+
+    @pytest.mark.parametrize("lang, text", [
+        ("en", "Hi"),
+        ("en", "Hello"),
+        ("en", "Thanks"),
+        ("en", "Good morning"),
+        ("en", "See you tomorrow"),
+        ("tr", "Merhaba"),
+        ("tr", "Merhaba, nasılsın?"),
+        ("tr", "Teşekkür ederim"),
+        ("tr", "Bugün hava çok güzel"),
+        ("it", "Ciao"),
+        ("it", "Grazie"),
+        ("it", "Buongiorno, come stai?"),
+        ("it", "Oggi il tempo è bello"),
+        ("es", "Hola"),
+        ("fr", "Bonjour"),
+        ("de", "Danke"),
+        ("sw", "Asante"),
+        ("pl", "Dziękuję"),
+    ])
+    def test_short_inputs(self, lang, text):
+        assert detected(text) == lang
+
+    @pytest.mark.parametrize("lang, text", [
+        ("en", "My brother works at the bank near the river"),
+        ("es", "Necesitamos más agua para los niños"),
+        ("fr", "La réunion a été déplacée à la semaine prochaine"),
+        ("de", "Kannst du mir helfen, meine Schlüssel zu finden"),
+        ("it", "Mio fratello lavora in banca vicino al fiume"),
+        ("it", "Vorrei prenotare un tavolo per due."),
+        ("pt", "Precisamos de mais água para as crianças"),
+        ("tr", "Kardeşim nehrin yanındaki bankada çalışıyor"),
+        ("tr", "Çocuklar için daha fazla suya ihtiyacımız var"),
+        ("nl", "De vergadering is verplaatst naar volgende week"),
+        ("sv", "Hon läser en bok i trädgården"),
+        ("pl", "Potrzebujemy więcej wody dla dzieci"),
+        ("sw", "Tunahitaji maji zaidi kwa watoto"),
+    ])
+    def test_sentences_outside_the_samples(self, lang, text):
+        assert detected(text) == lang
+
+    @pytest.mark.parametrize("text", ["xqzt", "lol"])
+    def test_unknown_words_are_not_confident(self, text):
+        assert detected(text) is None
+
+    def test_unique_scripts_need_no_profile(self):
+        assert language_detector.detect("안녕하세요") == ("ko", 1.0)
+        assert language_detector.detect("こんにちは、元気ですか") == ("ja", 1.0)
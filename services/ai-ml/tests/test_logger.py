@@ -0,0 +1,83 @@
+"""Tests for queue-based logging."""
+
+import json
+import logging
+import queue
+import sys
+
+from app.utils.logger import BoundedQueueHandler, JSONFormatter, SamplingFilter
+
+
+def record(name: str = "svc", level: int = logging.INFO, msg: str = "hello %s", args=("world",)):
+    """Log record as a logger would create it."""
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestBoundedQueueHandler:
+    """Records are dropped, not blocked on, when the queue is full."""
+
+    def test_full_queue_drops_and_reports_the_drops(self):
+        log_queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue)
+
+        for i in range(4):
+            handler.handle(record(msg=f"record {i}", args=None))
+        assert handler.dropped == 2
+        assert [log_queue.get_nowait().msg for _ in range(2)] == ["record 0", "record 1"]
+
+        handler.handle(record(msg="record 4", args=None))
+        notice, latest = log_queue.get_nowait(), log_queue.get_nowait()
+        assert notice.levelno == logging.WARNING
+        assert notice.getMessage() == "Dropped 2 log records (log queue full)"
+        assert latest.msg == "record 4"
+
+    def test_records_are_resolved_before_queueing(self):
+        log_queue = queue.Queue()
+        handler = BoundedQueueHandler(log_queue)
+        try:
+            raise ValueError("bad input")
+        except ValueError:
+            failed = logging.LogRecord(
+                "svc", logging.ERROR, __file__, 1, "failed %d", (3,), sys.exc_info()
+            )
+
+        handler.handle(failed)
+
+        queued = log_queue.get_nowait()
+        assert (queued.msg, queued.args, queued.exc_info) == ("failed 3", None, None)
+        assert "ValueError: bad input" in queued.exc_text
+
+
+class TestSamplingFilter:
+    """Chatty loggers keep a fraction of their INFO/DEBUG records."""
+
+    def test_child_loggers_inherit_the_rate(self):
+        sampling = SamplingFilter({"svc.translation": 0.0})
+
+        assert not sampling.filter(record("svc.translation"))
+        assert not sampling.filter(record("svc.translation.segments", logging.DEBUG))
+        assert sampling.filter(record("svc.translation", logging.WARNING))
+        assert sampling.filter(record("svc.cache"))
+        assert sampling.sampled_out == 2
+
+    def test_longest_configured_name_wins(self):
+        sampling = SamplingFilter({"svc": 0.0, "svc.events": 1.0})
+
+        assert sampling.filter(record("svc.events.journal"))
+        assert not sampling.filter(record("svc.cache"))
+
+
+class TestJSONFormatter:
+    """Structured records."""
+
+    def test_record_is_one_json_object_with_extra_fields(self):
+        entry = record()
+        entry.created = 1704164645.25
+        entry.extra = {"request_id": "abc"}
+
+        data = json.loads(JSONFormatter().format(entry))
+
+        assert data["timestamp"] == "2024-01-02T03:04:05.250000"
+        assert data["message"] == "hello world"
+        assert data["level"] == "INFO"
+        assert data["request_id"] == "abc"
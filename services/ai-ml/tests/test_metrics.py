@@ -0,0 +1,83 @@
+"""Tests for the Prometheus metrics collector."""
+
+import threading
+
+import pytest
+
+from app.core import inference
+from app.core.inference import InferenceExecutor, InferenceTimeoutError
+from app.core.metrics import _StatsCollector
+from app.services import events
+from app.services.event_journal import EventJournal
+from app.services.events import EventPublisher
+from tests.test_events import wait_until
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    """Fresh inference executor exported by the metrics collector."""
+    executor = InferenceExecutor(max_workers=2, timeout_seconds=0.05)
+    monkeypatch.setattr(inference, "inference_executor", executor)
+    yield executor
+    executor.shutdown()
+
+
+def family(families, name):
+    """Metric family by name."""
+    return next(f for f in families if f.name == name)
+
+
+def fail():
+    raise RuntimeError("model error")
+
+
+class TestInferenceMetrics:
+    """ai_inference_calls outcomes."""
+
+    async def test_outcomes_are_disjoint(self, executor):
+        release = threading.Event()
+        await executor.run(lambda: "ok")
+        await executor.run(lambda: "ok")
+        with pytest.raises(RuntimeError):
+            await executor.run(fail)
+        with pytest.raises(InferenceTimeoutError):
+            await executor.run(release.wait, 5)
+        release.set()
+
+        calls = next(
+            family for family in _StatsCollector._inference()
+            if family.name == "ai_inference_calls"
+        )
+        outcomes = {sample.labels["outcome"]: sample.value for sample in calls.samples}
+
+        assert outcomes == {"success": 2, "timeout": 1, "failure": 1}
+        assert sum(outcomes.values()) == executor.get_stats()["calls"]
+
+
+@pytest.mark.usefixtures("fast_events")
+class TestEventMetrics:
+    """ai_events outcomes."""
+
+    async def test_outcomes_are_disjoint(self, kafka, tmp_path, monkeypatch):
+        journal = EventJournal(str(tmp_path / "journal"))
+        publisher = EventPublisher(producer_factory=kafka, journal=journal)
+        monkeypatch.setattr(events, "event_publisher", publisher)
+        await publisher.connect()
+
+        for i in range(2):
+            await publisher.publish("ai.test", {"i": i})
+        await wait_until(lambda: len(kafka.sent) == 2)
+        kafka.down = True
+        for i in range(3):
+            await publisher.publish("ai.test", {"i": i})
+        await wait_until(lambda: journal.pending_events == 3)
+
+        families = list(_StatsCollector._events())
+        outcomes = {
+            sample.labels["outcome"]: sample.value
+            for sample in family(families, "ai_events").samples
+        }
+        await publisher.disconnect()
+
+        assert outcomes == {"sent": 2, "spilled": 3, "failed": 0, "dropped": 0}
+        assert family(families, "ai_events_enqueued").samples[0].value == 5
@@ -0,0 +1,254 @@
+"""Tests for the model manager's residency policy."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.core.model_manager import ModelInfo, ModelManager
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    """Model manager with a 1000 MB budget and two loader workers."""
+    monkeypatch.setattr(settings, "model_cache_dir", str(tmp_path / "models"))
+    monkeypatch.setattr(settings, "model_loader_workers", 2)
+    manager = ModelManager()
+    manager.cache_budget_mb = 1000
+    yield manager
+    manager.shutdown()
+
+
+def make_resident(manager: ModelManager, name: str, size_mb: float) -> None:
+    """Register an unpinned resident model without loading anything."""
+    cache_key = f"{name}:latest"
+    manager.models[cache_key] = object()
+    manager.model_info[cache_key] = ModelInfo(
+        name=name,
+        version="latest",
+        size_mb=size_mb,
+        device="cpu",
+        loaded_at=time.time(),
+        last_used=time.time()
+    )
+
+
+class TestLruEviction:
+    """Least recently used unpinned models make room for new loads."""
+
+    def test_least_recently_used_model_is_evicted_first(self, manager):
+        for i, name in enumerate(["a", "b", "c"]):
+            make_resident(manager, name, 300)
+            manager.model_info[f"{name}:latest"].last_used = 1000.0 + i
+        manager.get_model("a")
+
+        manager._evict_for(300)
+
+        assert sorted(manager.model_info) == ["a:latest", "c:latest"]
+        assert manager.get_memory_usage()["evictions"] == 1
+
+    def test_pinned_models_are_never_evicted(self, manager):
+        make_resident(manager, "pinned", 600)
+        make_resident(manager, "b", 300)
+        manager.model_info["pinned:latest"].last_used = 0.0
+        assert manager.pin_model("pinned")
+
+        manager._evict_for(600)
+
+        assert list(manager.model_info) == ["pinned:latest"]
+        assert manager.get_memory_usage()["pinned_models"] == 1
+
+    def test_unpinned_model_becomes_evictable(self, manager):
+        make_resident(manager, "a", 600)
+        manager.pin_model("a")
+        manager._evict_for(600)
+        assert "a:latest" in manager.model_info
+
+        manager.unpin_model("a")
+        manager._evict_for(600)
+        assert "a:latest" not in manager.model_info
+
+    async def test_loading_a_pinned_model_pins_the_resident_copy(self, manager):
+        make_resident(manager, "a", 600)
+
+        assert await manager.load_model("a", pinned=True)
+        manager._evict_for(600)
+
+        assert manager.model_info["a:latest"].pinned
+
+
+class TestMemoryBudget:
+    """Eviction before loads, with several loads in flight."""
+
+    async def test_concurrent_loads_reserve_their_estimated_size(self, manager, monkeypatch):
+        make_resident(manager, "old", 500)
+        builds_running = threading.Barrier(2, timeout=5)
+        committed = []
+
+        def build(model_name, model_type, local_path):
+            # Both loads are past their budget check and being built at once
+            builds_running.wait()
+            committed.append(manager._resident_mb() + 2 * 400)
+            return object(), None, None, 400.0
+
+        monkeypatch.setattr(manager, "_estimate_size_mb", lambda cache_key, local_path: 400.0)
+        monkeypatch.setattr(manager, "_build_model", build)
+        for name in ("a", "b"):
+            (manager.model_cache_dir / name / "latest").mkdir(parents=True)
+
+        results = await asyncio.gather(manager.load_model("a"), manager.load_model("b"))
+
+        assert results == [True, True]
+        assert committed == [400 * 2, 400 * 2]
+        assert "old:latest" not in manager.model_info
+        assert manager.get_memory_usage()["reserved_mb"] == 0
+
+    async def test_failed_load_releases_its_reservation(self, manager, monkeypatch):
+        def build(model_name, model_type, local_path):
+            raise RuntimeError("corrupt weights")
+
+        monkeypatch.setattr(manager, "_estimate_size_mb", lambda cache_key, local_path: 400.0)
+        monkeypatch.setattr(manager, "_build_model", build)
+        (manager.model_cache_dir / "a" / "latest").mkdir(parents=True)
+
+        assert await manager.load_model("a") is False
+        assert manager._reserved_mb() == 0
+
+
+class TestSingleFlight:
+    """Concurrent loads of one model share a single load."""
+
+    async def test_concurrent_loads_build_once_and_export_the_wait(self, manager, monkeypatch):
+        from app.core import model_manager as model_manager_module
+        from app.core.metrics import _StatsCollector, service_metrics
+        from tests.test_metrics import family
+
+        builds = []
+
+        def build(model_name, model_type, local_path):
+            builds.append(model_name)
+            time.sleep(0.05)
+            return object(), None, None, 100.0
+
+        monkeypatch.setattr(manager, "_estimate_size_mb", lambda cache_key, local_path: 100.0)
+        monkeypatch.setattr(manager, "_build_model", build)
+        monkeypatch.setattr(model_manager_module, "model_manager", manager)
+        (manager.model_cache_dir / "shared" / "latest").mkdir(parents=True)
+
+        results = await asyncio.gather(*(manager.load_model("shared") for _ in range(3)))
+
+        assert results == [True, True, True]
+        assert builds == ["shared"]
+        assert manager.get_load_stats()["coalesced_waits"] == 2
+
+        families = list(_StatsCollector(service_metrics).collect())
+        assert family(families, "ai_model_load_coalesced_waits").samples[0].value == 2
+        waits = {
+            sample.labels["model"]: sample.value
+            for sample in family(families, "ai_model_load_wait_seconds").samples
+            if sample.name == "ai_model_load_wait_seconds_count"
+        }
+        assert waits["shared"] >= 2
+
+    async def test_cancelled_leader_resets_progress_and_releases_waiters(self, manager, monkeypatch):
+        building = threading.Event()
+        release = threading.Event()
+
+        def build(model_name, model_type, local_path):
+            building.set()
+            release.wait(5)
+            return object(), None, None, 100.0
+
+        monkeypatch.setattr(manager, "_estimate_size_mb", lambda cache_key, local_path: 100.0)
+        monkeypatch.setattr(manager, "_build_model", build)
+        (manager.model_cache_dir / "a" / "latest").mkdir(parents=True)
+
+        leader = asyncio.create_task(manager.load_model("a"))
+        await asyncio.to_thread(building.wait, 5)
+        waiter = asyncio.create_task(manager.load_model("a"))
+        await asyncio.sleep(0)
+        assert manager.get_load_progress() == {"a:latest": "loading"}
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        release.set()
+
+        assert await waiter is False
+        assert "a:latest" not in manager.get_load_progress()
+        assert manager._reserved_mb() == 0
+
+
+class TestBackgroundLoading:
+    """Loads run on the loader executor and report their stage."""
+
+    async def test_event_loop_keeps_serving_while_a_model_loads(self, manager, monkeypatch):
+        building = threading.Event()
+        release = threading.Event()
+
+        def build(model_name, model_type, local_path):
+            building.set()
+            release.wait(5)
+            return object(), None, None, 100.0
+
+        monkeypatch.setattr(manager, "_estimate_size_mb", lambda cache_key, local_path: 100.0)
+        monkeypatch.setattr(manager, "_build_model", build)
+        (manager.model_cache_dir / "a" / "latest").mkdir(parents=True)
+
+        load = asyncio.create_task(manager.load_model("a"))
+        await asyncio.to_thread(building.wait, 5)
+
+        # The loop is free: other coroutines run while the model is built
+        await asyncio.wait_for(asyncio.sleep(0.01), 1)
+        assert manager.get_load_progress() == {"a:latest": "loading"}
+        assert manager.get_load_stats()["in_flight"] == 1
+
+        release.set()
+        assert await load
+        assert manager.get_load_progress() == {"a:latest": "ready"}
+
+    async def test_progress_reports_download_then_load(self, manager, storage, minio, monkeypatch):
+        from app.core import model_manager as model_manager_module
+
+        minio.put("m/v1/w.bin", b"W")
+        stages = []
+        download_model = storage.download_model
+
+        def download(model_name, version):
+            stages.append(manager.get_load_progress()[f"{model_name}:{version}"])
+            return download_model(model_name, version)
+
+        def build(model_name, model_type, local_path):
+            stages.append(manager.get_load_progress()[f"{model_name}:v1"])
+            if model_name == "n":
+                raise OSError("not on the Hugging Face Hub either")
+            return object(), None, None, 1.0
+
+        monkeypatch.setattr(model_manager_module, "model_storage", storage)
+        monkeypatch.setattr(storage, "download_model", download)
+        monkeypatch.setattr(manager, "_build_model", build)
+
+        assert await manager.load_model("m", version="v1")
+        assert await manager.load_model("n", version="v1") is False
+
+        assert stages == ["downloading", "loading", "downloading", "loading"]
+        assert manager.get_load_progress() == {"m:v1": "ready", "n:v1": "failed"}
+
+    async def test_cached_copy_left_by_an_interrupted_update_is_used(self, manager, monkeypatch):
+        local_paths = []
+
+        def build(model_name, model_type, local_path):
+            local_paths.append(local_path)
+            return object(), None, None, 1.0
+
+        monkeypatch.setattr(manager, "_build_model", build)
+        retired = manager.model_cache_dir / "a" / ".latest.old-1700000000000"
+        retired.mkdir(parents=True)
+
+        # Storage is unreachable: only the local copy can be loaded
+        assert await manager.load_model("a")
+
+        assert local_paths == [manager.model_cache_dir / "a" / "latest"]
+        assert not retired.exists()
@@ -0,0 +1,68 @@
+"""Tests for the prediction engine's result cache."""
+
+import asyncio
+
+import pytest
+
+from app.engines import prediction
+from app.engines.prediction import PredictionEngine
+from app.models.schemas import PredictionOptions, PredictionRequest, PredictionResponse
+from app.services.cache import CacheService
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """Prediction engine on a fresh cache, counting the predictions it computes."""
+    monkeypatch.setattr(prediction, "cache_service", CacheService())
+    engine = PredictionEngine()
+    engine.computed = []
+
+    async def route(request):
+        engine.computed.append(request)
+        await asyncio.sleep(0.01)
+        return PredictionResponse(
+            prediction=f"run {len(engine.computed)}", probability=0.5, model="stub"
+        )
+
+    monkeypatch.setattr(engine, "_route_prediction", route)
+    return engine
+
+
+def request(options=None, **features):
+    """Outbreak risk prediction request."""
+    return PredictionRequest(model_type="outbreak_risk", features=features, options=options)
+
+
+class TestPredictionCache:
+    """Predictions are cached and computed once per request."""
+
+    async def test_repeated_request_is_served_from_the_cache(self, engine):
+        first = await engine.predict(request(cases=10))
+        second = await engine.predict(request(cases=10))
+
+        assert first == second
+        assert len(engine.computed) == 1
+
+    async def test_concurrent_requests_share_one_prediction(self, engine):
+        results = await asyncio.gather(*(engine.predict(request(cases=10)) for _ in range(5)))
+
+        assert len({result.prediction for result in results}) == 1
+        assert len(engine.computed) == 1
+
+    async def test_features_and_options_are_part_of_the_key(self, engine):
+        await engine.predict(request(cases=10))
+        await engine.predict(request(cases=11))
+        await engine.predict(request(PredictionOptions(explain=True), cases=10))
+
+        assert len(engine.computed) == 3
+
+    async def test_failed_predictions_are_not_cached(self, engine, monkeypatch):
+        async def fail(request):
+            raise RuntimeError("model error")
+
+        route = engine._route_prediction
+        monkeypatch.setattr(engine, "_route_prediction", fail)
+        assert (await engine.predict(request(cases=10))).model == "error"
+
+        monkeypatch.setattr(engine, "_route_prediction", route)
+        assert (await engine.predict(request(cases=10))).model == "stub"
@@ -0,0 +1,182 @@
+"""Tests for the token-bucket rate limiter."""
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import ai_routes
+from app.core.config import settings
+from app.core.metrics import _StatsCollector
+from app.core.rate_limit import (
+    TOKEN_BUCKET_SCRIPT,
+    LocalTokenBuckets,
+    RateLimitMiddleware,
+    rate_limiter,
+)
+from app.models.schemas import BatchTranslationResponse
+from app.services.cache import cache_service
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """Rate limiter with 3 tokens refilling at 3 per minute, on local buckets."""
+    monkeypatch.setattr(rate_limiter, "per_minute", 3)
+    monkeypatch.setattr(rate_limiter, "capacity", 3.0)
+    monkeypatch.setattr(rate_limiter, "rate", 3 / 60)
+    monkeypatch.setattr(rate_limiter, "local", LocalTokenBuckets())
+    monkeypatch.setattr(rate_limiter, "decisions", dict.fromkeys(rate_limiter.decisions, 0))
+    monkeypatch.setattr(settings, "rate_limit_per_minute", 3)
+    return rate_limiter
+
+
+@pytest.fixture
+def client(limiter, monkeypatch):
+    """Client for the AI routes behind the rate limit middleware."""
+    async def translate_batch(request):
+        return BatchTranslationResponse(results=[], total=0, cached_count=0)
+
+    monkeypatch.setattr(ai_routes.translation_engine, "translate_batch", translate_batch)
+
+    app = FastAPI()
+    app.include_router(ai_routes.router)
+    app.add_middleware(RateLimitMiddleware)
+    return TestClient(app)
+
+
+def batch(texts: int, langs: int) -> dict:
+    """Batch translation request body."""
+    return {
+        "texts": [f"text {i}" for i in range(texts)],
+        "source_lang": "en",
+        "target_langs": ["fr", "sw", "de", "es", "pt", "ar", "hi", "yo"][:langs],
+    }
+
+
+class TestLocalTokenBuckets:
+    """In-process fallback buckets."""
+
+    def test_refuses_once_empty(self):
+        buckets = LocalTokenBuckets()
+        decisions = [buckets.take("k", 1.0, 3, 1)[0] for _ in range(4)]
+        assert decisions == [True, True, True, False]
+
+    def test_cost_above_capacity_leaves_bucket_in_debt(self):
+        buckets = LocalTokenBuckets()
+        allowed, tokens, _, _ = buckets.take("k", 1.0, 3, 10)
+        assert allowed and tokens == pytest.approx(-7, abs=0.01)
+
+        allowed, _, retry_after, _ = buckets.take("k", 1.0, 3, 1)
+        assert not allowed
+        assert retry_after == pytest.approx(8, abs=0.01)
+
+
+class TestRateLimitMiddleware:
+    """Per-client limiting over HTTP."""
+
+    def test_limits_by_client_ip_with_retry_headers(self, client):
+        statuses = [client.get("/api/v1/ai/languages").status_code for _ in range(4)]
+        assert statuses == [200, 200, 200, 429]
+
+        response = client.get("/api/v1/ai/languages")
+        assert int(response.headers["retry-after"]) >= 1
+        assert response.headers["ratelimit-limit"] == "3"
+        assert response.headers["ratelimit-remaining"] == "0"
+        assert "costs 1 tokens" in response.json()["detail"]
+
+    def test_rotating_user_header_does_not_bypass_limit(self, client):
+        statuses = [
+            client.get("/api/v1/ai/languages", headers={"X-User-ID": f"u{i}"}).status_code
+            for i in range(5)
+        ]
+        assert statuses == [200, 200, 200, 429, 429]
+
+    def test_user_header_is_used_when_trusted(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "rate_limit_trust_user_header", True)
+        statuses = [
+            client.get("/api/v1/ai/languages", headers={"X-User-ID": f"u{i}"}).status_code
+            for i in range(5)
+        ]
+        assert statuses == [200] * 5
+
+    def test_health_is_exempt(self, client):
+        for _ in range(5):
+            response = client.get("/health/live")
+            assert response.status_code == 200
+            assert "ratelimit-limit" not in response.headers
+
+
+class TestRateLimitMetrics:
+    """ai_rate_limit_decisions labels."""
+
+    async def test_decisions_are_labelled_by_outcome_and_backend(self, limiter):
+        for _ in range(4):
+            await limiter.take("ip:1.2.3.4", 1)
+
+        decisions = next(_StatsCollector._rate_limit())
+        counts = {
+            (sample.labels["outcome"], sample.labels["backend"]): sample.value
+            for sample in decisions.samples
+        }
+
+        assert counts == {
+            ("allowed", "local"): 3,
+            ("limited", "local"): 1,
+            ("allowed", "redis"): 0,
+            ("limited", "redis"): 0,
+        }
+        assert sum(counts.values()) == 4
+
+
+class TestBatchTranslationCost:
+    """Batch translation is charged per text per target language."""
+
+    def test_batch_cost_scales_with_texts_and_languages(self, client, limiter, monkeypatch):
+        monkeypatch.setattr(limiter, "capacity", 20.0)
+
+        response = client.post("/api/v1/ai/translate/batch", json=batch(3, 2))
+        assert response.status_code == 200
+        assert response.headers["ratelimit-remaining"] == "14"
+
+    def test_overridden_path_costs_do_not_charge_batches_twice(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "rate_limit_costs", {"/api/v1/ai/translate/batch": 2})
+
+        response = client.post("/api/v1/ai/translate/batch", json=batch(1, 1))
+        assert response.status_code == 200
+        assert response.headers["ratelimit-remaining"] == "2"
+
+    def test_large_batch_drains_bucket_and_explains_cost(self, client):
+        response = client.post("/api/v1/ai/translate/batch", json=batch(10, 8))
+        assert response.status_code == 200
+        assert response.headers["ratelimit-remaining"] == "0"
+
+        response = client.post("/api/v1/ai/translate/batch", json=batch(1, 1))
+        assert response.status_code == 429
+        detail = response.json()["detail"]
+        assert "1 texts x 1 target languages x 1 per translation" in detail
+        # 80 tokens of debt on a 3 token bucket refilling at 3 per minute
+        assert int(response.headers["retry-after"]) > 1500
+        assert response.headers["ratelimit-remaining"] == "0"
+
+
+class TestTokenBucketScript:
+    """The Redis script matches the local bucket semantics."""
+
+    async def test_script_admits_then_limits(self):
+        redis = FakeRedis()
+        script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        results = [await script(keys=["bucket"], args=[1.0, 3, 1]) for _ in range(4)]
+
+        assert [int(allowed) for allowed, *_ in results] == [1, 1, 1, 0]
+        assert float(results[-1][2]) > 0
+
+    async def test_limiter_takes_from_redis_buckets(self, limiter, monkeypatch):
+        monkeypatch.setattr(cache_service, "redis", FakeRedis(decode_responses=True))
+        monkeypatch.setattr(cache_service, "_connected", True)
+
+        decisions = [await limiter.take("ip:1.2.3.4", 1) for _ in range(4)]
+
+        assert [allowed for allowed, *_ in decisions] == [True, True, True, False]
+        assert limiter.decisions["allowed", "redis"] == 3
+        assert limiter.decisions["limited", "redis"] == 1
+        assert len(limiter.local) == 0
@@ -0,0 +1,87 @@
+"""Tests for API response rendering."""
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.responses import FastJSONResponse, api_response
+from app.models.schemas import (
+    BatchTranslationResponse,
+    Personalization,
+    Recommendation,
+    RecommendationResponse,
+    TranslationResponse,
+)
+
+
+def translation(i: int = 0) -> TranslationResponse:
+    """Translation result with non-ASCII text."""
+    return TranslationResponse(
+        original_text=f"Où est l'hôpital le plus proche ? ({i})",
+        translated_text=f"Ile-iwosan ti o sunmọ julọ wa nibo? «{i}» 医院",
+        source_lang="fr",
+        target_lang="yo",
+        detected_lang=None,
+        confidence=0.92,
+        model="facebook/nllb-200-distilled-600M",
+        cached=False
+    )
+
+
+def legacy_body(result, message, metadata) -> bytes:
+    """Body the routes rendered before api_response: a dict through FastAPI's encoder."""
+    content = {"success": True, "message": message, "data": result.model_dump()}
+    if metadata is not None:
+        content["metadata"] = metadata
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+SAMPLES = [
+    (translation(), {"cached": False, "character_count": 40}),
+    (
+        BatchTranslationResponse(
+            results=[translation(i) for i in range(3)], total=3, cached_count=1
+        ),
+        {"total": 3, "cached_count": 1},
+    ),
+    (
+        RecommendationResponse(
+            recommendations=[
+                Recommendation(
+                    id="course_001",
+                    title="Santé communautaire",
+                    relevance_score=0.85,
+                    reasoning="Matches your current learning path",
+                    metadata={"duration_minutes": 45, "tags": ["sw", None]}
+                )
+            ],
+            personalization=Personalization(
+                user_id="user-1", profile_features=["skill_profile"], model="cf-v1"
+            )
+        ),
+        None,
+    ),
+]
+
+
+class TestApiResponse:
+    """api_response renders the same bytes as the dict it replaced."""
+
+    @pytest.mark.parametrize("result,metadata", SAMPLES)
+    def test_body_matches_the_dict_response(self, result, metadata):
+        response = api_response(result, "Done — ok", metadata=metadata)
+
+        assert response.body == legacy_body(result, "Done — ok", metadata)
+        assert response.media_type == "application/json"
+        assert response.status_code == 200
+
+    def test_status_code_is_passed_through(self):
+        assert api_response(translation(), "Accepted", status_code=202).status_code == 202
+
+
+class TestFastJSONResponse:
+    """Dict routes render as JSONResponse did."""
+
+    def test_body_matches_json_response(self):
+        content = {"languages": [{"code": "yo", "name": "Yorùbá"}], "total": 1, "ok": True}
+        assert FastJSONResponse(content).body == JSONResponse(content).body
@@ -0,0 +1,158 @@
+"""Tests for engine startup and load modes."""
+
+import asyncio
+import io
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+
+from app.api.routes import ai_routes
+from app.core.config import settings
+from app.core.startup import EngineStartup
+from app.engines import nlp, prediction, recommendation, speech, vision
+from app.models.schemas import PredictionRequest, RecommendationRequest
+from app.services.cache import CacheService
+from benchmarks.startup_importtime import HEAVY_MODULES, run_importtime
+
+
+def upload(data: bytes = b"\x00" * 16) -> UploadFile:
+    """Uploaded file with the given contents."""
+    return UploadFile(io.BytesIO(data), filename="upload.bin")
+
+
+# Engine name, module, class and a call of each public entry point
+ENTRY_POINTS = [
+    ("nlp", nlp, nlp.NLPEngine, lambda e: e.analyze_sentiment("great")),
+    ("nlp", nlp, nlp.NLPEngine, lambda e: e.extract_entities("Ada in Lagos")),
+    ("nlp", nlp, nlp.NLPEngine, lambda e: e.moderate_content("hello")),
+    ("nlp", nlp, nlp.NLPEngine, lambda e: e.generate_text("Once")),
+    ("nlp", nlp, nlp.NLPEngine, lambda e: e.analyze_skill_gap(["python"], "engineer")),
+    ("vision", vision, vision.ComputerVisionEngine, lambda e: e.perform_ocr(upload())),
+    ("vision", vision, vision.ComputerVisionEngine, lambda e: e.analyze_image(upload())),
+    ("speech", speech, speech.SpeechEngine, lambda e: e.transcribe(upload())),
+    (
+        "prediction", prediction, prediction.PredictionEngine,
+        lambda e: e.predict(PredictionRequest(model_type="outbreak_risk", features={}))
+    ),
+    (
+        "recommendation", recommendation, recommendation.RecommendationEngine,
+        lambda e: e.recommend(RecommendationRequest(user_id="u1", context="courses"))
+    ),
+]
+
+
+@pytest.fixture
+def startup(monkeypatch):
+    """Fresh engine startup manager used by every engine module."""
+    startup = EngineStartup()
+    for module in (nlp, prediction, recommendation, speech, vision):
+        monkeypatch.setattr(module, "engine_startup", startup)
+    for module in (prediction, recommendation):
+        monkeypatch.setattr(module, "cache_service", CacheService())
+    return startup
+
+
+class TestLazyEngines:
+    """Engines loaded with ENGINE_LOAD_MODES=lazy."""
+
+    @pytest.mark.parametrize("name, module, engine_class, call", ENTRY_POINTS)
+    async def test_first_use_initializes_the_engine(
+        self, startup, monkeypatch, name, module, engine_class, call
+    ):
+        monkeypatch.setattr(settings, "engine_load_modes", {name: "lazy"})
+        engine = engine_class()
+        startup.register(name, engine)
+        await startup.start()
+        assert startup.get_status()[name]["state"] == "pending"
+
+        await call(engine)
+
+        assert startup.get_status()[name]["state"] == "ready"
+        assert engine._initialized
+
+
+class SlowEngine:
+    """Engine whose initialization waits until released."""
+
+    def __init__(self, load_mode: str):
+        self.load_mode = load_mode
+        self.release = asyncio.Event()
+        self._initialized = False
+
+    async def initialize(self) -> bool:
+        await self.release.wait()
+        self._initialized = True
+        return True
+
+
+async def readiness():
+    """Status code and body of /health/ready."""
+    response = await ai_routes.readiness_check()
+    return response.status_code, json.loads(response.body)
+
+
+class TestReadiness:
+    """/health/ready reports 503 until the engines are up."""
+
+    @pytest.fixture
+    def startup(self, monkeypatch):
+        startup = EngineStartup()
+        monkeypatch.setattr(ai_routes, "engine_startup", startup)
+        monkeypatch.setattr(settings, "engine_load_modes", {})
+        monkeypatch.setattr(settings, "readiness_required_services", [])
+        return startup
+
+    async def test_not_ready_until_background_engines_initialized(self, startup):
+        engine = SlowEngine("background")
+        startup.register("translation", engine)
+        startup.register("speech", SlowEngine("lazy"))
+
+        assert (await readiness())[0] == 503
+        await startup.start()
+        await asyncio.sleep(0)
+        status, body = await readiness()
+        assert status == 503
+        assert body["status"] == "starting"
+        assert body["engines"]["translation"]["state"] == "initializing"
+
+        engine.release.set()
+        await startup.ensure_initialized(engine)
+
+        status, body = await readiness()
+        assert status == 200
+        assert body["ready"] is True
+        assert body["engines"]["translation"]["initialized"] is True
+        assert body["engines"]["speech"]["state"] == "pending"
+
+    async def test_required_service_must_be_connected(self, startup, monkeypatch):
+        monkeypatch.setattr(settings, "readiness_required_services", ["cache"])
+        monkeypatch.setattr(ai_routes, "cache_service", CacheService())
+        await startup.start()
+
+        status, body = await readiness()
+
+        assert status == 503
+        assert body["status"] == "unavailable"
+
+    async def test_liveness_does_not_depend_on_readiness(self, startup):
+        startup.register("translation", SlowEngine("background"))
+        await startup.start()
+
+        assert (await readiness())[0] == 503
+        assert await ai_routes.liveness_check() == {"status": "alive"}
+        await startup.shutdown()
+
+
+class TestDeferredImports:
+    """Heavy ML libraries are only imported when a real model is loaded."""
+
+    def test_importing_the_routes_and_engines_skips_heavy_modules(self, monkeypatch):
+        # Everything app.py wires up, short of the uvicorn entry point
+        monkeypatch.chdir(Path(__file__).resolve().parents[1])
+
+        imported = {name for _, name in run_importtime("app.api.routes.ai_routes")}
+
+        assert {"app.engines.translation", "app.core.model_manager"} <= imported
+        assert not {name.split(".")[0] for name in imported} & set(HEAVY_MODULES)
@@ -0,0 +1,335 @@
+"""Tests for MinIO model storage."""
+
+import hashlib
+import json
+import time
+
+from app.services.storage import LOCAL_MANIFEST, ModelStorage
+
+
+class TestDownloadModel:
+    """Downloads into a staging directory that is renamed into place."""
+
+    def test_downloads_files_and_writes_manifest(self, storage, minio):
+        minio.put("m/v1/config.json", b"{}")
+        minio.put("m/v1/weights.bin", b"WEIGHTS")
+
+        path = storage.download_model("m", "v1")
+
+        assert (path / "weights.bin").read_bytes() == b"WEIGHTS"
+        manifest = json.loads((path / LOCAL_MANIFEST).read_text())
+        assert set(manifest["files"]) == {"config.json", "weights.bin"}
+
+    def test_stale_staging_file_of_same_size_is_downloaded_again(self, storage, minio, tmp_path):
+        minio.put("m/v1/weights.bin", b"NEWWEIGHTS")
+        staging = tmp_path / "models" / "m" / ".v1.staging"
+        staging.mkdir(parents=True)
+        (staging / "weights.bin").write_bytes(b"OLDWEIGHTS")
+
+        path = storage.download_model("m", "v1")
+
+        assert (path / "weights.bin").read_bytes() == b"NEWWEIGHTS"
+        manifest = json.loads((path / LOCAL_MANIFEST).read_text())
+        assert manifest["files"]["weights.bin"]["etag"] == hashlib.md5(b"NEWWEIGHTS").hexdigest()
+
+    def test_verified_staging_file_is_reused(self, storage, minio, tmp_path, monkeypatch):
+        minio.put("m/v1/weights.bin", b"WEIGHTS")
+        staging = tmp_path / "models" / "m" / ".v1.staging"
+        staging.mkdir(parents=True)
+        (staging / "weights.bin").write_bytes(b"WEIGHTS")
+
+        fetched = []
+        get_object = minio.get_object
+        monkeypatch.setattr(
+            minio, "get_object",
+            lambda bucket, name, **kwargs: fetched.append(name) or get_object(bucket, name, **kwargs)
+        )
+
+        path = storage.download_model("m", "v1")
+
+        assert (path / "weights.bin").read_bytes() == b"WEIGHTS"
+        assert "m/v1/weights.bin" not in fetched
+
+    def test_changed_object_replaces_cached_file(self, storage, minio):
+        minio.put("m/v1/weights.bin", b"WEIGHTS-A")
+        storage.download_model("m", "v1")
+
+        minio.put("m/v1/weights.bin", b"WEIGHTS-B")
+        path = storage.download_model("m", "v1")
+
+        assert (path / "weights.bin").read_bytes() == b"WEIGHTS-B"
+
+
+class TestInterruptedSwap:
+    """A crash between the two renames of an update never loses the cached model."""
+
+    def test_copy_moved_aside_is_restored(self, storage, minio, monkeypatch):
+        from app.services import storage as storage_module
+
+        minio.put("m/v1/weights.bin", b"WEIGHTS-A")
+        path = storage.download_model("m", "v1")
+        minio.put("m/v1/weights.bin", b"WEIGHTS-B")
+
+        # Stop after the old directory was moved aside
+        replace = storage_module.os.replace
+        def crash_on_staging(src, dst):
+            if ".staging" in str(src) and dst == path:
+                raise KeyboardInterrupt
+            return replace(src, dst)
+        monkeypatch.setattr(storage_module.os, "replace", crash_on_staging)
+        try:
+            storage.download_model("m", "v1")
+        except KeyboardInterrupt:
+            pass
+        monkeypatch.setattr(storage_module.os, "replace", replace)
+        assert not path.exists()
+
+        storage.restore_interrupted_swap(path)
+
+        assert (path / "weights.bin").read_bytes() == b"WEIGHTS-A"
+        assert sorted(p.name for p in path.parent.iterdir()) == [".v1.staging", "v1"]
+
+    def test_leftover_copies_are_removed_on_the_next_download(self, storage, minio):
+        minio.put("m/v1/weights.bin", b"WEIGHTS")
+        path = storage.download_model("m", "v1")
+        leftover = path.with_name(".v1.old-1700000000000")
+        leftover.mkdir()
+        (leftover / "weights.bin").write_bytes(b"OLD")
+
+        storage.download_model("m", "v1")
+
+        assert not leftover.exists()
+        assert (path / "weights.bin").read_bytes() == b"WEIGHTS"
+
+
+def counting_gets(minio, monkeypatch):
+    """Record the object names fetched with get_object."""
+    fetched = []
+    get_object = minio.get_object
+    monkeypatch.setattr(
+        minio, "get_object",
+        lambda bucket, name, **kwargs: fetched.append(name) or get_object(bucket, name, **kwargs)
+    )
+    return fetched
+
+
+class TestIncrementalRefresh:
+    """Cached models are refreshed against their local ETag manifest."""
+
+    def test_only_changed_objects_are_transferred(self, storage, minio, monkeypatch):
+        minio.put("m/v1/config.json", b"{}")
+        minio.put("m/v1/weights.bin", b"WEIGHTS-A")
+        storage.download_model("m", "v1")
+        fetched = counting_gets(minio, monkeypatch)
+
+        minio.put("m/v1/weights.bin", b"WEIGHTS-B")
+        path = storage.download_model("m", "v1")
+
+        assert fetched == ["m/v1/weights.bin"]
+        assert (path / "config.json").read_bytes() == b"{}"
+        assert (path / "weights.bin").read_bytes() == b"WEIGHTS-B"
+
+    def test_up_to_date_model_is_not_fetched_again(self, storage, minio, monkeypatch):
+        minio.put("m/v1/weights.bin", b"WEIGHTS")
+        path = storage.download_model("m", "v1")
+        manifest = (path / LOCAL_MANIFEST).stat().st_mtime_ns
+        fetched = counting_gets(minio, monkeypatch)
+
+        assert storage.download_model("m", "v1") == path
+        assert fetched == []
+        assert (path / LOCAL_MANIFEST).stat().st_mtime_ns == manifest
+
+    def test_removed_objects_are_removed_from_the_cache(self, storage, minio):
+        minio.put("m/v1/weights.bin", b"WEIGHTS")
+        minio.put("m/v1/old.bin", b"OLD")
+        storage.download_model("m", "v1")
+
+        minio.remove_object("bucket", "m/v1/old.bin")
+        path = storage.download_model("m", "v1")
+
+        assert not (path / "old.bin").exists()
+        assert set(storage.read_local_manifest(path)) == {"weights.bin"}
+
+    def test_truncated_local_file_is_fetched_again(self, storage, minio, monkeypatch):
+        minio.put("m/v1/weights.bin", b"WEIGHTS")
+        path = storage.download_model("m", "v1")
+        (path / "weights.bin").write_bytes(b"WEI")
+        fetched = counting_gets(minio, monkeypatch)
+
+        storage.download_model("m", "v1")
+
+        assert fetched == ["m/v1/weights.bin"]
+        assert (path / "weights.bin").read_bytes() == b"WEIGHTS"
+
+
+def make_model(root, files):
+    """Write a local model directory."""
+    root.mkdir(parents=True, exist_ok=True)
+    for name, data in files.items():
+        (root / name).write_bytes(data)
+    return root
+
+
+class TestModelIndex:
+    """Per-version index entries."""
+
+    def test_uploaded_versions_are_listed_from_the_index(self, storage, tmp_path):
+        storage.upload_model("m", "v1", make_model(tmp_path / "src", {"w.bin": b"W"}))
+
+        reader = ModelStorage()
+        reader.client, reader._connected = storage.client, True
+        assert [(m.name, m.version, m.size_bytes) for m in reader.list_models()] == [("m", "v1", 1)]
+        assert reader.model_exists("m", "v1")
+
+    def test_concurrent_publishers_do_not_lose_entries(self, storage, minio, tmp_path):
+        other = ModelStorage()
+        other.client, other._connected = minio, True
+        other_model = make_model(tmp_path / "b", {"w.bin": b"B"})
+
+        # The other publisher finishes while this one is writing its entry
+        put_object = minio.put_object
+        def interleaved_put(*args, **kwargs):
+            minio.put_object = put_object
+            other.upload_model("b", "v1", other_model)
+            return put_object(*args, **kwargs)
+        minio.put_object = interleaved_put
+
+        storage.upload_model("a", "v1", make_model(tmp_path / "a", {"w.bin": b"A"}))
+
+        reader = ModelStorage()
+        reader.client, reader._connected = minio, True
+        assert sorted(m.name for m in reader.list_models()) == ["a", "b"]
+
+    def test_unindexed_models_are_listed_after_an_upload(self, storage, minio, tmp_path):
+        minio.put("old/v1/w.bin", b"OLD")
+
+        storage.upload_model("m", "v1", make_model(tmp_path / "src", {"w.bin": b"W"}))
+
+        reader = ModelStorage()
+        reader.client, reader._connected = minio, True
+        assert sorted((m.name, m.version) for m in reader.list_models()) == [("m", "v1"), ("old", "v1")]
+        assert reader.model_exists("old", "v1")
+
+    def test_cached_listing_does_not_walk_the_bucket(self, storage, minio, tmp_path):
+        minio.put("old/v1/w.bin", b"OLD")
+        storage.upload_model("m", "v1", make_model(tmp_path / "src", {"w.bin": b"W"}))
+        assert len(storage.list_models()) == 2
+
+        listings = []
+        list_objects = minio.list_objects
+        def counting_list(*args, **kwargs):
+            listings.append(kwargs.get("prefix", ""))
+            return list_objects(*args, **kwargs)
+        minio.list_objects = counting_list
+
+        assert len(storage.list_models()) == 2
+        assert listings == []
+
+    def test_model_names_with_a_slash_are_found_by_a_fresh_reader(self, storage, minio, tmp_path):
+        name = "facebook/nllb-200-distilled-600M"
+        storage.upload_model(name, "latest", make_model(tmp_path / "src", {"w.bin": b"W"}))
+        minio.put("org/legacy/v1/config.json", b"{}")
+        minio.put("org/legacy/v1/tokenizer/vocab.json", b"[]")
+
+        reader = ModelStorage()
+        reader.client, reader._connected = minio, True
+        assert reader.model_exists(name, "latest")
+        assert sorted((m.name, m.version) for m in reader.list_models()) == [
+            (name, "latest"), ("org/legacy", "v1")
+        ]
+        path = reader.download_model(name, "latest")
+        assert (path / "w.bin").read_bytes() == b"W"
+
+        assert reader.rebuild_index() == 2
+        assert {f.relative_path for f in reader.list_model_files("org/legacy", "v1")} == {
+            "config.json", "tokenizer/vocab.json"
+        }
+        assert reader.list_model_files(name, "latest")[0].sha256 is not None
+
+    def test_rebuild_index_registers_and_removes_versions(self, storage, minio, tmp_path):
+        storage.upload_model("m", "v1", make_model(tmp_path / "src", {"w.bin": b"W"}))
+        minio.put("x/v2/w.bin", b"XX")
+
+        assert storage.rebuild_index() == 2
+        assert storage.list_model_files("x", "v2")[0].size == 2
+
+        for name in [n for n in minio.objects if n.startswith("_revisions/m/")]:
+            minio.remove_object("bucket", name)
+        assert storage.rebuild_index() == 1
+        assert [m.name for m in storage.list_models()] == ["x"]
+
+
+class TestUploadPublishing:
+    """Uploads are invisible until published through the index."""
+
+    def test_version_being_uploaded_is_not_visible(self, storage, minio, tmp_path):
+        reader = ModelStorage()
+        reader.client, reader._connected = minio, True
+        seen = []
+
+        fput_object = minio.fput_object
+        def observing_fput(*args, **kwargs):
+            result = fput_object(*args, **kwargs)
+            seen.append((reader.model_exists("m", "v1"), reader.list_model_files("m", "v1")))
+            return result
+        minio.fput_object = observing_fput
+
+        storage.upload_model("m", "v1", make_model(tmp_path / "src", {"a.bin": b"A", "b.bin": b"B"}))
+
+        assert seen == [(False, []), (False, [])]
+        assert reader.get_index(refresh=True) is not None
+        assert reader.model_exists("m", "v1")
+
+    def test_reupload_keeps_objects_of_the_version_being_read(self, storage, minio, tmp_path):
+        storage.upload_model("m", "v1", make_model(tmp_path / "one", {"w.bin": b"ONE"}))
+        reading = storage.list_model_files("m", "v1")
+
+        storage.upload_model("m", "v1", make_model(tmp_path / "two", {"w.bin": b"TWO"}))
+
+        assert minio.objects[reading[0].object_name] == b"ONE"
+        path = storage.download_model("m", "v1")
+        assert (path / "w.bin").read_bytes() == b"TWO"
+
+    def test_only_the_replaced_revision_is_kept(self, storage, minio, tmp_path, monkeypatch):
+        for i in range(3):
+            # One upload per second
+            monkeypatch.setattr(time, "time", lambda: 1700000000.0 + i)
+            storage.upload_model("m", "v1", make_model(tmp_path / str(i), {"w.bin": b"%d" % i}))
+
+        revisions = [n for n in minio.objects if n.startswith("_revisions/m/v1/")]
+        assert sorted(minio.objects[n] for n in revisions) == [b"1", b"2"]
+
+    def test_interleaved_uploads_of_one_version_keep_each_revision(
+        self, storage, minio, tmp_path, monkeypatch
+    ):
+        # Every upload starts in the same millisecond
+        monkeypatch.setattr(time, "time", lambda: 1700000000.0)
+        storage.upload_model("m", "v1", make_model(tmp_path / "old", {"w.bin": b"OLD"}))
+        other = ModelStorage()
+        other.client, other._connected = minio, True
+        other_model = make_model(tmp_path / "b", {"w.bin": b"B"})
+
+        # The other upload starts and is published while this one is uploading
+        fput_object = minio.fput_object
+        def interleaved_fput(*args, **kwargs):
+            minio.fput_object = fput_object
+            result = fput_object(*args, **kwargs)
+            other.upload_model("m", "v1", other_model)
+            return result
+        minio.fput_object = interleaved_fput
+
+        assert storage.upload_model("m", "v1", make_model(tmp_path / "a", {"w.bin": b"A"}))
+
+        files = storage.list_model_files("m", "v1")
+        assert [minio.objects.get(f.object_name) for f in files] == [b"A"]
+        path = storage.download_model("m", "v1")
+        assert (path / "w.bin").read_bytes() == b"A"
+
+    def test_failed_upload_is_cleaned_up_and_not_published(self, storage, minio, tmp_path):
+        def failing_fput(*args, **kwargs):
+            raise IOError("connection reset")
+        minio.fput_object = failing_fput
+
+        assert not storage.upload_model("m", "v1", make_model(tmp_path / "src", {"w.bin": b"W"}))
+        assert not storage.model_exists("m", "v1")
+        assert not [n for n in minio.objects if n.startswith("_revisions/")]
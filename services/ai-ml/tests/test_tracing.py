@@ -0,0 +1,85 @@
+"""Tests for request tracing and Server-Timing headers."""
+
+import asyncio
+import re
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.tracing import RequestTrace, TracedRoute, TracingMiddleware, detach, span
+
+
+@pytest.fixture
+def client():
+    """App with one traced endpoint spending time in inference and in a detached task."""
+    router = APIRouter(route_class=TracedRoute)
+
+    @router.get("/work")
+    async def work():
+        with span("inference"):
+            await asyncio.sleep(0.02)
+
+        async def shared():
+            detach()
+            with span("batch"):
+                await asyncio.sleep(0)
+
+        await asyncio.ensure_future(shared())
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(TracingMiddleware)
+    return TestClient(app)
+
+
+def timings(response) -> dict:
+    """Server-Timing header as {stage: duration ms}."""
+    return {
+        name: float(duration)
+        for name, duration in re.findall(r"(\w+);dur=([\d.]+)", response.headers["server-timing"])
+    }
+
+
+class TestTracingMiddleware:
+    """Request IDs and per-stage timings on every response."""
+
+    def test_server_timing_breaks_down_stages(self, client):
+        response = client.get("/work")
+
+        stages = timings(response)
+        assert set(stages) == {"inference", "serialize", "total"}
+        assert 15 <= stages["inference"] <= stages["total"]
+
+    def test_request_id_is_generated(self, client):
+        first = client.get("/work").headers["x-request-id"]
+        second = client.get("/work").headers["x-request-id"]
+
+        assert re.fullmatch(r"[0-9a-f]{32}", first)
+        assert first != second
+
+    def test_client_request_id_is_echoed(self, client):
+        response = client.get("/work", headers={"X-Request-ID": "req-123"})
+        assert response.headers["x-request-id"] == "req-123"
+
+    def test_unmatched_paths_are_traced(self, client):
+        response = client.get("/missing")
+
+        assert response.status_code == 404
+        assert set(timings(response)) == {"total"}
+
+
+class TestRequestTrace:
+    """Stage totals."""
+
+    def test_concurrent_spans_count_once(self):
+        trace = RequestTrace("id", "GET", "/")
+        trace.spans = [
+            ("inference", 0.0, 10.0),
+            ("inference", 5.0, 10.0),
+            ("inference", 30.0, 5.0),
+            ("cache", 0.0, 1.0),
+        ]
+
+        assert trace.stage_totals() == {"inference": 20.0, "cache": 1.0}
@@ -0,0 +1,136 @@
+"""Tests for the translation engine."""
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.engines import translation
+from app.engines.translation import translation_engine
+from app.models.schemas import BatchTranslationRequest, TranslationOptions, TranslationRequest
+from app.services.cache import CacheService
+
+
+def upper_pipeline(texts, **kwargs):
+    """NLLB pipeline stand-in: "translates" by upper-casing."""
+    return [{"translation_text": text.upper()} for text in texts]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Fresh cache (in-process L1 only) for the translation engine."""
+    cache = CacheService()
+    monkeypatch.setattr(translation, "cache_service", cache)
+    return cache
+
+
+@pytest.fixture
+def nllb(monkeypatch, cache):
+    """Translation engine with a loaded (stub) pipeline."""
+    monkeypatch.setattr(translation_engine, "pipeline", upper_pipeline)
+    monkeypatch.setattr(translation_engine, "_initialized", True)
+    return translation_engine
+
+
+def request(text: str, preserve_formatting: bool = True, source_lang: str = "en"):
+    """Translation request to French."""
+    return TranslationRequest(
+        text=text,
+        source_lang=source_lang,
+        target_lang="fr",
+        options=TranslationOptions(preserve_formatting=preserve_formatting)
+    )
+
+
+class TestDocumentTranslation:
+    """Segmented document translation and its cache."""
+
+    async def test_segments_are_reassembled_with_formatting(self, nllb):
+        response = await nllb.translate(request("First line.\n\nSecond line."))
+        assert response.translated_text == "FIRST LINE.\n\nSECOND LINE."
+
+    async def test_preserve_formatting_is_part_of_the_document_cache_key(self, nllb):
+        text = "First line.\n\nSecond line."
+        flat = await nllb.translate(request(text, preserve_formatting=False))
+        formatted = await nllb.translate(request(text, preserve_formatting=True))
+
+        assert "\n" not in flat.translated_text
+        assert formatted.translated_text == "FIRST LINE.\n\nSECOND LINE."
+
+        again = await nllb.translate(request(text, preserve_formatting=False))
+        assert again.cached and again.translated_text == flat.translated_text
+
+    async def test_background_refresh_publishes_no_event(self, nllb, cache, monkeypatch):
+        monkeypatch.setattr(settings, "cache_soft_ttl_ratio", 0)
+        published = []
+
+        async def publish(*args):
+            published.append(args)
+
+        monkeypatch.setattr(
+            translation.event_publisher, "publish_translation_completed", publish
+        )
+        await nllb.translate(request("Hello"), user_id="u1")
+        stale = await nllb.translate(request("Hello"), user_id="u2")
+        await asyncio.gather(*cache._refresh_tasks.values())
+
+        assert stale.cached
+        assert cache.stats["refreshes"] == 1
+        assert [args[-1] for args in published] == ["u1"]
+
+
+    async def test_stale_segments_are_retranslated_in_the_background(self, nllb, cache, monkeypatch):
+        monkeypatch.setattr(settings, "cache_soft_ttl_ratio", 0)
+        batch = BatchTranslationRequest(
+            texts=["First line.\n\nSecond line."], source_lang="en", target_langs=["fr"]
+        )
+        await nllb.translate_batch(batch)
+
+        monkeypatch.setattr(
+            translation_engine, "pipeline",
+            lambda texts, **kwargs: [{"translation_text": f"[{text}]"} for text in texts]
+        )
+        stale = await nllb.translate_batch(batch)
+        await asyncio.gather(*cache._refresh_tasks.values())
+        refreshed = await nllb.translate_batch(batch)
+        await asyncio.gather(*cache._refresh_tasks.values())
+
+        assert stale.results[0].translated_text == "FIRST LINE.\n\nSECOND LINE."
+        assert refreshed.results[0].translated_text == "[First line.]\n\n[Second line.]"
+
+
+class TestSourceLanguage:
+    """Resolving source_lang="auto" with the language detector."""
+
+    def test_low_confidence_detection_falls_back(self, nllb):
+        # Not a word of any language; scores best (but weakly) as Vietnamese
+        assert nllb._resolve_source("xqzt", "auto") == (nllb.FALLBACK_SOURCE_LANG, None)
+
+    def test_confident_detection_is_used(self, nllb):
+        assert nllb._resolve_source("Hello, how are you?", "auto") == ("en", "en")
+
+    def test_every_supported_language_has_an_nllb_code(self, nllb):
+        codes = [language["code"] for language in nllb.get_supported_languages()["languages"]]
+        nllb_codes = [nllb._get_nllb_code(code) for code in codes]
+        assert "yor_Latn" in nllb_codes and "kin_Latn" in nllb_codes
+        with pytest.raises(ValueError):
+            nllb._get_nllb_code("xx")
+
+    async def test_explicit_source_skips_detection(self, nllb, monkeypatch):
+        def detect(text):
+            raise AssertionError("detector called for an explicit source language")
+
+        monkeypatch.setattr(translation.language_detector, "detect", detect)
+        await nllb.translate(request("Hello"))
+        response = await nllb.translate_batch(BatchTranslationRequest(
+            texts=["Hello", "Goodbye"], source_lang="en", target_langs=["fr"]
+        ))
+        assert [result.source_lang for result in response.results] == ["en", "en"]
+
+    async def test_auto_batch_routes_each_text_by_its_language(self, nllb):
+        response = await nllb.translate_batch(BatchTranslationRequest(
+            texts=["Hello, how are you?", "Bonjour, comment allez-vous ?", "Hello"],
+            source_lang="auto",
+            target_langs=["de"]
+        ))
+        assert [result.source_lang for result in response.results] == ["en", "fr", "en"]